@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/async_streams.py
+
+Streams files concurrently and measures the event loop latency for
+"AsyncEncapsulated" compared to one thread per synchronous streamer
+iterator. Run with "python -m benchmarks.async_streams".
+"""
+
+from os import path, urandom
+from tempfile import mkdtemp
+from threading import Thread
+from time import perf_counter
+import asyncio
+import shutil
+
+from pas_streamer import AsyncEncapsulated, File
+
+FILE_COUNT = 10
+"""
+Number of different files streamed
+"""
+FILE_SIZE = 4 * 1048576
+"""
+Size of each file streamed
+"""
+STREAM_COUNT = 1000
+"""
+Number of concurrent streams
+"""
+TICK_INTERVAL = 0.001
+"""
+Interval of the event loop latency probe
+"""
+
+def _new_streamer(file_path_name):
+    """
+Returns a "File" streamer for the given file.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = File()
+    if (not _return.open_url("file:///{0}".format(file_path_name))): raise RuntimeError("Failed to open benchmark file")
+    _return.io_chunk_size = 65536
+
+    return _return
+#
+
+async def _probe_latency(latencies, stop_event):
+    """
+Records how late the event loop wakes up a sleeping task.
+
+:since: v1.0.0
+    """
+
+    while (not stop_event.is_set()):
+        started = perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        latencies.append(perf_counter() - started - TICK_INTERVAL)
+    #
+#
+
+async def _stream_async(file_path_name):
+    """
+Streams the given file with "AsyncEncapsulated".
+
+:return: (int) Bytes streamed
+:since:  v1.0.0
+    """
+
+    _return = 0
+
+    streamer = File()
+    streamer.io_chunk_size = 65536
+
+    async_streamer = AsyncEncapsulated(streamer)
+    if (not await async_streamer.open_url("file:///{0}".format(file_path_name))): raise RuntimeError("Failed to open benchmark file")
+
+    async for data in async_streamer: _return += len(data)
+
+    return _return
+#
+
+async def _stream_threaded(file_path_name):
+    """
+Streams the given file by iterating the synchronous streamer in a
+dedicated thread.
+
+:return: (int) Bytes streamed
+:since:  v1.0.0
+    """
+
+    _return = 0
+
+    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue()
+
+    def _iterate():
+        for data in _new_streamer(file_path_name): loop.call_soon_threadsafe(queue.put_nowait, data)
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+    #
+
+    Thread(target = _iterate).start()
+
+    while (True):
+        data = await queue.get()
+        if (data is None): break
+
+        _return += len(data)
+    #
+
+    return _return
+#
+
+async def _run(file_path_names, stream_callback):
+    """
+Runs all streams concurrently while probing the event loop latency.
+
+:return: (tuple) Duration and sorted latencies
+:since:  v1.0.0
+    """
+
+    latencies = [ ]
+    stop_event = asyncio.Event()
+
+    probe_task = asyncio.ensure_future(_probe_latency(latencies, stop_event))
+    started = perf_counter()
+
+    sizes = await asyncio.gather(*[ stream_callback(file_path_names[i % FILE_COUNT]) for i in range(STREAM_COUNT) ])
+
+    duration = perf_counter() - started
+    stop_event.set()
+    await probe_task
+
+    if (sum(sizes) != STREAM_COUNT * FILE_SIZE): raise RuntimeError("Streamed size mismatch")
+
+    latencies.sort()
+    return ( duration, latencies )
+#
+
+def main():
+    """
+Runs the benchmark and prints the results.
+
+:since: v1.0.0
+    """
+
+    directory_path_name = mkdtemp()
+
+    try:
+        file_path_names = [ ]
+
+        for i in range(FILE_COUNT):
+            file_path_name = path.join(directory_path_name, "payload{0:d}.bin".format(i))
+            with open(file_path_name, "wb") as file_object: file_object.write(urandom(FILE_SIZE))
+
+            file_path_names.append(file_path_name)
+        #
+
+        loop = asyncio.get_event_loop()
+
+        for name, stream_callback in ( ( "AsyncEncapsulated", _stream_async ), ( "thread per iterator", _stream_threaded ) ):
+            duration, latencies = loop.run_until_complete(_run(file_path_names, stream_callback))
+
+            print("{0:<20} {1:8.1f} MB/s  loop latency p50 {2:7.2f} ms  p99 {3:7.2f} ms  max {4:7.2f} ms".format(name,
+                                                                                                              (STREAM_COUNT * FILE_SIZE / 1048576) / duration,
+                                                                                                              1000 * latencies[len(latencies) // 2],
+                                                                                                              1000 * latencies[int(len(latencies) * 0.99)],
+                                                                                                              1000 * latencies[-1]
+                                                                                                             ))
+        #
+    finally: shutil.rmtree(directory_path_name)
+#
+
+if (__name__ == "__main__"): main()
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+benchmarks/dpt_vfs/memory/object.py
+
+In-memory VFS stand-in for "memory:///<name>" URLs used by benchmarks to run
+without any file system or network access. It is found by the "dpt_vfs"
+class loader as long as the repository root is in "sys.path".
+"""
+
+from io import BytesIO
+from time import time
+
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.not_implemented_exception import NotImplementedException
+from dpt_vfs import Abstract, FileLikeWrapperMixin
+
+class Object(FileLikeWrapperMixin, Abstract):
+    """
+Provides a read-only VFS implementation for payloads registered in memory.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _FILE_WRAPPED_METHODS = ( "read",
+                              "readinto",
+                              "seek",
+                              "tell"
+                            )
+    """
+File IO methods implemented by an wrapped resource.
+    """
+
+    _payloads = { }
+    """
+Registered payloads by name
+    """
+    _time_updated = time()
+    """
+UNIX timestamp reported for all payloads
+    """
+
+    __slots__ = [ "_name" ] + FileLikeWrapperMixin._mixin_slots_
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Object)
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self)
+        FileLikeWrapperMixin.__init__(self)
+
+        self._name = None
+        """
+Name of the payload opened
+        """
+
+        self.supported_features['implementing_instance'] = False
+        self.supported_features['seek'] = True
+    #
+
+    @property
+    def implementing_scheme(self):
+        """
+Returns the implementing scheme name.
+
+:return: (str) Implementing scheme name
+:since:  v1.0.0
+        """
+
+        return "memory"
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        if (self._wrapped_resource is None): raise IOException("VFS object not opened")
+        return (self._wrapped_resource.tell() >= len(self._wrapped_resource.getbuffer()))
+    #
+
+    @property
+    def is_valid(self):
+        """
+Returns true if the object is available.
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        return (self._wrapped_resource is not None)
+    #
+
+    @property
+    def name(self):
+        """
+Returns the name of this VFS object.
+
+:return: (str) VFS object name
+:since:  v1.0.0
+        """
+
+        if (self._name is None): raise IOException("VFS object not opened")
+        return self._name
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        if (self._wrapped_resource is None): raise IOException("VFS object not opened")
+        return len(self._wrapped_resource.getbuffer())
+    #
+
+    @property
+    def time_created(self):
+        """
+Returns the UNIX timestamp this object was created.
+
+:return: (int) UNIX timestamp this object was created
+:since:  v1.0.0
+        """
+
+        return Object._time_updated
+    #
+
+    @property
+    def time_updated(self):
+        """
+Returns the UNIX timestamp this object was updated.
+
+:return: (int) UNIX timestamp this object was updated
+:since:  v1.0.0
+        """
+
+        return Object._time_updated
+    #
+
+    @property
+    def type(self):
+        """
+Returns the type of this object.
+
+:return: (int) Object type
+:since:  v1.0.0
+        """
+
+        return Object.TYPE_FILE
+    #
+
+    @property
+    def url(self):
+        """
+Returns the URL of this VFS object.
+
+:return: (str) VFS URL
+:since:  v1.0.0
+        """
+
+        return "memory:///{0}".format(self.name)
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        try: FileLikeWrapperMixin.close(self)
+        finally: self._name = None
+    #
+
+    def new(self, _type, vfs_url):
+        """
+Creates a new VFS object.
+
+:param _type: VFS object type
+:param vfs_url: VFS URL
+
+:since: v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    def open(self, vfs_url, readonly = False):
+        """
+Opens a VFS object. The handle is set at the beginning of the object.
+Unknown payload names result in an invalid object.
+
+:param vfs_url: VFS URL
+:param readonly: Open object in readonly mode
+
+:since: v1.0.0
+        """
+
+        if (self._name is not None): raise IOException("Can't create new VFS object on already opened instance")
+
+        self._name = Abstract._get_id_from_vfs_url(vfs_url)
+        payload = Object._payloads.get(self._name)
+
+        if (payload is not None): self._set_wrapped_resource(BytesIO(payload))
+    #
+
+    @staticmethod
+    def register(name, payload):
+        """
+Registers a payload to be available as "memory:///<name>".
+
+:param name: Payload name
+:param payload: Payload data
+
+:since: v1.0.0
+        """
+
+        Object._payloads[name] = payload
+    #
+
+    @staticmethod
+    def unregister(name):
+        """
+Removes a registered payload.
+
+:param name: Payload name
+
+:since: v1.0.0
+        """
+
+        Object._payloads.pop(name, None)
+    #
+#
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+benchmarks/import_time.py
+
+Measures the cost paid by short-lived processes: the time to import
+"pas_streamer" (and selected classes) in a fresh interpreter as well as the
+constructor cost of common streamers. Run with
+"python -m benchmarks.import_time".
+"""
+
+from time import perf_counter
+import subprocess
+import sys
+
+from pas_streamer import File, FileLike, Memory
+
+CONSTRUCTOR_CALLS = 20000
+"""
+Number of instances created per streamer class
+"""
+IMPORT_STATEMENTS = ( "import pas_streamer",
+                      "from pas_streamer import FileLike",
+                      "from pas_streamer import File",
+                      "from pas_streamer import *"
+                    )
+"""
+Import statements measured
+"""
+ROUNDS = 5
+"""
+Number of interpreters started per import statement
+"""
+
+_IMPORT_SCRIPT = """
+from time import perf_counter
+import sys
+
+started = perf_counter()
+{0}
+duration = perf_counter() - started
+
+print(duration, len(sys.modules), ",".join(sorted(module for module in ( "asyncio", "brotli", "concurrent.futures", "dpt_settings", "dpt_vfs", "mmap" ) if module in sys.modules)))
+"""
+"""
+Script run in a fresh interpreter to measure an import statement
+"""
+
+def _measure_constructor(streamer_class):
+    """
+Measures the time to create and close a streamer instance.
+
+:return: (float) Duration in microseconds per instance
+:since:  v1.0.0
+    """
+
+    started = perf_counter()
+
+    for _ in range(CONSTRUCTOR_CALLS): streamer_class().close()
+
+    return 1000000 * (perf_counter() - started) / CONSTRUCTOR_CALLS
+#
+
+def _measure_import(statement):
+    """
+Measures the given import statement in fresh interpreters.
+
+:return: (tuple) Minimum duration in milliseconds, number of modules loaded
+         and selected heavy modules loaded
+:since:  v1.0.0
+    """
+
+    durations = [ ]
+    output = None
+
+    for _ in range(ROUNDS):
+        output = subprocess.check_output([ sys.executable, "-c", _IMPORT_SCRIPT.format(statement) ], universal_newlines = True).split()
+        durations.append(float(output[0]))
+    #
+
+    return (1000 * min(durations), int(output[1]), (output[2] if (len(output) > 2) else "-"))
+#
+
+def main():
+    """
+Runs the benchmark and prints the results.
+
+:since: v1.0.0
+    """
+
+    for statement in IMPORT_STATEMENTS:
+        duration, modules, heavy_modules = _measure_import(statement)
+        print("{0:<35} {1:8.1f} ms {2:5d} modules  {3}".format(statement, duration, modules, heavy_modules))
+    #
+
+    for streamer_class in ( FileLike, File, Memory ):
+        print("{0:<35} {1:8.2f} us per instance".format(streamer_class.__name__ + "()", _measure_constructor(streamer_class)))
+    #
+#
+
+if (__name__ == "__main__"): main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/parallel_gzip.py
+
+Measures the throughput of "GzipCompressor" with an increasing number of
+parallel workers up to the number of CPU cores available. Run with
+"python -m benchmarks.parallel_gzip".
+"""
+
+from os import cpu_count, urandom
+from time import perf_counter
+import zlib
+
+from pas_streamer import GzipCompressor
+
+CHUNK_SIZE = 65536
+"""
+Size of the chunks given to "compress()"
+"""
+PAYLOAD_SIZE = 64 * 1048576
+"""
+Size of the payload compressed in each run
+"""
+ROUNDS = 3
+"""
+Number of runs per worker count
+"""
+
+def _compress(payload, workers):
+    """
+Compresses the payload with the given number of workers.
+
+:return: (bytes) Gzip compressed data
+:since:  v1.0.0
+    """
+
+    compressor = GzipCompressor(6, workers)
+    compressed_data = [ ]
+
+    with memoryview(payload) as view:
+        for offset in range(0, len(payload), CHUNK_SIZE):
+            compressed_data.append(compressor.compress(view[offset:offset + CHUNK_SIZE]))
+        #
+    #
+
+    compressed_data.append(compressor.flush())
+
+    return b"".join(compressed_data)
+#
+
+def _get_payload():
+    """
+Returns a partly compressible payload.
+
+:return: (bytes) Payload
+:since:  v1.0.0
+    """
+
+    text = b"direct PAS streamer " * 307
+
+    return b"".join(urandom(2046) + text for _ in range(PAYLOAD_SIZE // 8186 + 1))[:PAYLOAD_SIZE]
+#
+
+def main():
+    """
+Runs the benchmark and prints the results.
+
+:since: v1.0.0
+    """
+
+    payload = _get_payload()
+    cores = (cpu_count() or 1)
+
+    workers_list = [ 1 ]
+    while (workers_list[-1] * 2 <= cores): workers_list.append(workers_list[-1] * 2)
+    if (workers_list[-1] != cores): workers_list.append(cores)
+
+    baseline = None
+
+    for workers in workers_list:
+        duration = None
+
+        for _ in range(ROUNDS):
+            started = perf_counter()
+            compressed_data = _compress(payload, workers)
+            run_duration = perf_counter() - started
+
+            if (duration is None or run_duration < duration): duration = run_duration
+        #
+
+        if (zlib.decompress(compressed_data, 16 + zlib.MAX_WBITS) != payload): raise RuntimeError("Compressed data is invalid")
+        if (baseline is None): baseline = duration
+
+        print("{0:>3d} workers  {1:8.1f} MiB/s  speedup {2:5.2f}x  ratio {3:6.2%}".format(workers,
+                                                                                            PAYLOAD_SIZE / duration / 1048576,
+                                                                                            baseline / duration,
+                                                                                            len(compressed_data) / PAYLOAD_SIZE
+                                                                                           )
+             )
+    #
+#
+
+if (__name__ == "__main__"): main()
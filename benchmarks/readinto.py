@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/readinto.py
+
+Compares the "bytes" returning "read()" path with "readinto()" filling a
+reusable buffer. Run with "python -m benchmarks.readinto".
+"""
+
+from io import BytesIO
+from os import path, urandom
+from tempfile import mkdtemp
+from time import perf_counter
+import shutil
+import tracemalloc
+
+from pas_streamer import File, FileLike
+
+PAYLOAD_SIZE = 64 * 1048576
+"""
+Size of the payload streamed in each run
+"""
+ROUNDS = 5
+"""
+Number of runs per path
+"""
+
+def _new_file_like_streamer(payload, chunk_size):
+    """
+Returns a "FileLike" streamer for the given payload.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = FileLike()
+    _return.file = BytesIO(payload)
+    _return.size = len(payload)
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_file_streamer(file_path_name, chunk_size):
+    """
+Returns a "File" streamer for the given file.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = File()
+    if (not _return.open_url("file:///{0}".format(file_path_name))): raise RuntimeError("Failed to open benchmark file")
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _run_read(streamer, chunk_size):
+    """
+Streams all data with "read()".
+
+:return: (int) Bytes read
+:since:  v1.0.0
+    """
+
+    _return = 0
+
+    while (True):
+        data = streamer.read(chunk_size)
+        if (not data): break
+
+        _return += len(data)
+    #
+
+    return _return
+#
+
+def _run_readinto(streamer, chunk_size):
+    """
+Streams all data with "readinto()" and a reused buffer.
+
+:return: (int) Bytes read
+:since:  v1.0.0
+    """
+
+    _return = 0
+    buffer = bytearray(chunk_size)
+
+    while (True):
+        size = streamer.readinto(buffer)
+        if (size < 1): break
+
+        _return += size
+    #
+
+    return _return
+#
+
+def _measure(streamer_factory, runner, chunk_size):
+    """
+Measures throughput and peak memory allocated for the given path.
+
+:return: (tuple) MB/s and peak allocated bytes
+:since:  v1.0.0
+    """
+
+    durations = [ ]
+    peak = 0
+
+    for _ in range(ROUNDS):
+        streamer = streamer_factory()
+
+        tracemalloc.start()
+        started = perf_counter()
+
+        size = runner(streamer, chunk_size)
+
+        durations.append(perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        streamer.close()
+        if (size != PAYLOAD_SIZE): raise RuntimeError("Streamed size mismatch")
+    #
+
+    return ((PAYLOAD_SIZE / 1048576) / min(durations), peak)
+#
+
+def main():
+    """
+Runs the benchmark and prints the results.
+
+:since: v1.0.0
+    """
+
+    payload = urandom(PAYLOAD_SIZE)
+    directory_path_name = mkdtemp()
+
+    try:
+        file_path_name = path.join(directory_path_name, "payload.bin")
+        with open(file_path_name, "wb") as file_object: file_object.write(payload)
+
+        for chunk_size in ( 65536, 524288 ):
+            for name, factory in ( ( "FileLike", lambda: _new_file_like_streamer(payload, chunk_size) ),
+                                   ( "File", lambda: _new_file_streamer(file_path_name, chunk_size) )
+                                 ):
+                for runner_name, runner in ( ( "read", _run_read ), ( "readinto", _run_readinto ) ):
+                    throughput, peak = _measure(factory, runner, chunk_size)
+                    print("{0:<8} {1:>7d} {2:<8} {3:10.1f} MB/s {4:10d} bytes peak allocated".format(name, chunk_size, runner_name, throughput, peak))
+                #
+            #
+        #
+    finally: shutil.rmtree(directory_path_name)
+#
+
+if (__name__ == "__main__"): main()
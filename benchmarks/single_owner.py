@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+benchmarks/single_owner.py
+
+Measures the per-chunk overhead of thread-safe streamers compared to the
+single owner mode for small chunk sizes. Run with
+"python -m benchmarks.single_owner".
+"""
+
+from io import BytesIO
+from os import path
+from tempfile import mkdtemp
+from time import perf_counter
+import shutil
+
+from pas_streamer import File, FileLike
+
+PAYLOAD_SIZE = 4 * 1048576
+"""
+Size of the payload streamed in each run
+"""
+ROUNDS = 3
+"""
+Number of runs per mode
+"""
+
+def _iterate(streamer):
+    """
+Iterates over all chunks of the given streamer.
+
+:return: (int) Number of chunks
+:since:  v1.0.0
+    """
+
+    _return = 0
+    for _ in streamer: _return += 1
+
+    return _return
+#
+
+def _new_file_like_streamer(payload, chunk_size, single_owner):
+    """
+Returns a "FileLike" streamer for the given payload.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = FileLike(single_owner = single_owner)
+    _return.file = BytesIO(payload)
+    _return.size = len(payload)
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_file_streamer(file_path_name, chunk_size, single_owner):
+    """
+Returns a "File" streamer for the given file.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = File(single_owner = single_owner)
+    if (not _return.open_url("file:///{0}".format(file_path_name))): raise RuntimeError("Failed to open benchmark file")
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def main():
+    """
+Runs the benchmark and prints the results.
+
+:since: v1.0.0
+    """
+
+    payload = b"x" * PAYLOAD_SIZE
+    directory_path_name = mkdtemp()
+
+    try:
+        file_path_name = path.join(directory_path_name, "payload.bin")
+        with open(file_path_name, "wb") as file_object: file_object.write(payload)
+
+        for chunk_size in ( 64, 512, 4096 ):
+            for name, factory in ( ( "FileLike", lambda single_owner: _new_file_like_streamer(payload, chunk_size, single_owner) ),
+                                   ( "File", lambda single_owner: _new_file_streamer(file_path_name, chunk_size, single_owner) )
+                                 ):
+                results = [ ]
+
+                for single_owner in ( False, True ):
+                    duration = None
+
+                    for _ in range(ROUNDS):
+                        streamer = factory(single_owner)
+
+                        started = perf_counter()
+                        chunks = _iterate(streamer)
+                        run_duration = perf_counter() - started
+
+                        if (duration is None or run_duration < duration): duration = run_duration
+                    #
+
+                    results.append(1000000000 * duration / chunks)
+                #
+
+                print("{0:<8} {1:>5d} bytes  thread-safe {2:8.0f} ns/chunk  single owner {3:8.0f} ns/chunk".format(name, chunk_size, results[0], results[1]))
+            #
+        #
+    finally: shutil.rmtree(directory_path_name)
+#
+
+if (__name__ == "__main__"): main()
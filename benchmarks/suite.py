@@ -0,0 +1,538 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+benchmarks/suite.py
+
+Reproducible benchmark suite for all streamers and codecs. Each case runs
+across a matrix of chunk sizes and payload types (text, random and already
+compressed data) and reports throughput, peak memory allocated and read
+latency percentiles as JSON. Resources are served from memory (including
+the "memory" VFS stand-in in "benchmarks/dpt_vfs") so it runs offline.
+
+Run with "python -m benchmarks.suite [--output results.json]" and compare
+with the results of an earlier release by adding
+"--compare baseline.json". The exit code is 1 if a regression has been
+detected.
+"""
+
+from argparse import ArgumentParser
+from base64 import encodebytes
+from binascii import b2a_qp
+from io import BytesIO
+from random import Random
+from tempfile import mkstemp
+from threading import Thread
+from time import perf_counter, strftime
+import gzip
+import json
+import os
+import platform
+import sys
+import tracemalloc
+import zlib
+
+from dpt_runtime.io_exception import IOException
+from dpt_vfs import Implementation
+
+from pas_streamer import Base64Decoder, BrotliCompressor, CompressingStreamer, DecompressingStreamer, File, FileLike
+from pas_streamer import GzipCompressor, Memory, QuotedPrintableDecoder, VfsBased
+
+from .dpt_vfs.memory.object import Object as MemoryVfsObject
+
+try: import brotli
+except ImportError: brotli = None
+
+CHUNK_SIZES = ( 4096, 65536, 1048576 )
+"""
+Chunk sizes requested per read call
+"""
+PAYLOAD_SIZE = 8 * 1048576
+"""
+Default size of the payload streamed in each run
+"""
+PAYLOAD_TYPES = ( "text", "random", "compressed" )
+"""
+Payload types generated
+"""
+REGRESSION_THRESHOLD = 0.1
+"""
+Relative throughput decrease reported as a regression
+"""
+RESULTS_FORMAT_VERSION = 1
+"""
+Version of the JSON results format
+"""
+ROUNDS = 3
+"""
+Default number of timed runs per case
+"""
+SEED = 20180501
+"""
+Seed for generating reproducible payloads
+"""
+_TEMPORARY_FILES = [ ]
+"""
+Temporary files to be removed after running the suite
+"""
+TEXT_WORDS = ( b"direct", b"PAS", b"streamer", b"Python", b"Application", b"Services", b"read", b"chunk",
+               b"gzip", b"brotli", b"base64", b"quoted-printable", b"file", b"memory", b"pipe", b"latency",
+               b"throughput", b"the", b"a", b"of", b"and", b"to", b"in", b"is", b"for", b"with"
+             )
+"""
+Words used for text payloads
+"""
+
+def _get_cases():
+    """
+Returns all benchmark cases as a list of tuples containing the name, a
+function to prepare the input for a payload and a function returning the
+streamer for the prepared input and chunk size.
+
+:return: (list) Benchmark cases
+:since:  v1.0.0
+    """
+
+    _return = [ ( "File", _prepare_file, _new_file_streamer ),
+                ( "VfsBased(memory)", _prepare_memory_vfs, _new_vfs_based_streamer ),
+                ( "FileLike(BytesIO)", None, _new_file_like_streamer ),
+                ( "FileLike(pipe)", None, _new_pipe_streamer ),
+                ( "Memory", None, _new_memory_streamer ),
+                ( "Base64Decoder", encodebytes, lambda data, chunk_size: Base64Decoder(_new_file_like_streamer(data, chunk_size)) ),
+                ( "QuotedPrintableDecoder", b2a_qp, lambda data, chunk_size: QuotedPrintableDecoder(_new_file_like_streamer(data, chunk_size)) )
+              ]
+
+    for level in ( 1, 6, 9 ):
+        _return.append(( "GzipCompressor(level={0:d})".format(level),
+                         None,
+                         lambda data, chunk_size, level = level: CompressingStreamer(_new_file_like_streamer(data, chunk_size), GzipCompressor(level))
+                       ))
+    #
+
+    _return.append(( "DecompressingStreamer(gzip)",
+                     lambda payload: gzip.compress(payload, 6),
+                     lambda data, chunk_size: DecompressingStreamer(_new_file_like_streamer(data, chunk_size), "gzip")
+                   ))
+
+    if (brotli is not None):
+        for quality in ( 1, 5 ):
+            _return.append(( "BrotliCompressor(quality={0:d})".format(quality),
+                             None,
+                             lambda data, chunk_size, quality = quality: CompressingStreamer(_new_file_like_streamer(data, chunk_size), BrotliCompressor(quality))
+                           ))
+        #
+
+        _return.append(( "BrotliDecompressor",
+                         lambda payload: brotli.compress(payload, quality = 5),
+                         lambda data, chunk_size: DecompressingStreamer(_new_file_like_streamer(data, chunk_size), "br")
+                       ))
+    #
+
+    return _return
+#
+
+def _get_payload(payload_type, size):
+    """
+Returns a reproducible payload of the given type and size.
+
+:return: (bytes) Payload
+:since:  v1.0.0
+    """
+
+    random = Random("{0:d}-{1}".format(SEED, payload_type))
+
+    if (payload_type == "random"): _return = random.getrandbits(8 * size).to_bytes(size, "little")
+    elif (payload_type == "compressed"):
+        blocks = [ ]
+        blocks_size = 0
+
+        while (blocks_size < size):
+            block = zlib.compress(_get_text(random, 1048576), 6)
+
+            blocks.append(block)
+            blocks_size += len(block)
+        #
+
+        _return = b"".join(blocks)[:size]
+    else: _return = _get_text(random, size)
+
+    return _return
+#
+
+def _get_percentile(sorted_values, percentile):
+    """
+Returns the nearest-rank percentile of the given sorted values.
+
+:return: (float) Percentile value
+:since:  v1.0.0
+    """
+
+    index = max(0, min(len(sorted_values) - 1, int(round(percentile / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+#
+
+def _get_text(random, size):
+    """
+Returns text lines of the given size built from random words.
+
+:return: (bytes) Text
+:since:  v1.0.0
+    """
+
+    lines = [ ]
+    lines_size = 0
+
+    while (lines_size < size):
+        line = b" ".join(random.choice(TEXT_WORDS) for _ in range(random.randint(4, 14)))
+
+        lines.append(line)
+        lines_size += 1 + len(line)
+    #
+
+    return b"\n".join(lines)[:size]
+#
+
+def _init_memory_vfs():
+    """
+Ensures that the "memory" VFS stand-in is resolved by the "dpt_vfs" class
+loader.
+
+:since: v1.0.0
+    """
+
+    try: Implementation.get_class("memory")
+    except IOException:
+        # The class loader caches the first module found. Lookups continue in
+        # later base directories shadowing the result of the first one.
+        Implementation.get_class("memory")
+    #
+#
+
+def _measure(streamer_factory, data, chunk_size, rounds):
+    """
+Measures the given streamer for one chunk size.
+
+:return: (dict) Measured values
+:since:  v1.0.0
+    """
+
+    durations = [ ]
+    latencies = [ ]
+    size = 0
+
+    for _ in range(rounds):
+        streamer = streamer_factory(data, chunk_size)
+        duration = 0
+        size = 0
+
+        while (True):
+            started = perf_counter()
+            chunk = streamer.read(chunk_size)
+            latency = perf_counter() - started
+
+            duration += latency
+            latencies.append(latency)
+
+            if (not chunk): break
+            size += len(chunk)
+        #
+
+        durations.append(duration)
+        streamer.close()
+    #
+
+    streamer = streamer_factory(data, chunk_size)
+
+    tracemalloc.start()
+
+    while (streamer.read(chunk_size)): pass
+    peak = tracemalloc.get_traced_memory()[1]
+
+    tracemalloc.stop()
+    streamer.close()
+
+    latencies.sort()
+
+    return { "bytes_out": size,
+             "duration_min_s": min(durations),
+             "reads": len(latencies) // rounds,
+             "latency_us": { "p50": 1000000 * _get_percentile(latencies, 50),
+                             "p90": 1000000 * _get_percentile(latencies, 90),
+                             "p99": 1000000 * _get_percentile(latencies, 99),
+                             "max": 1000000 * latencies[-1]
+                           },
+             "alloc_peak_bytes": peak
+           }
+#
+
+def _new_file_like_streamer(data, chunk_size):
+    """
+Returns a "FileLike" streamer for the given data.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = FileLike()
+    _return.file = BytesIO(data)
+    _return.size = len(data)
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_file_streamer(file_path_name, chunk_size):
+    """
+Returns a "File" streamer for the given file.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = File()
+    if (not _return.open_url("file:///{0}".format(file_path_name))): raise RuntimeError("Failed to open benchmark file")
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_memory_streamer(data, chunk_size):
+    """
+Returns a "Memory" streamer for the given data.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = Memory()
+    _return.data = data
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_pipe_streamer(data, chunk_size):
+    """
+Returns a "FileLike" streamer reading the given data from a pipe filled by
+a writer thread.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    ( read_fd, write_fd ) = os.pipe()
+
+    def _write():
+        with os.fdopen(write_fd, "wb") as file_object: file_object.write(data)
+    #
+
+    Thread(target = _write, daemon = True).start()
+
+    _return = FileLike()
+    _return.file = os.fdopen(read_fd, "rb", buffering = 0)
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _new_vfs_based_streamer(url, chunk_size):
+    """
+Returns a "VfsBased" streamer for the given VFS URL.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+    """
+
+    _return = VfsBased()
+    if (not _return.open_url(url)): raise RuntimeError("Failed to open benchmark VFS URL")
+    _return.io_chunk_size = chunk_size
+
+    return _return
+#
+
+def _prepare_file(payload):
+    """
+Writes the payload to a temporary file, preferably on a memory backed file
+system.
+
+:return: (str) File path and name
+:since:  v1.0.0
+    """
+
+    ( file_fd, _return ) = mkstemp(prefix = "pas_streamer_benchmark_",
+                                   dir = ("/dev/shm" if (os.path.isdir("/dev/shm")) else None)
+                                  )
+
+    with os.fdopen(file_fd, "wb") as file_object: file_object.write(payload)
+
+    _TEMPORARY_FILES.append(_return)
+    return _return
+#
+
+def _prepare_memory_vfs(payload):
+    """
+Registers the payload with the "memory" VFS stand-in.
+
+:return: (str) VFS URL
+:since:  v1.0.0
+    """
+
+    name = "payload-{0:d}".format(id(payload))
+    MemoryVfsObject.register(name, payload)
+
+    return "memory:///{0}".format(name)
+#
+
+def compare(results, baseline, threshold = REGRESSION_THRESHOLD):
+    """
+Compares results with the ones of a baseline.
+
+:param results: Results dictionary
+:param baseline: Baseline results dictionary
+:param threshold: Relative throughput decrease reported as a regression
+
+:return: (list) Descriptions of regressions detected
+:since:  v1.0.0
+    """
+
+    _return = [ ]
+
+    baseline_results = { ( result['case'], result['payload'], result['chunk_size'] ): result
+                         for result in baseline.get("results", [ ])
+                       }
+
+    for result in results['results']:
+        baseline_result = baseline_results.get(( result['case'], result['payload'], result['chunk_size'] ))
+
+        if (baseline_result is not None
+            and result['throughput_mb_s'] < (1 - threshold) * baseline_result['throughput_mb_s']
+           ):
+            _return.append("{0} {1} {2:d}: {3:.1f} MB/s < {4:.1f} MB/s".format(result['case'],
+                                                                                result['payload'],
+                                                                                result['chunk_size'],
+                                                                                result['throughput_mb_s'],
+                                                                                baseline_result['throughput_mb_s']
+                                                                               )
+                           )
+        #
+    #
+
+    return _return
+#
+
+def run(payload_size = PAYLOAD_SIZE, rounds = ROUNDS, chunk_sizes = CHUNK_SIZES, case_filter = None, log = None):
+    """
+Runs the benchmark suite.
+
+:param payload_size: Size of the payload streamed in each run
+:param rounds: Number of timed runs per case
+:param chunk_sizes: Chunk sizes requested per read call
+:param case_filter: Substring of case names to run; None for all
+:param log: Callable for progress lines
+
+:return: (dict) Results
+:since:  v1.0.0
+    """
+
+    _init_memory_vfs()
+
+    _return = { "format": RESULTS_FORMAT_VERSION,
+                "created": strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": "{0} {1}".format(platform.python_implementation(), platform.python_version()),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "payload_size": payload_size,
+                "rounds": rounds,
+                "seed": SEED,
+                "results": [ ]
+              }
+
+    try:
+        for payload_type in PAYLOAD_TYPES:
+            payload = _get_payload(payload_type, payload_size)
+
+            for ( name, prepare, streamer_factory ) in _get_cases():
+                if (case_filter is not None and case_filter not in name): continue
+
+                data = (payload if (prepare is None) else prepare(payload))
+
+                for chunk_size in chunk_sizes:
+                    result = _measure(streamer_factory, data, chunk_size, rounds)
+
+                    result.update({ "case": name,
+                                    "payload": payload_type,
+                                    "chunk_size": chunk_size,
+                                    "bytes_in": payload_size,
+                                    "throughput_mb_s": payload_size / result['duration_min_s'] / 1000000
+                                  })
+
+                    _return['results'].append(result)
+
+                    if (log is not None):
+                        log("{0:<30} {1:<10} {2:>8d} {3:10.1f} MB/s  p50 {4:9.1f} us  p99 {5:9.1f} us  {6:10d} bytes peak".format(name,
+                                                                                                                                payload_type,
+                                                                                                                                chunk_size,
+                                                                                                                                result['throughput_mb_s'],
+                                                                                                                                result['latency_us']['p50'],
+                                                                                                                                result['latency_us']['p99'],
+                                                                                                                                result['alloc_peak_bytes']
+                                                                                                                               ))
+                    #
+                #
+            #
+        #
+    finally:
+        while (len(_TEMPORARY_FILES) > 0): os.unlink(_TEMPORARY_FILES.pop())
+    #
+
+    return _return
+#
+
+def main():
+    """
+Runs the benchmark suite with the command line arguments given.
+
+:since: v1.0.0
+    """
+
+    parser = ArgumentParser(description = "Benchmarks all pas_streamer streamers and codecs")
+    parser.add_argument("--size", type = int, default = PAYLOAD_SIZE, help = "payload size in bytes")
+    parser.add_argument("--rounds", type = int, default = ROUNDS, help = "timed runs per case")
+    parser.add_argument("--chunk-size", type = int, action = "append", dest = "chunk_sizes", help = "chunk size (repeatable)")
+    parser.add_argument("--case", dest = "case_filter", help = "only run cases containing the given string")
+    parser.add_argument("--output", help = "file to write the JSON results to (default: stdout)")
+    parser.add_argument("--compare", help = "JSON results of a baseline to detect regressions")
+    parser.add_argument("--threshold", type = float, default = REGRESSION_THRESHOLD, help = "relative throughput decrease reported as a regression")
+    args = parser.parse_args()
+
+    results = run(args.size,
+                  args.rounds,
+                  (CHUNK_SIZES if (args.chunk_sizes is None) else args.chunk_sizes),
+                  args.case_filter,
+                  lambda line: print(line, file = sys.stderr)
+                 )
+
+    if (args.output is None): print(json.dumps(results, indent = 2, sort_keys = True))
+    else:
+        with open(args.output, "w") as file_object: json.dump(results, file_object, indent = 2, sort_keys = True)
+    #
+
+    if (args.compare is not None):
+        with open(args.compare) as file_object: regressions = compare(results, json.load(file_object), args.threshold)
+
+        for regression in regressions: print("Regression: {0}".format(regression), file = sys.stderr)
+        if (len(regressions) > 0): sys.exit(1)
+    #
+#
+
+if (__name__ == "__main__"): main()
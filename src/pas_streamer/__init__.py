@@ -17,21 +17,82 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from .abstract import Abstract
-from .abstract_encapsulated import AbstractEncapsulated
-from .base64_decoder import Base64Decoder
-from .file import File
-from .file_like import FileLike
-from .gzip_compressor import GzipCompressor
-from .quoted_printable_decoder import QuotedPrintableDecoder
-from .vfs_based import VfsBased
-
-try:
-    from .brotli_compressor import BrotliCompressor
-    from .brotli_decompressor import BrotliDecompressor
-except ImportError:
-    from dpt_runtime.not_implemented_class import NotImplementedClass
-
-    BrotliCompressor = NotImplementedClass
-    BrotliDecompressor = NotImplementedClass
+# Submodules are imported on first access to keep "import pas_streamer" cheap
+
+from importlib import import_module
+
+_CLASS_MODULES = { "Abstract": "abstract",
+                   "AbstractEncapsulated": "abstract_encapsulated",
+                   "AdaptiveIoChunkSize": "adaptive_io_chunk_size",
+                   "AsyncAbstract": "async_abstract",
+                   "AsyncEncapsulated": "async_encapsulated",
+                   "Base64Decoder": "base64_decoder",
+                   "BrotliCompressor": "brotli_compressor",
+                   "BrotliDecompressor": "brotli_decompressor",
+                   "CallbackMetrics": "callback_metrics",
+                   "CompressedCache": "compressed_cache",
+                   "CompressingStreamer": "compressing_streamer",
+                   "DecompressingStreamer": "decompressing_streamer",
+                   "File": "file",
+                   "FileDescriptorCache": "file_descriptor_cache",
+                   "FileLike": "file_like",
+                   "GzipCompressor": "gzip_compressor",
+                   "GzipDecompressor": "gzip_decompressor",
+                   "GzipIndex": "gzip_index",
+                   "Memory": "memory",
+                   "MemoryMappedFile": "memory_mapped_file",
+                   "Metrics": "metrics",
+                   "MetricsLock": "metrics_lock",
+                   "ParallelRangeReader": "parallel_range_reader",
+                   "PositionalFile": "positional_file",
+                   "QuotedPrintableDecoder": "quoted_printable_decoder",
+                   "ReadAheadBuffer": "read_ahead_buffer",
+                   "SingleOwnerLock": "single_owner_lock",
+                   "StreamerPool": "streamer_pool",
+                   "StreamerRegistry": "streamer_registry",
+                   "Tee": "tee",
+                   "TeeBranch": "tee_branch",
+                   "VfsBased": "vfs_based"
+                 }
+"""
+Modules of the classes provided by this package
+"""
+
+__all__ = sorted(_CLASS_MODULES.keys())
+
+def __dir__():
+    """
+python.org: Called when dir() is called on the module.
+
+:return: (list) Module attributes
+:since:  v1.0.0
+    """
+
+    return sorted(set(globals().keys()) | set(_CLASS_MODULES.keys()))
+#
+
+def __getattr__(name):
+    """
+python.org: Called when the default attribute access fails. Imports the
+module of the class requested.
+
+:param name: Attribute name
+
+:return: (object) Class requested
+:since:  v1.0.0
+    """
+
+    module_name = _CLASS_MODULES.get(name)
+    if (module_name is None): raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+
+    try: _return = getattr(import_module(".{0}".format(module_name), __name__), name)
+    except ImportError:
+        if (not name.startswith("Brotli")): raise
+
+        from dpt_runtime.not_implemented_class import NotImplementedClass
+        _return = NotImplementedClass
+    #
+
+    globals()[name] = _return
+    return _return
 #
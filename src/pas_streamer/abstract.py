@@ -17,12 +17,23 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from io import RawIOBase
+from select import select
+from socket import socket
+from time import perf_counter
+import os
+
 from dpt_module_loader import NamedClassLoader
+from dpt_runtime.io_exception import IOException
 from dpt_runtime.iterator import Iterator
 from dpt_runtime.not_implemented_exception import NotImplementedException
 from dpt_runtime.supports_mixin import SupportsMixin
+from dpt_settings import Settings
 from dpt_threading.thread_lock import ThreadLock
 
+from .metrics_lock import MetricsLock
+from .single_owner_lock import SingleOwnerLock
+
 class Abstract(Iterator, SupportsMixin):
     """
 The abstract streamer defines the to be implemented interface. A streamer
@@ -39,10 +50,27 @@ interface is similar to a file one.
 
     # pylint: disable=invalid-name, unused-argument
 
+    _is_log_handler_loaded = False
+    """
+True if the log handler has been looked up
+    """
+    _log_handler_instance = None
+    """
+Log handler shared by all streamers
+    """
+
     __slots__ = [ "__weakref__",
                   "_io_chunk_size",
+                  "_io_chunk_size_policy",
+                  "_is_single_owner",
                   "_lock",
-                  "_log_handler",
+                  "_metrics",
+                  "_metrics_first_byte_started",
+                  "_metrics_inner",
+                  "_metrics_outer",
+                  "_pool",
+                  "_pool_defaults",
+                  "_ranges",
                   "stream_size",
                   "timeout_retries"
                 ] + SupportsMixin._mixin_slots_
@@ -51,11 +79,13 @@ python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, timeout_retries = 5):
+    def __init__(self, timeout_retries = 5, single_owner = False):
         """
 Constructor __init__(Abstract)
 
 :param timeout_retries: Retries before timing out
+:param single_owner: True if the streamer is only ever used by a single
+                     thread and thread safety locking should be skipped
 
 :since: v1.0.0
         """
@@ -66,13 +96,47 @@ Constructor __init__(Abstract)
         """
 IO chunk size
         """
-        self._lock = ThreadLock()
+        self._io_chunk_size_policy = None
+        """
+Policy adjusting the IO chunk size based on observed reads
+        """
+        self._is_single_owner = single_owner
+        """
+True if the streamer is only ever used by a single thread
+        """
+        self._lock = (SingleOwnerLock() if (single_owner) else ThreadLock())
         """
 Thread safety lock
         """
-        self._log_handler = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+        self._metrics = None
         """
-Retries before timing out
+Metrics sink if instrumentation is enabled
+        """
+        self._metrics_first_byte_started = None
+        """
+Performance counter value instrumentation has been enabled at until the
+first byte has been returned
+        """
+        self._metrics_inner = None
+        """
+List of bytes and time in seconds read from the encapsulated layer since
+the last read call
+        """
+        self._metrics_outer = None
+        """
+"_metrics_inner" list of the encapsulating layer
+        """
+        self._pool = None
+        """
+Pool the streamer has been taken from; None if not in use
+        """
+        self._pool_defaults = None
+        """
+State after construction restored by a pool
+        """
+        self._ranges = None
+        """
+List of normalized "(range_start, range_end)" tuples to be streamed
         """
         self.stream_size = -1
         """
@@ -103,14 +167,17 @@ python.org: Return the next item from the container.
         """
 
         try:
-            with self._lock:
-                if (self.is_eof):
-                    self.close()
-                    raise StopIteration()
-                #
+            if (self._is_single_owner): data = self.read()
+            else:
+                with self._lock: data = (None if (self.is_eof) else self.read())
+            #
 
-                return self.read()
+            if (data is None):
+                self.close()
+                raise StopIteration()
             #
+
+            return data
         except StopIteration: raise
         except Exception as handled_exception:
             if (self._log_handler is not None): self._log_handler.debug(handled_exception, context = "pas_streamer")
@@ -143,6 +210,33 @@ Sets the IO chunk size to be used for reading.
         self._io_chunk_size = chunk_size
     #
 
+    @property
+    def io_chunk_size_policy(self):
+        """
+Returns the policy adjusting the IO chunk size if set.
+
+:return: (object) IO chunk size policy; None if not set
+:since:  v1.0.0
+        """
+
+        return self._io_chunk_size_policy
+    #
+
+    @io_chunk_size_policy.setter
+    def io_chunk_size_policy(self, policy):
+        """
+Sets the policy adjusting the IO chunk size based on observed reads.
+
+:param policy: IO chunk size policy (e.g. "AdaptiveIoChunkSize"); None to
+               use a fixed IO chunk size
+
+:since: v1.0.0
+        """
+
+        self._io_chunk_size_policy = policy
+        if (policy is not None): self._io_chunk_size = policy.chunk_size
+    #
+
     @property
     def is_eof(self):
         """
@@ -167,6 +261,65 @@ Returns true if the streamer resource is available.
         return False
     #
 
+    @property
+    def _log_handler(self):
+        """
+Returns the log handler if available. It is looked up once for all
+streamers.
+
+:return: (object) Log handler; None if not available
+:since:  v1.0.0
+        """
+
+        _return = Abstract._log_handler_instance
+
+        if (not Abstract._is_log_handler_loaded):
+            # Imports fail if streamers are closed while Python is shutting down
+            try:
+                _return = NamedClassLoader.get_singleton("dpt_logging.LogHandler", False)
+
+                Abstract._log_handler_instance = _return
+                Abstract._is_log_handler_loaded = True
+            except ImportError: pass
+        #
+
+        return _return
+    #
+
+    @property
+    def metrics(self):
+        """
+Returns the metrics sink if instrumentation is enabled.
+
+:return: (object) Metrics sink; None if disabled
+:since:  v1.0.0
+        """
+
+        return self._metrics
+    #
+
+    @metrics.setter
+    def metrics(self, metrics):
+        """
+Sets the metrics sink (e.g. "Metrics" or "CallbackMetrics") to enable
+instrumentation. It should be set before the streamer is used.
+
+:param metrics: Metrics sink; None to disable instrumentation
+
+:since: v1.0.0
+        """
+
+        if (isinstance(self._lock, MetricsLock)): self._lock = self._lock.lock
+
+        self._metrics = metrics
+        self._metrics_first_byte_started = (None if (metrics is None) else perf_counter())
+        self._metrics_inner = None
+
+        if (metrics is not None and (not self._is_single_owner)):
+            self._lock = MetricsLock(self._lock, metrics, self.__class__.__name__)
+        #
+    #
+
     @property
     def size(self):
         """
@@ -189,6 +342,93 @@ python.org: Flush and close this stream.
         raise NotImplementedException()
     #
 
+    def _copy_file_to_target(self, file_object, target, offset, count):
+        """
+Copies data of the given file object to the target if the kernel
+"sendfile()" implementation can not be used for it.
+
+:param file_object: File object of a regular file
+:param target: Socket, file-like object or file descriptor
+:param offset: Offset to start copying from
+:param count: Number of bytes to be copied
+
+:return: (int) Bytes copied
+:since:  v1.0.0
+        """
+
+        _return = 0
+        file_object.seek(offset)
+
+        while (_return < count):
+            data = file_object.read(min(count - _return, self.io_chunk_size))
+            if (data is None or len(data) < 1): break
+
+            self._write_to_target(target, data)
+            _return += len(data)
+        #
+
+        return _return
+    #
+
+    def _get_fileno(self, target):
+        """
+Returns the file descriptor of the given target.
+
+:param target: Socket, file-like object or file descriptor
+
+:return: (int) File descriptor; None if not available
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = None
+
+        if (isinstance(target, int)): _return = target
+        elif (hasattr(target, "fileno")):
+            try: _return = target.fileno()
+            except Exception: pass
+        #
+
+        return _return
+    #
+
+    def _get_range_data(self):
+        """
+Returns the data of the range set as a generator.
+
+:return: (object) Generator yielding data
+:since:  v1.0.0
+        """
+
+        while (True):
+            data = self.read()
+            if (data is None): break
+
+            yield data
+        #
+    #
+
+    def _get_size_to_read(self, n):
+        """
+Returns the number of bytes to be read next while respecting the requested
+stream size. The lock must be held while calling this method.
+
+:param n: How many bytes should be read (0 means until EOF)
+
+:return: (int) Bytes to read (0 means until EOF); -1 if the requested
+         stream size is exhausted
+:since:  v1.0.0
+        """
+
+        if (self.stream_size > 0):
+            if (n < 1 or n > self.stream_size): n = self.stream_size
+            self.stream_size -= n
+        elif (self.stream_size == 0): n = -1
+
+        return n
+    #
+
     def is_url_supported(self, url):
         """
 Returns true if the streamer is able to return data for the given URL.
@@ -202,6 +442,25 @@ Returns true if the streamer is able to return data for the given URL.
         return False
     #
 
+    def iter_ranges(self):
+        """
+Returns the ranges defined with "set_ranges()" as a generator. Each range
+is yielded as a tuple of its first byte, last byte and a generator
+yielding its data. The data of a range should be consumed before
+advancing to the next one.
+
+:return: (object) Generator yielding "(range_start, range_end, data)"
+:since:  v1.0.0
+        """
+
+        if (self._ranges is None): raise IOException("No ranges have been defined")
+
+        for range_start, range_end in self._ranges:
+            if (not self.set_range(range_start, range_end)): raise IOException("Failed to set the range to be streamed")
+            yield ( range_start, range_end, self._get_range_data() )
+        #
+    #
+
     def open_url(self, url):
         """
 Opens a streamer session for the given URL.
@@ -229,6 +488,84 @@ python.org: Read up to n bytes from the object and return them.
         raise NotImplementedException()
     #
 
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        _return = 0
+        data = self.read(len(b))
+
+        if (data is not None):
+            _return = len(data)
+            b[:_return] = data
+        #
+
+        return _return
+    #
+
+    def read_into_view(self, buffer):
+        """
+Reads data into the given, caller-owned buffer and returns a memoryview of
+the part filled.
+
+:param buffer: Pre-allocated, writable bytes-like object
+
+:return: (memoryview) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        size = self.readinto(buffer)
+        return (memoryview(buffer)[:size] if (size > 0) else None)
+    #
+
+    def _record_metrics_read(self, data, read_started):
+        """
+Records a read call with the metrics sink set.
+
+:param data: Data returned or the number of bytes read into a buffer
+:param read_started: Performance counter value the read call started at
+
+:since: v1.0.0
+        """
+
+        duration = perf_counter() - read_started
+        layer = self.__class__.__name__
+
+        if (data is None): size = 0
+        elif (isinstance(data, int)): size = data
+        else: size = len(data)
+
+        if (self._metrics_inner is None): self._metrics.add_read(layer, size, size, duration, duration)
+        else:
+            self._metrics.add_read(layer,
+                                   self._metrics_inner[0],
+                                   size,
+                                   duration,
+                                   max(0, duration - self._metrics_inner[1])
+                                  )
+
+            self._metrics_inner[0] = 0
+            self._metrics_inner[1] = 0
+        #
+
+        if (self._metrics_outer is not None):
+            self._metrics_outer[0] += size
+            self._metrics_outer[1] += duration
+        #
+
+        if (size > 0 and self._metrics_first_byte_started is not None):
+            self._metrics.add_first_byte(layer, perf_counter() - self._metrics_first_byte_started)
+            self._metrics_first_byte_started = None
+        #
+    #
+
     def seek(self, offset):
         """
 python.org: Change the stream position to the given byte offset.
@@ -242,6 +579,51 @@ python.org: Change the stream position to the given byte offset.
         return -1
     #
 
+    def _send_file(self, file_object, target, offset, count):
+        """
+Sends data of the given file object to the target using the kernel
+"sendfile()" implementation.
+
+:param file_object: File object of a regular file
+:param target: Socket, file-like object or file descriptor
+:param offset: Offset to start sending from
+:param count: Number of bytes to be sent
+
+:return: (int) Bytes sent
+:since:  v1.0.0
+        """
+
+        # "socket.sendfile()" does not support non-blocking sockets
+        is_socket_sendfile_supported = (hasattr(target, "sendfile")
+                                        and (not (type(target) is socket and target.gettimeout() == 0))
+                                       )
+
+        if (is_socket_sendfile_supported):
+            try: _return = target.sendfile(file_object, offset, count)
+            except ValueError: _return = self._copy_file_to_target(file_object, target, offset, count)
+        else:
+            _return = 0
+
+            fileno = file_object.fileno()
+            target_fileno = self._get_fileno(target)
+
+            while (_return < count):
+                try: sent = os.sendfile(target_fileno, fileno, offset + _return, min(count - _return, 1073741824))
+                except BlockingIOError:
+                    select([ ], [ target_fileno ], [ ])
+                    continue
+                #
+
+                if (sent < 1): break
+                _return += sent
+            #
+
+            file_object.seek(offset + _return)
+        #
+
+        return _return
+    #
+
     def set_range(self, range_start, range_end):
         """
 Define a range to be streamed.
@@ -253,8 +635,6 @@ Define a range to be streamed.
 :since:  v1.0.0
         """
 
-        # pylint: disable=redefined-variable-type
-
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.set_range({1:d}, {2:d})- (#echo(__LINE__)#)", self, range_start, range_end, context = "pas_streamer")
         _return = False
 
@@ -263,7 +643,7 @@ Define a range to be streamed.
                 position = self.tell()
 
                 if (position == range_start): _return = True
-                elif (self.is_supported("seeking")): _return = self.seek(range_start)
+                elif (self.is_supported("seeking")): _return = (self.seek(range_start) == range_start)
             #
 
             if (_return): self.stream_size = 1 + (range_end - range_start)
@@ -272,6 +652,53 @@ Define a range to be streamed.
         return _return
     #
 
+    def set_ranges(self, ranges):
+        """
+Define multiple ranges to be streamed with "iter_ranges()". Ranges are
+sorted and overlapping ones or ones separated by less than the
+"pas_streamer_range_coalescing_gap" setting are coalesced to be read with
+the fewest seeks. Ranges exceeding the known size are truncated.
+
+:param ranges: List of "(range_start, range_end)" tuples with the first and
+               last byte of each range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        gap = int(Settings.get("pas_streamer_range_coalescing_gap", 80))
+
+        try: size = self.size
+        except Exception: size = -1
+
+        normalized_ranges = [ ]
+        _return = (len(ranges) > 0)
+
+        for range_start, range_end in sorted(ranges):
+            if (range_start < 0 or range_start > range_end):
+                _return = False
+                break
+            #
+
+            if (size > -1):
+                if (range_start >= size): continue
+                if (range_end >= size): range_end = size - 1
+            #
+
+            if (len(normalized_ranges) > 0 and range_start <= 1 + normalized_ranges[-1][1] + gap):
+                if (range_end > normalized_ranges[-1][1]): normalized_ranges[-1] = ( normalized_ranges[-1][0], range_end )
+            else: normalized_ranges.append(( range_start, range_end ))
+        #
+
+        if (len(normalized_ranges) < 1): _return = False
+        if (_return and (len(normalized_ranges) > 1 or self.tell() != normalized_ranges[0][0])): _return = self.is_supported("seeking")
+
+        self._ranges = (normalized_ranges if (_return) else None)
+        return _return
+    #
+
     def tell(self):
         """
 python.org: Return the current stream position as an opaque number.
@@ -282,4 +709,59 @@ python.org: Return the current stream position as an opaque number.
 
         raise NotImplementedException()
     #
+
+    def transfer_to(self, target):
+        """
+Transfers the remaining data of the stream to the given target. Zero-copy
+implementations are used if "zero_copy_transfer" is supported.
+
+:param target: Socket, file-like object or file descriptor
+
+:return: (int) Bytes transferred
+:since:  v1.0.0
+        """
+
+        _return = 0
+        buffer = bytearray(self.io_chunk_size)
+
+        while (True):
+            size = self.readinto(buffer)
+            if (size < 1): break
+
+            self._write_to_target(target, memoryview(buffer)[:size])
+            _return += size
+        #
+
+        return _return
+    #
+
+    def _write_to_target(self, target, data):
+        """
+Writes all of the given data to the target. Partial writes are
+continued until all data has been written and non-blocking targets are
+waited for.
+
+:param target: Socket, file-like object or file descriptor
+:param data: Data to be written
+
+:since: v1.0.0
+        """
+
+        data = memoryview(data).cast("B")
+
+        while (len(data) > 0):
+            try:
+                if (hasattr(target, "send")): written = target.send(data)
+                elif (hasattr(target, "write")):
+                    written = target.write(data)
+
+                    # Only raw streams return None if the write would block
+                    if (written is None and (not isinstance(target, RawIOBase))): written = len(data)
+                else: written = os.write(target, data)
+            except BlockingIOError as handled_exception: written = getattr(handled_exception, "characters_written", 0)
+
+            if (written): data = data[written:]
+            else: select([ ], [ target ], [ ])
+        #
+    #
 #
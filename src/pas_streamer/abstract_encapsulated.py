@@ -17,6 +17,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from dpt_runtime.supports_mixin import SupportsMixin
 from dpt_runtime.value_exception import ValueException
 from dpt_vfs import FileLikeWrapperMixin
 
@@ -62,9 +63,11 @@ Constructor __init__(AbstractEncapsulated)
 :since: v1.0.0
         """
 
+        # pylint: disable=protected-access
+
         if (not isinstance(streamer, Abstract)): raise ValueException("Given streamer is not supported")
 
-        Abstract.__init__(self)
+        Abstract.__init__(self, single_owner = streamer._is_single_owner)
         FileLikeWrapperMixin.__init__(self)
 
         self._set_wrapped_resource(streamer)
@@ -143,6 +146,38 @@ Returns true if the streamer resource is available.
         return self._wrapped_resource.is_resource_valid
     #
 
+    @property
+    def metrics(self):
+        """
+Returns the metrics sink if instrumentation is enabled.
+
+:return: (object) Metrics sink; None if disabled
+:since:  v1.0.0
+        """
+
+        return self._metrics
+    #
+
+    @metrics.setter
+    def metrics(self, metrics):
+        """
+Sets the metrics sink for this and all encapsulated layers.
+
+:param metrics: Metrics sink; None to disable instrumentation
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        Abstract.metrics.fset(self, metrics)
+
+        if (metrics is not None): self._metrics_inner = [ 0, 0 ]
+
+        self._wrapped_resource.metrics = metrics
+        self._wrapped_resource._metrics_outer = self._metrics_inner
+    #
+
     @property
     def size(self):
         """
@@ -155,6 +190,32 @@ Returns the size in bytes.
         return self._wrapped_resource.size
     #
 
+    def _get_buffered_data(self, buffer, n):
+        """
+Removes up to n bytes from the front of the given buffer and returns them.
+
+:param buffer: Data buffer (bytearray)
+:param n: How many bytes to return (0 means all)
+
+:return: (bytes) Data; None if the buffer is empty
+:since:  v1.0.0
+        """
+
+        buffer_size = len(buffer)
+        if (n < 1 or n > buffer_size): n = buffer_size
+
+        if (n < 1): _return = None
+        elif (n == buffer_size):
+            _return = bytes(buffer)
+            del buffer[:]
+        else:
+            with memoryview(buffer) as view: _return = view[:n].tobytes()
+            del buffer[:n]
+        #
+
+        return _return
+    #
+
     def is_supported(self, feature):
         """
 Returns true if the feature requested is supported by this instance.
@@ -166,7 +227,7 @@ Returns true if the feature requested is supported by this instance.
         """
 
         _return = self._wrapped_resource.is_supported(feature)
-        if (not _return): _return = self.is_supported(feature)
+        if (not _return): _return = SupportsMixin.is_supported(self, feature)
 
         return _return
     #
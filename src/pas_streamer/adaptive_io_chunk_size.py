@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+from time import monotonic, perf_counter
+import os
+
+from dpt_settings import Settings
+
+class AdaptiveIoChunkSize(object):
+    """
+"AdaptiveIoChunkSize" is a policy tuning the IO chunk size of a streamer.
+The initial size is based on the resource size and VFS scheme. It grows
+while reads are fast and shrinks for slow reads, slow consumers or if
+available memory is low.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    LOCAL_SCHEMES = ( "file", )
+    """
+VFS schemes of local file systems
+    """
+
+    _memory_checked = 0
+    """
+Monotonic time the available memory has been checked last
+    """
+    _memory_low = False
+    """
+True if the available memory was low when checked last
+    """
+
+    __slots__ = [ "chunk_size",
+                  "chunk_size_max",
+                  "chunk_size_min",
+                  "_consumer_delay_max",
+                  "_fast_reads",
+                  "grows",
+                  "history",
+                  "_last_read_end",
+                  "_latency_max",
+                  "shrinks"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, chunk_size_min = None, chunk_size_max = None):
+        """
+Constructor __init__(AdaptiveIoChunkSize)
+
+:param chunk_size_min: Minimum IO chunk size
+:param chunk_size_max: Maximum IO chunk size
+
+:since: v1.0.0
+        """
+
+        self.chunk_size_max = (int(Settings.get("pas_streamer_io_chunk_size_max", 4194304)) if (chunk_size_max is None) else chunk_size_max)
+        """
+Maximum IO chunk size
+        """
+        self.chunk_size_min = (int(Settings.get("pas_streamer_io_chunk_size_min", 4096)) if (chunk_size_min is None) else chunk_size_min)
+        """
+Minimum IO chunk size
+        """
+        self.chunk_size = max(self.chunk_size_min, min(65536, self.chunk_size_max))
+        """
+Current IO chunk size
+        """
+        self._consumer_delay_max = float(Settings.get("pas_streamer_io_chunk_consumer_delay_max", 0.05))
+        """
+Time in seconds the consumer may take between reads before it is
+considered slow
+        """
+        self._fast_reads = 0
+        """
+Number of consecutive fast reads
+        """
+        self.grows = 0
+        """
+Number of times the IO chunk size has been increased
+        """
+        self.history = deque(maxlen = 64)
+        """
+IO chunk sizes chosen in chronological order
+        """
+        self._last_read_end = None
+        """
+Performance counter value of the end of the last read
+        """
+        self._latency_max = float(Settings.get("pas_streamer_io_chunk_latency_max", 0.01))
+        """
+Read latency in seconds above which the IO chunk size is decreased
+        """
+        self.shrinks = 0
+        """
+Number of times the IO chunk size has been decreased
+        """
+    #
+
+    def init(self, size = None, scheme = None):
+        """
+Initializes the IO chunk size for a resource of the given size and VFS
+scheme. Small resources are read at once, local ones with 512 KiB and
+remote ones with 1 MiB chunks doubled for resources of 1 GiB or more.
+
+:param size: Resource size if known
+:param scheme: VFS scheme if known
+
+:return: (int) IO chunk size
+:since:  v1.0.0
+        """
+
+        chunk_size = (524288 if (scheme is None or scheme in AdaptiveIoChunkSize.LOCAL_SCHEMES) else 1048576)
+
+        if (size is not None and size > -1):
+            if (size <= chunk_size): chunk_size = 4096 * (1 + size // 4096)
+            elif (size >= 1073741824): chunk_size *= 2
+        #
+
+        self.chunk_size = max(self.chunk_size_min, min(chunk_size, self.chunk_size_max))
+        self._fast_reads = 0
+        self._last_read_end = None
+
+        self.history.append(self.chunk_size)
+        return self.chunk_size
+    #
+
+    def record_read(self, n, size, duration):
+        """
+Records a read and adjusts the IO chunk size.
+
+:param n: Number of bytes requested
+:param size: Number of bytes read
+:param duration: Duration of the read in seconds
+
+:return: (int) IO chunk size
+:since:  v1.0.0
+        """
+
+        read_end = perf_counter()
+
+        consumer_delay = (0 if (self._last_read_end is None) else read_end - duration - self._last_read_end)
+        self._last_read_end = read_end
+
+        if (AdaptiveIoChunkSize._is_memory_low()
+            or consumer_delay > self._consumer_delay_max
+            or duration > self._latency_max
+           ):
+            self._fast_reads = 0
+            self._set_chunk_size(self.chunk_size // 2)
+        elif (size >= self.chunk_size and n >= self.chunk_size and 4 * duration < self._latency_max):
+            self._fast_reads += 1
+
+            if (self._fast_reads > 3):
+                self._fast_reads = 0
+                self._set_chunk_size(self.chunk_size * 2)
+            #
+        else: self._fast_reads = 0
+
+        return self.chunk_size
+    #
+
+    def _set_chunk_size(self, chunk_size):
+        """
+Sets the IO chunk size within the limits defined.
+
+:param chunk_size: IO chunk size
+
+:since: v1.0.0
+        """
+
+        chunk_size = max(self.chunk_size_min, min(chunk_size, self.chunk_size_max))
+
+        if (chunk_size != self.chunk_size):
+            if (chunk_size > self.chunk_size): self.grows += 1
+            else: self.shrinks += 1
+
+            self.chunk_size = chunk_size
+        #
+
+        if (len(self.history) < 1 or self.history[-1] != chunk_size): self.history.append(chunk_size)
+    #
+
+    @staticmethod
+    def _get_memory_available():
+        """
+Returns the memory available for new allocations including reclaimable
+page cache. "MemAvailable" of "/proc/meminfo" is used if supported as free
+memory excludes the page cache.
+
+:return: (int) Memory available in bytes
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (os.path.exists("/proc/meminfo")):
+            with open("/proc/meminfo", "rb") as file_object:
+                for line in file_object:
+                    if (line.startswith(b"MemAvailable:")):
+                        _return = 1024 * int(line.split()[1])
+                        break
+                    #
+                #
+            #
+        #
+
+        if (_return is None): _return = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+        return _return
+    #
+
+    @staticmethod
+    def _is_memory_low():
+        """
+Returns true if the available memory is below the
+"pas_streamer_io_chunk_memory_available_min" setting. The result is
+cached for a second.
+
+:return: (bool) True if low
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        now = monotonic()
+
+        if (now - AdaptiveIoChunkSize._memory_checked > 1):
+            AdaptiveIoChunkSize._memory_checked = now
+
+            try:
+                memory_available = AdaptiveIoChunkSize._get_memory_available()
+                AdaptiveIoChunkSize._memory_low = (memory_available < int(Settings.get("pas_streamer_io_chunk_memory_available_min", 268435456)))
+            except Exception: AdaptiveIoChunkSize._memory_low = False
+        #
+
+        return AdaptiveIoChunkSize._memory_low
+    #
+#
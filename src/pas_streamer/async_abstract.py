@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
+from dpt_runtime.not_implemented_exception import NotImplementedException
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+
+class AsyncAbstract(object):
+    """
+The abstract asynchronous streamer defines the asyncio counterpart of the
+streamer interface. Blocking calls are executed in a bounded executor
+shared by all asynchronous streamers.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    # pylint: disable=unused-argument
+
+    _executor = None
+    """
+Executor shared by all asynchronous streamers
+    """
+    _executor_lock = ThreadLock()
+    """
+Thread safety lock for the shared executor
+    """
+
+    __slots__ = [ "__weakref__" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __aiter__(self):
+        """
+python.org: Return an asynchronous iterator object.
+
+:return: (object) Asynchronous iterator object
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    async def __anext__(self):
+        """
+python.org: Return an awaitable resulting in the next value of the
+iterator.
+
+:return: (bytes) Response data
+:since:  v1.0.0
+        """
+
+        data = await self.read()
+
+        if (data is None):
+            await self.close()
+            raise StopAsyncIteration()
+        #
+
+        return data
+    #
+
+    async def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    async def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        raise NotImplementedException()
+    #
+
+    async def _run_in_executor(self, callback, *args):
+        """
+Runs the given blocking callback in the shared executor.
+
+:param callback: Blocking callback
+:param args: Positional arguments for the callback
+
+:return: (mixed) Callback result
+:since:  v1.0.0
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(AsyncAbstract.get_executor(),
+                                                              partial(callback, *args)
+                                                             )
+    #
+
+    async def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        return -1
+    #
+
+    @staticmethod
+    def get_executor():
+        """
+Returns the executor shared by all asynchronous streamers. Its concurrency
+is defined by the "pas_streamer_async_max_workers" setting.
+
+:return: (object) Executor instance
+:since:  v1.0.0
+        """
+
+        with AsyncAbstract._executor_lock:
+            if (AsyncAbstract._executor is None):
+                AsyncAbstract._executor = ThreadPoolExecutor(max_workers = int(Settings.get("pas_streamer_async_max_workers", 32)),
+                                                             thread_name_prefix = "pas_streamer"
+                                                            )
+            #
+
+            return AsyncAbstract._executor
+        #
+    #
+
+    @staticmethod
+    def set_executor(executor):
+        """
+Sets the executor shared by all asynchronous streamers.
+
+:param executor: Executor instance
+
+:since: v1.0.0
+        """
+
+        with AsyncAbstract._executor_lock: AsyncAbstract._executor = executor
+    #
+#
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.value_exception import ValueException
+
+from .abstract import Abstract
+from .async_abstract import AsyncAbstract
+
+class AsyncEncapsulated(AsyncAbstract):
+    """
+"AsyncEncapsulated" provides the asyncio streamer interface for a blocking
+streamer like "File", "FileLike", "Base64Decoder" or
+"QuotedPrintableDecoder". Each blocking call is run in the shared executor
+so that the event loop never blocks on a read.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_wrapped_resource" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, streamer):
+        """
+Constructor __init__(AsyncEncapsulated)
+
+:param streamer: Encapsulated streamer instance
+
+:since: v1.0.0
+        """
+
+        if (not isinstance(streamer, Abstract)): raise ValueException("Given streamer is not supported")
+
+        self._wrapped_resource = streamer
+        """
+Encapsulated blocking streamer
+        """
+    #
+
+    @property
+    def streamer(self):
+        """
+Returns the encapsulated blocking streamer.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+        """
+
+        return self._wrapped_resource
+    #
+
+    async def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        await self._run_in_executor(self._wrapped_resource.close)
+    #
+
+    async def open_url(self, url):
+        """
+Opens a streamer session for the given URL.
+
+:param url: URL to be streamed
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._wrapped_resource.open_url, url)
+    #
+
+    async def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._read, n)
+    #
+
+    def _read(self, n):
+        """
+Reads data from the encapsulated streamer. Errors of the streamer are
+raised instead of being reported as EOF.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF; None for the IO chunk size)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        _return = self._wrapped_resource.read(n)
+        if (_return is not None and len(_return) < 1): _return = None
+
+        return _return
+    #
+
+    async def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._wrapped_resource.readinto, b)
+    #
+
+    async def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._wrapped_resource.seek, offset)
+    #
+
+    async def set_range(self, range_start, range_end):
+        """
+Define a range to be streamed.
+
+:param range_start: First byte of range
+:param range_end: Last byte of range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._wrapped_resource.set_range, range_start, range_end)
+    #
+
+    async def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return await self._run_in_executor(self._wrapped_resource.tell)
+    #
+#
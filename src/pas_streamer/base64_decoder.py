@@ -17,8 +17,9 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from base64 import b64decode
+from binascii import a2b_base64
 from math import ceil
+from time import perf_counter
 
 from dpt_runtime.binary import Binary
 from dpt_runtime.io_exception import IOException
@@ -47,7 +48,12 @@ Decodes a base64 encoded, encapsulated streamer while being read.
 File IO methods implemented by an wrapped resource.
     """
 
-    __slots__ = [ "_decoded_data" ]
+    BINARY_WHITESPACE = Binary.bytes(" \t\r\n\x0b\x0c")
+    """
+Binary whitespace characters ignored in base64 encoded data.
+    """
+
+    __slots__ = [ "_decoded_data", "_encoded_data", "_is_raw_eof" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -64,14 +70,65 @@ Constructor __init__(Base64Decoder)
 
         AbstractEncapsulated.__init__(self, streamer)
 
-        self._decoded_data = None
+        self._decoded_data = bytearray()
         """
 Already decoded data buffer
         """
+        self._encoded_data = bytearray()
+        """
+Encoded data of an incomplete quartet carried over to the next read
+        """
+        self._is_raw_eof = False
+        """
+True if the encapsulated streamer reached EOF
+        """
 
         self.supported_features['raw_reader'] = True
     #
 
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (len(self._decoded_data) < 1
+                and len(self._encoded_data) < 1
+                and (self._is_raw_eof or self._wrapped_resource.is_eof)
+               )
+    #
+
+    def _decode(self, raw_data):
+        """
+Decodes all complete quartets of the given raw data and carries over the
+remaining bytes. The final, incomplete quartet is decoded at EOF.
+
+:param raw_data: Base64 encoded data; None if EOF
+
+:since: v1.0.0
+        """
+
+        if (raw_data is None):
+            self._is_raw_eof = True
+            encoded_size = len(self._encoded_data)
+
+            if (encoded_size % 4 > 0): self._encoded_data += Binary.bytes("=" * (4 - (encoded_size % 4)))
+        else:
+            if (type(raw_data) is not bytes): raw_data = bytes(raw_data)
+            self._encoded_data += raw_data.translate(None, Base64Decoder.BINARY_WHITESPACE)
+        #
+
+        encoded_size = len(self._encoded_data) & ~3
+
+        if (encoded_size > 0):
+            with memoryview(self._encoded_data) as view: self._decoded_data += a2b_base64(view[:encoded_size])
+            del self._encoded_data[:encoded_size]
+        #
+    #
+
     def raw_read(self, _bytes = None):
         """
 Reads from the current streamer session without decoding it transparently.
@@ -83,12 +140,13 @@ Reads from the current streamer session without decoding it transparently.
 :since:  v1.0.0
         """
 
-        return self._wrapped_resource.read(self, _bytes)
+        return self._wrapped_resource.read(_bytes)
     #
 
     def read(self, n = None):
         """
-python.org: Read up to n bytes from the object and return them.
+python.org: Read up to n bytes from the object and return them. At most
+the IO chunk size is decoded and returned per call if n is larger.
 
 :param n: How many bytes to read from the current position (0 means until
           EOF)
@@ -97,14 +155,30 @@ python.org: Read up to n bytes from the object and return them.
 :since:  v1.0.0
         """
 
-        raw_data_size = ((ceil(4 * (n / 3))) if (n > 0) else self.size)
-        raw_data = self.raw_read(raw_data_size)
+        if (self._metrics is not None): read_started = perf_counter()
+
+        io_chunk_size = self.io_chunk_size
+        if (n is None or n > io_chunk_size): n = io_chunk_size
+
+        while ((n < 1 or len(self._decoded_data) < n) and (not self._is_raw_eof)):
+            raw_data_size = io_chunk_size
+
+            if (n > 0):
+                # Line breaks are expected after 76 encoded characters
+                raw_data_size = ceil(4 * ((n - len(self._decoded_data)) / 3))
+                raw_data_size = min(io_chunk_size, 4 + raw_data_size + 2 * (raw_data_size // 76))
+            #
 
-        decoded_data = (Binary.BYTES_TYPE() if (self._decoded_data is None) else self._decoded_data)
-        if (raw_data is not None): decoded_data += b64decode(raw_data)
+            raw_data = self.raw_read(raw_data_size)
+            if (raw_data is not None and len(raw_data) < 1): raw_data = None
 
-        if (len(decoded_data) > n): self._decoded_data = decoded_data[n:]
-        return decoded_data[:n]
+            self._decode(raw_data)
+        #
+
+        _return = self._get_buffered_data(self._decoded_data, n)
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
     #
 
     def seek(self, offset):
@@ -118,7 +192,12 @@ python.org: Change the stream position to the given byte offset.
         """
 
         if (offset % 3 != 0): raise IOException("Resource can not be seeked to a non-boundary offset")
-        return self._wrapped_resource.seek(self, offset)
+
+        del self._decoded_data[:]
+        del self._encoded_data[:]
+        self._is_raw_eof = False
+
+        return self._wrapped_resource.seek(offset)
     #
 
     def set_range(self, range_start, range_end):
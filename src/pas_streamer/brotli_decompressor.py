@@ -36,7 +36,7 @@ class BrotliDecompressor(object):
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "decompressor", "_is_decompressor_process_defined" ]
+    __slots__ = [ "decompressor", "_is_decompressor_output_limit_supported", "_is_decompressor_process_defined" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -52,6 +52,10 @@ Constructor __init__(BrotliDecompressor)
         self.decompressor = brotli.Decompressor()
         """
 brotli decompressor instance
+        """
+        self._is_decompressor_output_limit_supported = hasattr(self.decompressor, "can_accept_more_data")
+        """
+True if brotli decompressor instance supports limiting the output size
         """
         self._is_decompressor_process_defined = hasattr(self.decompressor, "process")
         """
@@ -60,12 +64,45 @@ True if brotli decompressor instance defines "process()" instead of
         """
     #
 
-    def decompress(self, data):
+    @property
+    def eof(self):
+        """
+python.org: A boolean indicating whether the end of the compressed data
+stream has been reached.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self.decompressor is None
+                or (hasattr(self.decompressor, "is_finished") and self.decompressor.is_finished())
+               )
+    #
+
+    @property
+    def unconsumed_tail(self):
+        """
+python.org: A bytes object that contains any data that was not consumed by
+the last decompress() call because it exceeded the limit for the
+uncompressed data buffer. brotli keeps such data internally.
+
+:return: (bytes) Data to be given to the next decompress() call
+:since:  v1.0.0
+        """
+
+        return Binary.BYTES_TYPE()
+    #
+
+    def decompress(self, data, max_length = 0):
         """
 python.org: Decompress data, returning a bytes object containing the
 uncompressed data corresponding to at least part of the data in string.
 
 :param data: Original string
+:param max_length: Maximum size of the data returned (0 means unlimited;
+                   ignored if not supported by the brotli module). Data
+                   exceeding the limit is returned by the next calls
+                   with empty input.
 
 :return: (bytes) Decompressed string
 :since:  v1.0.0
@@ -73,10 +110,17 @@ uncompressed data corresponding to at least part of the data in string.
 
         if (self.decompressor is None): raise IOException("brotli decompressor already flushed and closed")
 
-        return (self.decompressor.process(data)
-                if (self._is_decompressor_process_defined) else
-                self.decompressor.decompress(data)
-               )
+        if (max_length > 0 and self._is_decompressor_output_limit_supported):
+            if (len(data) > 0 and (not self.decompressor.can_accept_more_data())): raise IOException("brotli decompressor requires pending data to be processed first")
+            _return = self.decompressor.process(data, output_buffer_limit = max_length)
+        else:
+            _return = (self.decompressor.process(data)
+                       if (self._is_decompressor_process_defined) else
+                       self.decompressor.decompress(data)
+                      )
+        #
+
+        return _return
     #
 
     def flush(self, length = None):
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class CallbackMetrics(object):
+    """
+"CallbackMetrics" forwards streamer instrumentation data to a callback
+instead of aggregating it. The callback is called with the layer name, the
+metric name and the value.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_callback" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, callback):
+        """
+Constructor __init__(CallbackMetrics)
+
+:param callback: Callback called with "(layer, name, value)"
+
+:since: v1.0.0
+        """
+
+        self._callback = callback
+        """
+Callback called for each value recorded
+        """
+    #
+
+    def add_first_byte(self, layer, duration):
+        """
+Records the time until the first byte has been returned by a layer.
+
+:param layer: Layer name
+:param duration: Duration in seconds
+
+:since: v1.0.0
+        """
+
+        self._callback(layer, "first_byte_seconds", duration)
+    #
+
+    def add_lock_wait(self, layer, duration):
+        """
+Records the time spent waiting for the thread safety lock of a layer.
+
+:param layer: Layer name
+:param duration: Duration in seconds
+
+:since: v1.0.0
+        """
+
+        self._callback(layer, "lock_wait_seconds", duration)
+    #
+
+    def add_read(self, layer, bytes_in, bytes_out, duration, layer_duration):
+        """
+Records a read call of a layer.
+
+:param layer: Layer name
+:param bytes_in: Number of bytes consumed from the encapsulated layer (or
+                 the resource)
+:param bytes_out: Number of bytes returned
+:param duration: Duration of the read call in seconds
+:param layer_duration: Duration spent in the layer itself excluding reads
+                       of the encapsulated layer
+
+:since: v1.0.0
+        """
+
+        self._callback(layer, "bytes_in", bytes_in)
+        self._callback(layer, "bytes_out", bytes_out)
+        self._callback(layer, "read_seconds", duration)
+        self._callback(layer, "layer_seconds", layer_duration)
+    #
+#
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.value_exception import ValueException
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+
+from .compressing_streamer import CompressingStreamer
+from .gzip_compressor import GzipCompressor
+from .memory import Memory
+from .streamer_registry import StreamerRegistry
+from .vfs_based import VfsBased
+
+try: from .brotli_compressor import BrotliCompressor
+except ImportError: BrotliCompressor = None
+
+class CompressedCache(object):
+    """
+"CompressedCache" keeps compressed bodies of VFS URLs in memory. Entries
+are identified by URL, modification time, size, content coding and level,
+and are evicted in least recently used order once the byte budget is
+exceeded. Concurrent misses for the same entry compress it only once.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _instance = None
+    """
+Cache instance shared by default
+    """
+    _instance_lock = ThreadLock()
+    """
+Thread safety lock for the shared instance
+    """
+
+    __slots__ = [ "_entries", "evictions", "hits", "_in_flight", "_lock", "misses", "size", "size_max" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, size_max = None):
+        """
+Constructor __init__(CompressedCache)
+
+:param size_max: Byte budget of all cached bodies
+
+:since: v1.0.0
+        """
+
+        self._entries = OrderedDict()
+        """
+Compressed bodies cached by key in least recently used order
+        """
+        self.evictions = 0
+        """
+Number of bodies evicted
+        """
+        self.hits = 0
+        """
+Number of requests served without compressing the body
+        """
+        self._in_flight = { }
+        """
+Futures of bodies being compressed by key
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self.misses = 0
+        """
+Number of requests compressing the body
+        """
+        self.size = 0
+        """
+Size of all cached bodies
+        """
+        self.size_max = (int(Settings.get("pas_streamer_compressed_cache_size", 67108864)) if (size_max is None) else size_max)
+        """
+Byte budget of all cached bodies
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of cached bodies
+:since:  v1.0.0
+        """
+
+        return len(self._entries)
+    #
+
+    def clear(self):
+        """
+Removes all cached bodies.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+        #
+    #
+
+    def _compress(self, url, content_coding, level):
+        """
+Reads and compresses the data of the given VFS URL.
+
+:param url: VFS URL
+:param content_coding: Content coding ("br" or "gzip")
+:param level: Compression level or quality
+
+:return: (bytes) Compressed body
+:since:  v1.0.0
+        """
+
+        streamer = self._get_compressing_streamer(url, content_coding, level, True)
+        if (streamer is None): raise IOException("Failed to open the VFS URL given")
+
+        try: _return = streamer.read(0)
+        finally: streamer.close()
+
+        return (Binary.BYTES_TYPE() if (_return is None) else _return)
+    #
+
+    def get_body(self, url, content_coding, level = None):
+        """
+Returns the compressed body of the given VFS URL. It is compressed and
+cached on a miss.
+
+:param url: VFS URL
+:param content_coding: Content coding ("br" or "gzip")
+:param level: Compression level or quality; None for the default
+
+:return: (bytes) Compressed body; None if the VFS URL is invalid or larger
+         than the byte budget
+:since:  v1.0.0
+        """
+
+        _return = None
+        is_cacheable = False
+
+        content_coding = content_coding.strip().lower()
+        if (content_coding == "x-gzip"): content_coding = "gzip"
+
+        try: vfs_object = StreamerRegistry.load_vfs_url(url)
+        except IOException: vfs_object = None
+
+        if (vfs_object is not None and vfs_object.is_valid):
+            try:
+                key = ( url, vfs_object.time_updated, vfs_object.size, content_coding, level )
+
+                # Bodies are only cached if the uncompressed data fits into the byte budget
+                is_cacheable = (vfs_object.size <= self.size_max)
+            finally: vfs_object.close()
+        #
+
+        if (is_cacheable):
+            future = None
+            is_compressing = False
+
+            with self._lock:
+                if (key in self._entries):
+                    self._entries.move_to_end(key)
+                    _return = self._entries[key]
+
+                    self.hits += 1
+                elif (key in self._in_flight):
+                    future = self._in_flight[key]
+                    self.hits += 1
+                else:
+                    future = Future()
+                    is_compressing = True
+
+                    self._in_flight[key] = future
+                    self.misses += 1
+                #
+            #
+
+            if (is_compressing):
+                try:
+                    _return = self._compress(url, content_coding, level)
+                    self._set_body(key, _return)
+
+                    future.set_result(_return)
+                except Exception as handled_exception:
+                    future.set_exception(handled_exception)
+                    raise
+                finally:
+                    with self._lock: del self._in_flight[key]
+                #
+            elif (future is not None): _return = future.result()
+        #
+
+        return _return
+    #
+
+    def _get_compressing_streamer(self, url, content_coding, level, single_owner = False):
+        """
+Returns a streamer compressing the data of the given VFS URL while being
+read.
+
+:param url: VFS URL
+:param content_coding: Content coding ("br" or "gzip")
+:param level: Compression level or quality; None for the default
+:param single_owner: True if the streamer is only ever used by a single
+                     thread
+
+:return: (object) Compressing streamer; None if the VFS URL is invalid
+:since:  v1.0.0
+        """
+
+        if (content_coding in ( "gzip", "x-gzip" )): compressor = GzipCompressor(6 if (level is None) else level)
+        elif (content_coding == "br" and BrotliCompressor is not None): compressor = BrotliCompressor(11 if (level is None) else level)
+        else: raise ValueException("Given content coding is not supported")
+
+        _return = None
+        streamer = VfsBased(single_owner = single_owner)
+
+        try:
+            if (streamer.open_url(url)): _return = CompressingStreamer(streamer, compressor)
+        except IOException: pass
+
+        return _return
+    #
+
+    def get_streamer(self, url, content_coding, level = None):
+        """
+Returns an in-memory streamer for the compressed body of the given VFS
+URL. It is compressed and cached on a miss. Data larger than the byte
+budget is compressed while being read instead.
+
+:param url: VFS URL
+:param content_coding: Content coding ("br" or "gzip")
+:param level: Compression level or quality; None for the default
+
+:return: (object) Memory or compressing streamer; None if the VFS URL is
+         invalid
+:since:  v1.0.0
+        """
+
+        body = self.get_body(url, content_coding, level)
+
+        if (body is None): _return = self._get_compressing_streamer(url, content_coding.strip().lower(), level)
+        else:
+            _return = Memory()
+            _return.data = body
+        #
+
+        return _return
+    #
+
+    def _set_body(self, key, body):
+        """
+Caches the given body and evicts the least recently used ones exceeding
+the byte budget. Bodies larger than the byte budget are not cached.
+
+:param key: Cache key
+:param body: Compressed body
+
+:since: v1.0.0
+        """
+
+        body_size = len(body)
+
+        if (body_size <= self.size_max):
+            with self._lock:
+                if (key in self._entries): self.size -= len(self._entries.pop(key))
+
+                while (len(self._entries) > 0 and self.size + body_size > self.size_max):
+                    self.size -= len(self._entries.popitem(False)[1])
+                    self.evictions += 1
+                #
+
+                self._entries[key] = body
+                self.size += body_size
+            #
+        #
+    #
+
+    @staticmethod
+    def get_instance():
+        """
+Returns the cache instance shared by default.
+
+:return: (object) Cache instance
+:since:  v1.0.0
+        """
+
+        with CompressedCache._instance_lock:
+            if (CompressedCache._instance is None): CompressedCache._instance = CompressedCache()
+            return CompressedCache._instance
+        #
+    #
+#
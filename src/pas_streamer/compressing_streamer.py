@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import perf_counter
+
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.supports_mixin import SupportsMixin
+
+from .abstract_encapsulated import AbstractEncapsulated
+
+class CompressingStreamer(AbstractEncapsulated):
+    """
+"CompressingStreamer" compresses an encapsulated streamer while being read
+with a "zlib.compressobj" like compressor, e.g. "GzipCompressor" or
+"BrotliCompressor".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _FILE_WRAPPED_METHODS = ( "is_url_supported",
+                              "open_url"
+                            )
+    """
+File IO methods implemented by an wrapped resource.
+    """
+
+    __slots__ = [ "_compressed_data", "_compressed_size", "compressor" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, streamer, compressor):
+        """
+Constructor __init__(CompressingStreamer)
+
+:param streamer: Encapsulated streamer instance
+:param compressor: Compressor instance providing "compress()" and
+                   "flush()"
+
+:since: v1.0.0
+        """
+
+        AbstractEncapsulated.__init__(self, streamer)
+
+        self._compressed_data = bytearray()
+        """
+Compressed data buffer consumed from the front
+        """
+        self._compressed_size = 0
+        """
+Number of compressed bytes returned
+        """
+        self.compressor = compressor
+        """
+Compressor instance; None after it has been flushed
+        """
+
+        self.supported_features['external_size'] = False
+        self.supported_features['seeking'] = False
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self.compressor is None and len(self._compressed_data) < 1)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        raise IOException("Size of compressed data is not known in advance")
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        try: self._wrapped_resource.close()
+        finally:
+            self.compressor = None
+            del self._compressed_data[:]
+        #
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+Features defined for this instance take precedence over the encapsulated
+streamer ones.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (SupportsMixin.is_supported(self, feature)
+                if (feature in self.supported_features) else
+                self._wrapped_resource.is_supported(feature)
+               )
+    #
+
+    def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        if (n is None): n = self.io_chunk_size
+
+        while ((n < 1 or len(self._compressed_data) < n) and self.compressor is not None):
+            data = self._wrapped_resource.read()
+
+            if (data is None):
+                self._compressed_data += self.compressor.flush()
+                self.compressor = None
+            else: self._compressed_data += self.compressor.compress(data)
+        #
+
+        _return = self._get_buffered_data(self._compressed_data, n)
+
+        if (_return is not None): self._compressed_size += len(_return)
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        return -1
+    #
+
+    def set_range(self, range_start, range_end):
+        """
+Define a range to be streamed.
+
+:param range_start: First byte of range
+:param range_end: Last byte of range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        return False
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._compressed_size
+    #
+#
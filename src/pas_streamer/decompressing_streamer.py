@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import perf_counter
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.supports_mixin import SupportsMixin
+from dpt_runtime.value_exception import ValueException
+
+from .abstract_encapsulated import AbstractEncapsulated
+from .gzip_decompressor import GzipDecompressor
+from .gzip_index import GzipIndex
+
+try: from .brotli_decompressor import BrotliDecompressor
+except ImportError: BrotliDecompressor = None
+
+class DecompressingStreamer(AbstractEncapsulated):
+    """
+"DecompressingStreamer" transparently decompresses an encapsulated Gzip
+(including multiple members), zlib, raw deflate or brotli stream. The
+format is detected based on the stream header and the optional encoding
+hint. Data is decompressed in bounded output chunks. Seeking in Gzip, zlib
+and raw deflate streams resumes at the nearest checkpoint of a "GzipIndex"
+built while reading.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    ENCODINGS_SUPPORTED = ( "br", "deflate", "gzip", "x-gzip" )
+    """
+Content encoding hints supported
+    """
+    INDEXED_INPUT_SIZE = 65536
+    """
+Maximum size of compressed data given to the decompressor at once while a
+checkpoint index is built to limit the size of each checkpoint
+    """
+
+    _FILE_WRAPPED_METHODS = ( "is_url_supported",
+                              "open_url"
+                            )
+    """
+File IO methods implemented by an wrapped resource.
+    """
+
+    __slots__ = [ "_compressed_position",
+                  "_decompressed_data",
+                  "_decompressed_size",
+                  "decompressor",
+                  "encoding",
+                  "_index",
+                  "_index_key",
+                  "_is_decompressor_output_pending",
+                  "_is_index_requested",
+                  "_is_finished",
+                  "_pending_data"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, streamer, encoding = None, index_key = None):
+        """
+Constructor __init__(DecompressingStreamer)
+
+:param streamer: Encapsulated streamer instance
+:param encoding: Content encoding hint ("gzip", "x-gzip", "deflate" or
+                 "br"); None to detect the format
+:param index_key: Key to cache the checkpoint index with, e.g. the URL of
+                  the compressed stream; None to only build an index
+                  after seeking has been requested
+
+:since: v1.0.0
+        """
+
+        if (encoding is not None):
+            encoding = encoding.strip().lower()
+            if (encoding not in DecompressingStreamer.ENCODINGS_SUPPORTED): raise ValueException("Given encoding is not supported")
+        #
+
+        AbstractEncapsulated.__init__(self, streamer)
+
+        self._compressed_position = 0
+        """
+Number of compressed bytes read from the encapsulated streamer
+        """
+        self._decompressed_data = bytearray()
+        """
+Decompressed data buffer consumed from the front
+        """
+        self._decompressed_size = 0
+        """
+Number of decompressed bytes returned
+        """
+        self.decompressor = None
+        """
+Decompressor instance; None until the format has been detected
+        """
+        self.encoding = encoding
+        """
+Content encoding hint
+        """
+        self._index = None
+        """
+Checkpoint index of Gzip, zlib or raw deflate streams
+        """
+        self._index_key = index_key
+        """
+Key to cache the checkpoint index with
+        """
+        self._is_decompressor_output_pending = False
+        """
+True if the last decompression call reached the output limit
+        """
+        self._is_index_requested = (index_key is not None)
+        """
+True if a checkpoint index should be built for Gzip, zlib or raw deflate
+streams
+        """
+        self._is_finished = False
+        """
+True if all compressed data has been decompressed
+        """
+        self._pending_data = Binary.BYTES_TYPE()
+        """
+Compressed data not yet consumed by the decompressor
+        """
+
+        self.supported_features['external_size'] = False
+        self.supported_features['seeking'] = self._supports_seeking
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self._is_finished and len(self._decompressed_data) < 1)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        index = self._index
+        if (index is None and self._index_key is not None): index = GzipIndex.get_cached(self._index_key)
+
+        if (index is None or (not index.is_complete)): raise IOException("Size of decompressed data is not known in advance")
+        return index.size
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        try: self._wrapped_resource.close()
+        finally:
+            self.decompressor = None
+            self._is_finished = True
+            self._pending_data = Binary.BYTES_TYPE()
+
+            del self._decompressed_data[:]
+        #
+    #
+
+    def _decompress(self, max_length):
+        """
+Decompresses the next chunk of data returning at most "max_length" bytes.
+
+:param max_length: Maximum size of the decompressed data
+
+:since: v1.0.0
+        """
+
+        data = self._pending_data
+        is_raw_eof = False
+
+        if ((not self._is_decompressor_output_pending) and len(data) < DecompressingStreamer.INDEXED_INPUT_SIZE):
+            raw_data = self._wrapped_resource.read()
+            if (raw_data is not None and len(raw_data) < 1): raw_data = None
+
+            if (raw_data is not None):
+                self._compressed_position += len(raw_data)
+                data += raw_data
+            elif (len(data) < 1 or self.decompressor is None or self.decompressor.eof):
+                self._finish()
+                return
+            else: is_raw_eof = True
+        #
+
+        if (self.decompressor is None):
+            if (len(data) < 2 and self.encoding != "br"):
+                self._pending_data = data
+                return
+            #
+
+            self.decompressor = self._get_decompressor(data)
+            if (self._is_index_requested): self._init_index()
+        #
+
+        is_gzip = (isinstance(self.decompressor, GzipDecompressor)
+                   and self.decompressor.wbits == GzipDecompressor.WBITS_GZIP
+                  )
+
+        if (self.decompressor.eof
+            and is_gzip
+            and len(data) < 2
+            and data == GzipDecompressor.BINARY_GZIP_MAGIC[:len(data)]
+           ):
+            # Read more data to decide if another Gzip member follows
+            self._is_decompressor_output_pending = False
+            self._pending_data = data
+
+            return
+        #
+
+        if (self.decompressor.eof
+            and (not (is_gzip
+                      and data[:2] == GzipDecompressor.BINARY_GZIP_MAGIC
+                     )
+                )
+           ):
+            # Data following the end of the compressed stream is ignored
+            self._finish()
+            return
+        #
+
+        is_index_building = (self._index is not None and (not self._index.is_complete))
+        remaining_data = None
+
+        if (is_index_building and len(data) > DecompressingStreamer.INDEXED_INPUT_SIZE):
+            remaining_data = data[DecompressingStreamer.INDEXED_INPUT_SIZE:]
+            data = data[:DecompressingStreamer.INDEXED_INPUT_SIZE]
+        #
+
+        decompressed_data = self.decompressor.decompress(data, max_length)
+        self._decompressed_data += decompressed_data
+
+        self._is_decompressor_output_pending = (len(decompressed_data) >= max_length)
+        self._pending_data = self.decompressor.unconsumed_tail
+        if (remaining_data is not None): self._pending_data += remaining_data
+
+        if (is_index_building):
+            decompressed_position = self._decompressed_size + len(self._decompressed_data)
+
+            if (decompressed_position >= self._index.next_offset):
+                self._index.add_checkpoint(decompressed_position,
+                                           self._compressed_position - len(self._pending_data),
+                                           self.decompressor
+                                          )
+            #
+        #
+
+        if (is_raw_eof and len(decompressed_data) < 1 and len(self._pending_data) >= len(data)): self._finish()
+    #
+
+    def _finish(self):
+        """
+Finishes decompression after all compressed data has been read.
+
+:since: v1.0.0
+        """
+
+        if (self.decompressor is None):
+            if (len(self._pending_data) > 0): raise IOException("Compressed data is truncated")
+        else:
+            if (not self.decompressor.eof): raise IOException("Compressed data is truncated")
+
+            self._decompressed_data += self.decompressor.flush()
+            self.decompressor = None
+
+            if (self._index is not None and (not self._index.is_complete)):
+                self._index.set_complete(self._decompressed_size + len(self._decompressed_data))
+            #
+        #
+
+        self._is_decompressor_output_pending = False
+        self._is_finished = True
+        self._pending_data = Binary.BYTES_TYPE()
+    #
+
+    def _get_decompressor(self, data):
+        """
+Returns a decompressor instance for the stream format detected based on
+the given stream header and the encoding hint.
+
+:param data: Compressed data starting with the stream header
+
+:return: (object) Decompressor instance
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (self.encoding != "br"):
+            if (data[:2] == GzipDecompressor.BINARY_GZIP_MAGIC):
+                _return = GzipDecompressor(GzipDecompressor.WBITS_GZIP)
+            elif ((data[0] & 0x0F) == 8 and ((data[0] << 8) + data[1]) % 31 == 0):
+                _return = GzipDecompressor(GzipDecompressor.WBITS_ZLIB)
+            elif (self.encoding == "deflate"):
+                _return = GzipDecompressor(GzipDecompressor.WBITS_DEFLATE)
+            #
+        #
+
+        if (_return is None and self.encoding in ( None, "br" )):
+            if (BrotliDecompressor is None): raise IOException("Compressed data format is not supported")
+            _return = BrotliDecompressor()
+        #
+
+        if (_return is None): raise IOException("Compressed data does not match the encoding given")
+
+        return _return
+    #
+
+    def _init_index(self):
+        """
+Initializes the checkpoint index for the Gzip, zlib or raw deflate stream
+read.
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._index is None and isinstance(self.decompressor, GzipDecompressor)):
+            try: compressed_size = self._wrapped_resource.size
+            except Exception: compressed_size = None
+
+            if (self._index_key is not None): self._index = GzipIndex.get_cached(self._index_key, compressed_size)
+
+            if (self._index is None):
+                self._index = GzipIndex(compressed_size)
+                if (self._index_key is not None): GzipIndex.set_cached(self._index_key, self._index)
+            #
+        #
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+Features defined for this instance take precedence over the encapsulated
+streamer ones.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (SupportsMixin.is_supported(self, feature)
+                if (feature in self.supported_features) else
+                self._wrapped_resource.is_supported(feature)
+               )
+    #
+
+    def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them. Exactly n
+bytes are returned unless EOF is reached.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        if (n is None): n = self.io_chunk_size
+        n = self._get_size_to_read(n)
+
+        if (n < 0): _return = None
+        else:
+            while ((n < 1 or len(self._decompressed_data) < n) and (not self._is_finished)):
+                self._decompress(n - len(self._decompressed_data) if (n > 0) else self.io_chunk_size)
+            #
+
+            _return = self._get_buffered_data(self._decompressed_data, n)
+            size = (0 if (_return is None) else len(_return))
+
+            # Give back bytes of a short read to the requested stream size
+            if (size < n and self.stream_size > -1): self.stream_size += n - size
+        #
+
+        if (_return is not None): self._decompressed_size += len(_return)
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        if (offset < 0 or (not self.is_supported("seeking"))): return -1
+
+        if (not self._is_index_requested):
+            self._is_index_requested = True
+            self._init_index()
+        #
+
+        position = self._decompressed_size
+        checkpoint = (None if (self._index is None) else self._index.get_checkpoint(offset))
+
+        if (offset < position or (checkpoint is not None and checkpoint[0] > position)):
+            if (checkpoint is None): checkpoint = ( 0, 0, None )
+            uncompressed_offset, compressed_offset, decompressor = checkpoint
+
+            if (self._wrapped_resource.seek(compressed_offset) != compressed_offset): raise IOException("Failed to seek in the compressed stream")
+
+            self._compressed_position = compressed_offset
+            self._decompressed_size = uncompressed_offset
+            self.decompressor = decompressor
+            self._is_decompressor_output_pending = False
+            self._is_finished = False
+            self._pending_data = Binary.BYTES_TYPE()
+
+            del self._decompressed_data[:]
+        #
+
+        self._skip(offset - self._decompressed_size)
+
+        return self._decompressed_size
+    #
+
+    def _skip(self, n):
+        """
+Skips the given number of decompressed bytes.
+
+:param n: Number of bytes to skip
+
+:since: v1.0.0
+        """
+
+        while (n > 0):
+            if (len(self._decompressed_data) < 1):
+                if (self._is_finished): break
+                self._decompress(min(n, self.io_chunk_size))
+            #
+
+            skipped_size = min(n, len(self._decompressed_data))
+            del self._decompressed_data[:skipped_size]
+
+            self._decompressed_size += skipped_size
+            n -= skipped_size
+        #
+    #
+
+    def _supports_seeking(self):
+        """
+Returns true if the encapsulated streamer supports seeking.
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return self._wrapped_resource.is_supported("seeking")
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._decompressed_size
+    #
+#
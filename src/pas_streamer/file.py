@@ -17,13 +17,9 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-# pylint: disable=import-error, no-name-in-module
-
-try: from urllib.parse import urlsplit
-except ImportError: from urlparse import urlsplit
-
 from dpt_settings import Settings
 
+from .streamer_registry import StreamerRegistry
 from .vfs_based import VfsBased
 
 class File(VfsBased):
@@ -45,20 +41,37 @@ python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, timeout_retries = 5):
+    def __init__(self, timeout_retries = 5, single_owner = False, accepted_content_codings = None):
         """
 Constructor __init__(File)
 
 :param timeout_retries: Retries before timing out (not used)
+:param single_owner: True if the streamer is only ever used by a single
+                     thread and thread safety locking should be skipped
+:param accepted_content_codings: Content codings (e.g. "br" and "gzip")
+                                 of pre-compressed siblings accepted
 
 :since: v1.0.0
         """
 
-        VfsBased.__init__(self, timeout_retries)
+        VfsBased.__init__(self, timeout_retries, single_owner, accepted_content_codings)
 
         self.io_chunk_size = int(Settings.get("global_io_chunk_size_local", 524288))
     #
 
+    def is_url_supported(self, url):
+        """
+Returns true if the streamer is able to return data for the given URL.
+
+:param url: URL to be streamed
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (StreamerRegistry.get_scheme(url) == "file" and VfsBased.is_url_supported(self, url))
+    #
+
     def open_url(self, url):
         """
 Opens a streamer session for the given URL.
@@ -69,7 +82,6 @@ Opens a streamer session for the given URL.
 :since:  v1.0.0
         """
 
-        url_elements = urlsplit(url)
-        return (VfsBased.open_url(self, url) if (url_elements.scheme == "file") else False)
+        return (VfsBased.open_url(self, url) if (StreamerRegistry.get_scheme(url) == "file") else False)
     #
 #
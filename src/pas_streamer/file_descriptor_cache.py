@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+import os
+
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+
+class FileDescriptorCache(object):
+    """
+"FileDescriptorCache" shares read-only file descriptors process-wide. The
+descriptors are cached by path in least recently used order and validated
+by device, inode, modification time and size on each request. They are
+meant for positional reads with "os.pread()" only.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _descriptors = OrderedDict()
+    """
+Tuples of the file descriptor and its validation key by path
+    """
+    _evicted = set()
+    """
+File descriptors removed from the cache but still referenced
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _references = { }
+    """
+Number of references by file descriptor
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @staticmethod
+    def acquire(file_path_name):
+        """
+Returns a shared file descriptor and the file size for the given path.
+The descriptor must be given back with "release()".
+
+:param file_path_name: File path and name
+
+:return: (tuple) File descriptor and size
+:since:  v1.0.0
+        """
+
+        # pylint: disable=no-member
+
+        key = FileDescriptorCache._get_key(os.stat(file_path_name))
+        _return = None
+
+        with FileDescriptorCache._lock:
+            cached_descriptor = FileDescriptorCache._descriptors.get(file_path_name)
+
+            if (cached_descriptor is not None):
+                if (cached_descriptor[1] == key):
+                    FileDescriptorCache._descriptors.move_to_end(file_path_name)
+                    FileDescriptorCache._references[cached_descriptor[0]] += 1
+
+                    _return = ( cached_descriptor[0], key[3] )
+                else: FileDescriptorCache._remove(file_path_name)
+            #
+        #
+
+        if (_return is None):
+            fd = os.open(file_path_name, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+
+            # The path may have been replaced since it has been checked
+            key = FileDescriptorCache._get_key(os.fstat(fd))
+
+            with FileDescriptorCache._lock:
+                cached_descriptor = FileDescriptorCache._descriptors.get(file_path_name)
+
+                if (cached_descriptor is not None and cached_descriptor[1] == key):
+                    os.close(fd)
+                    fd = cached_descriptor[0]
+                else:
+                    if (cached_descriptor is not None): FileDescriptorCache._remove(file_path_name)
+
+                    FileDescriptorCache._descriptors[file_path_name] = ( fd, key )
+                    FileDescriptorCache._references[fd] = 0
+                #
+
+                FileDescriptorCache._references[fd] += 1
+                FileDescriptorCache._trim()
+            #
+
+            _return = ( fd, key[3] )
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def clear():
+        """
+Removes all cached file descriptors. Descriptors still referenced are
+closed once released.
+
+:since: v1.0.0
+        """
+
+        with FileDescriptorCache._lock:
+            for file_path_name in list(FileDescriptorCache._descriptors.keys()): FileDescriptorCache._remove(file_path_name)
+        #
+    #
+
+    @staticmethod
+    def _get_key(stat_result):
+        """
+Returns the validation key for the given stat result.
+
+:param stat_result: "os.stat_result" instance
+
+:return: (tuple) Validation key
+:since:  v1.0.0
+        """
+
+        return ( stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size )
+    #
+
+    @staticmethod
+    def release(fd):
+        """
+Gives back a file descriptor returned by "acquire()".
+
+:param fd: File descriptor
+
+:since: v1.0.0
+        """
+
+        with FileDescriptorCache._lock:
+            references = FileDescriptorCache._references.get(fd, 0) - 1
+
+            if (references > 0): FileDescriptorCache._references[fd] = references
+            else:
+                FileDescriptorCache._references[fd] = 0
+
+                if (fd in FileDescriptorCache._evicted):
+                    FileDescriptorCache._evicted.discard(fd)
+                    del FileDescriptorCache._references[fd]
+
+                    os.close(fd)
+                #
+            #
+        #
+    #
+
+    @staticmethod
+    def _remove(file_path_name):
+        """
+Removes the cached file descriptor for the given path. It is closed once
+it is no longer referenced. The lock must be held while calling this
+method.
+
+:param file_path_name: File path and name
+
+:since: v1.0.0
+        """
+
+        fd = FileDescriptorCache._descriptors.pop(file_path_name)[0]
+
+        if (FileDescriptorCache._references.get(fd, 0) > 0): FileDescriptorCache._evicted.add(fd)
+        else:
+            FileDescriptorCache._references.pop(fd, None)
+            os.close(fd)
+        #
+    #
+
+    @staticmethod
+    def _trim():
+        """
+Removes the least recently used file descriptors exceeding the
+"pas_streamer_fd_cache_size" setting. The lock must be held while calling
+this method.
+
+:since: v1.0.0
+        """
+
+        size_max = int(Settings.get("pas_streamer_fd_cache_size", 0))
+
+        while (len(FileDescriptorCache._descriptors) > size_max):
+            FileDescriptorCache._remove(next(iter(FileDescriptorCache._descriptors)))
+        #
+    #
+#
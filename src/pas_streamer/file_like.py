@@ -17,6 +17,12 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from io import RawIOBase
+from select import select
+from stat import S_ISFIFO, S_ISREG
+from time import perf_counter
+import os
+
 from dpt_runtime.io_exception import IOException
 from dpt_settings import Settings
 from dpt_vfs import FileLikeWrapperMixin
@@ -50,16 +56,18 @@ python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, timeout_retries = 5):
+    def __init__(self, timeout_retries = 5, single_owner = False):
         """
 Constructor __init__(FileLike)
 
 :param timeout_retries: Retries before timing out
+:param single_owner: True if the streamer is only ever used by a single
+                     thread and thread safety locking should be skipped
 
 :since: v1.0.0
         """
 
-        Abstract.__init__(self, timeout_retries)
+        Abstract.__init__(self, timeout_retries, single_owner)
         FileLikeWrapperMixin.__init__(self)
 
         self._size = None
@@ -72,6 +80,7 @@ File-like resource size
         self.supported_features['external_io_chunk_size'] = True
         self.supported_features['external_size'] = True
         self.supported_features['seeking'] = self._supports_seeking
+        self.supported_features['zero_copy_transfer'] = self._supports_zero_copy_transfer
     #
 
     @property
@@ -99,20 +108,22 @@ Sets the file-like resource to be used.
         with self._lock:
             self._set_wrapped_resource(resource)
             if (hasattr(resource, "size")): self.size = resource.size
+            if (self._io_chunk_size_policy is not None): self._io_chunk_size = self._io_chunk_size_policy.init(self._size)
         #
     #
 
     @property
     def is_eof(self):
         """
-Checks if the resource has reached EOF.
+Checks if the resource has reached EOF or the data of the range set has
+been read completely.
 
 :return: (bool) True if EOF
 :since:  v1.0.0
         """
 
         with self._lock:
-            if (self._wrapped_resource is None): _return = True
+            if (self._wrapped_resource is None or self.stream_size == 0): _return = True
             elif (hasattr(self._wrapped_resource, "is_eof")): _return = self._wrapped_resource.is_eof
             else: _return = (self.size == self.tell())
         #
@@ -170,6 +181,34 @@ python.org: Flush and close this stream.
         with self._lock: FileLikeWrapperMixin.close(self)
     #
 
+    def _get_zero_copy_mode(self):
+        """
+Returns the zero-copy mode supported for the wrapped resource. Regular
+files are sent with "sendfile()" while unbuffered pipes are spliced.
+
+:return: (str) "sendfile", "splice" or None if not supported
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = None
+        fileno = self._get_fileno(self._wrapped_resource)
+
+        if (fileno is not None):
+            try: mode = os.fstat(fileno).st_mode
+            except Exception: mode = 0
+
+            if (S_ISREG(mode) and hasattr(os, "sendfile")): _return = "sendfile"
+            elif (S_ISFIFO(mode)
+                  and hasattr(os, "splice")
+                  and isinstance(self._wrapped_resource, RawIOBase)
+                 ): _return = "splice"
+        #
+
+        return _return
+    #
+
     def is_url_supported(self, url):
         """
 Returns true if the streamer is able to return data for the given URL.
@@ -194,10 +233,128 @@ python.org: Read up to n bytes from the object and return them.
 :since:  v1.0.0
         """
 
+        if (self._metrics is not None): read_started = perf_counter()
+
         if (n is None): n = self.io_chunk_size
 
         if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
-        return (self._wrapped_resource.read() if (n < 1) else self._wrapped_resource.read(n))
+
+        if (self._is_single_owner): _return = self._read(n)
+        else:
+            with self._lock: _return = self._read(n)
+        #
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def _read(self, n):
+        """
+Reads up to n bytes while respecting the requested stream size. An empty
+read is handled as EOF. The lock must be held while calling this method.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        _return = None
+        n = (n if (self.stream_size < 0) else self._get_size_to_read(n))
+
+        if (n > 0):
+            if (self._io_chunk_size_policy is not None): read_started = perf_counter()
+
+            _return = self._wrapped_resource.read(n)
+            size = (0 if (_return is None) else len(_return))
+
+            if (self._io_chunk_size_policy is not None):
+                self._io_chunk_size = self._io_chunk_size_policy.record_read(n, size, perf_counter() - read_started)
+            #
+
+            # Give back bytes of a short read to the requested stream size
+            if (size < n and self.stream_size > -1): self.stream_size += n - size
+            if (size < 1): _return = None
+        elif (n == 0):
+            _return = self._wrapped_resource.read()
+            if (_return is not None and len(_return) < 1): _return = None
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
+
+        if (hasattr(self._wrapped_resource, "readinto")):
+            if (self._metrics is not None or self._io_chunk_size_policy is not None): read_started = perf_counter()
+
+            _return = 0
+
+            with self._lock:
+                view = memoryview(b)
+                n = self._get_size_to_read(len(view))
+
+                if (n > 0):
+                    _return = self._wrapped_resource.readinto(view[:n])
+                    if (_return is None): _return = 0
+
+                    if (self._io_chunk_size_policy is not None):
+                        self._io_chunk_size = self._io_chunk_size_policy.record_read(n, _return, perf_counter() - read_started)
+                    #
+
+                    # Give back bytes of a short read to the requested stream size
+                    if (self.stream_size > -1): self.stream_size += n - _return
+                #
+            #
+
+            if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        else: _return = Abstract.readinto(self, b)
+
+        return _return
+    #
+
+    def _splice(self, target, count):
+        """
+Moves data from the wrapped pipe to the target with "splice()".
+
+:param target: Socket, file-like object or file descriptor
+:param count: Number of bytes to be moved; -1 for all until EOF
+
+:return: (int) Bytes moved
+:since:  v1.0.0
+        """
+
+        _return = 0
+
+        fileno = self._get_fileno(self._wrapped_resource)
+        target_fileno = self._get_fileno(target)
+
+        while (count < 0 or _return < count):
+            splice_size = (self.io_chunk_size if (count < 0) else min(count - _return, self.io_chunk_size))
+
+            try: spliced = os.splice(fileno, target_fileno, splice_size)
+            except BlockingIOError:
+                select([ fileno ], [ target_fileno ], [ ])
+                continue
+            #
+
+            if (spliced < 1): break
+            _return += spliced
+        #
+
+        return _return
     #
 
     def _supports_seeking(self):
@@ -210,4 +367,49 @@ seeking.
 
         return (self._size is not None)
     #
+
+    def _supports_zero_copy_transfer(self):
+        """
+Returns true if data can be transferred without copying it to userspace.
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (self._get_zero_copy_mode() is not None)
+    #
+
+    def transfer_to(self, target):
+        """
+Transfers the remaining data of the stream to the given target. Zero-copy
+implementations are used if "zero_copy_transfer" is supported.
+
+:param target: Socket, file-like object or file descriptor
+
+:return: (int) Bytes transferred
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
+            zero_copy_mode = (None if (self._get_fileno(target) is None) else self._get_zero_copy_mode())
+
+            if (zero_copy_mode == "sendfile"):
+                _return = 0
+                offset = self.tell()
+
+                count = (self.stream_size
+                         if (self.stream_size > -1) else
+                         os.fstat(self._get_fileno(self._wrapped_resource)).st_size - offset
+                        )
+
+                if (count > 0): _return = self._send_file(self._wrapped_resource, target, offset, count)
+            elif (zero_copy_mode == "splice"): _return = self._splice(target, self.stream_size)
+            else: _return = Abstract.transfer_to(self, target)
+
+            if (zero_copy_mode is not None and self.stream_size > -1): self.stream_size -= _return
+        #
+
+        return _return
+    #
 #
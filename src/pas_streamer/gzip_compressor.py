@@ -17,8 +17,10 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from struct import pack
-from zlib import compressobj, crc32, MAX_WBITS, Z_FINISH
+from zlib import compressobj, crc32, DEF_MEM_LEVEL, DEFLATED, MAX_WBITS, Z_DEFAULT_STRATEGY, Z_FINISH, Z_SYNC_FLUSH
 
 from dpt_runtime.binary import Binary
 from dpt_runtime.io_exception import IOException
@@ -26,7 +28,10 @@ from dpt_runtime.io_exception import IOException
 class GzipCompressor(object):
     """
 "GzipCompressor" creates a Gzip compressed stream similar to the
-"zlib.compressobj" object.
+"zlib.compressobj" object. If more than one worker is requested blocks of
+data are compressed in parallel (similar to "pigz") and stitched together
+as one Gzip member. In BGZF mode each block is written as an independent
+Gzip member to support random access.
 
 :author:     direct Netware Group et al.
 :copyright:  (C) direct Netware Group - All rights reserved
@@ -37,19 +42,98 @@ class GzipCompressor(object):
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "compressor", "crc32", "header", "size" ]
+    BGZF_BLOCK_SIZE = 65280
+    """
+Size of an uncompressed BGZF block
+    """
+    BINARY_BGZF_EOF = Binary.bytes("\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00")
+    """
+Empty BGZF block marking EOF
+    """
+    DICTIONARY_SIZE = 32768
+    """
+Size of the previous block's tail used as the deflate dictionary
+    """
+
+    __slots__ = [ "_block_offsets",
+                  "_block_size",
+                  "_compressed_position",
+                  "compressor",
+                  "crc32",
+                  "_executor",
+                  "_futures",
+                  "header",
+                  "_is_bgzf",
+                  "_level",
+                  "_pending_data",
+                  "_previous_block_tail",
+                  "size",
+                  "_uncompressed_position",
+                  "_workers"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, level = 6):
+    def __init__(self, level = 6, workers = 1, block_size = 131072, bgzf = False):
         """
 Constructor __init__(GzipCompressor)
 
+:param level: Compression level
+:param workers: Number of threads compressing blocks in parallel
+:param block_size: Size of an uncompressed block compressed in parallel
+:param bgzf: True to write independent BGZF blocks
+
 :since: v1.0.0
         """
 
+        self._block_offsets = [ ]
+        """
+List of "(compressed_offset, uncompressed_offset)" tuples of BGZF blocks
+        """
+        self._block_size = (GzipCompressor.BGZF_BLOCK_SIZE if (bgzf) else block_size)
+        """
+Size of an uncompressed block compressed in parallel
+        """
+        self._compressed_position = 0
+        """
+Number of compressed bytes of blocks returned
+        """
+        self._executor = None
+        """
+Thread pool executor compressing blocks in parallel
+        """
+        self._futures = deque()
+        """
+Tuples of futures and uncompressed sizes of blocks compressed in parallel
+in stream order
+        """
+        self._is_bgzf = bgzf
+        """
+True to write independent BGZF blocks
+        """
+        self._level = level
+        """
+Compression level
+        """
+        self._pending_data = bytearray()
+        """
+Data not yet submitted for parallel compression
+        """
+        self._previous_block_tail = None
+        """
+Tail of the previous block used as the deflate dictionary
+        """
+        self._uncompressed_position = 0
+        """
+Number of uncompressed bytes of blocks returned
+        """
+        self._workers = max(1, workers)
+        """
+Number of threads compressing blocks in parallel
+        """
+
         self.compressor = None
         """
 Deflate compressor instance
@@ -67,20 +151,38 @@ Gzip header
 Total size of compressed data
         """
 
-        # Use the zlib magic +16 to generate the GZip header and trailer on flush() if supported
-        try: self.compressor = compressobj(level, wbits = 16 + MAX_WBITS)
-        except TypeError:
-            self.compressor = compressobj(level)
-
-            if (level == 9): deflate_flag = 2
-            elif (level == 1): deflate_flag = 4
-            else: deflate_flag = 0
+        if (bgzf):
+            self._executor = ThreadPoolExecutor(max_workers = self._workers)
+            self.size = 0
+        elif (workers > 1):
+            self._executor = ThreadPoolExecutor(max_workers = workers)
 
-            self.header = pack("<8s2B", Binary.bytes("\x1f\x8b" + ("\x00" if (level == 0) else "\x08") + "\x00\x00\x00\x00\x00"), deflate_flag, 255)
+            self.header = GzipCompressor._get_header(level)
             self.size = 0
+        else:
+            # Use the zlib magic +16 to generate the GZip header and trailer on flush() if supported
+            try: self.compressor = compressobj(level, wbits = 16 + MAX_WBITS)
+            except TypeError:
+                self.compressor = compressobj(level)
+
+                self.header = GzipCompressor._get_header(level)
+                self.size = 0
+            #
         #
     #
 
+    @property
+    def is_closed(self):
+        """
+Returns true if the compressor has been flushed and closed.
+
+:return: (bool) True if closed
+:since:  v1.0.0
+        """
+
+        return (self.compressor is None and self._executor is None)
+    #
+
     def compress(self, string):
         """
 python.org: Compress string, returning a string containing compressed data
@@ -92,10 +194,22 @@ for at least part of the data in string.
 :since:  v1.0.0
         """
 
-        if (self.compressor is None): raise IOException("Gzip compressor already flushed and closed")
+        if (self.is_closed): raise IOException("Gzip compressor already flushed and closed")
         data = Binary.bytes(string)
 
-        if (self.size is None): compressed_data = self.compressor.compress(data)
+        if (self._executor is not None):
+            if (not self._is_bgzf): self.crc32 = (crc32(data) if (self.crc32 is None) else crc32(data, self.crc32))
+            self.size += len(data)
+
+            self._pending_data += data
+
+            while (len(self._pending_data) >= self._block_size):
+                self._submit_block(self._pending_data[:self._block_size])
+                del self._pending_data[:self._block_size]
+            #
+
+            compressed_data = self._get_compressed_blocks(self._workers * 2)
+        elif (self.size is None): compressed_data = self.compressor.compress(data)
         else:
             self.crc32 = (crc32(data) if (self.crc32 is None) else crc32(data, self.crc32))
             self.size += len(data)
@@ -123,9 +237,27 @@ remaining compressed output is returned.
         """
 
         if (mode != Z_FINISH): raise IOException("Gzip flush only supports Z_FINISH")
-        if (self.compressor is None): raise IOException("Gzip compressor already flushed and closed")
+        if (self.is_closed): raise IOException("Gzip compressor already flushed and closed")
+
+        if (self._executor is not None):
+            try:
+                if (self._is_bgzf):
+                    if (len(self._pending_data) > 0): self._submit_block(self._pending_data)
+                    _return = self._get_compressed_blocks(0) + GzipCompressor.BINARY_BGZF_EOF
+                else:
+                    self._submit_block(self._pending_data, True)
 
-        if (self.size is None): _return = self.compressor.flush(Z_FINISH)
+                    _return = (self._get_compressed_blocks(0)
+                               + pack("<2I", (0 if (self.crc32 is None) else (self.crc32 & 0xffffffff)), int(self.size % 4294967296))
+                              )
+                #
+
+                del self._pending_data[:]
+            finally:
+                self._executor.shutdown(wait = True)
+                self._executor = None
+            #
+        elif (self.size is None): _return = self.compressor.flush(Z_FINISH)
         else:
             _return = (Binary.BYTES_TYPE()
                        if (self.size < 1) else
@@ -139,4 +271,147 @@ remaining compressed output is returned.
 
         return _return
     #
+
+    def get_bgzf_index(self):
+        """
+Returns the BGZF block offset table in the ".gzi" format of "bgzip". It
+lists "(compressed_offset, uncompressed_offset)" pairs of all blocks
+returned except the first one.
+
+:return: (bytes) BGZF block offset table
+:since:  v1.0.0
+        """
+
+        if (not self._is_bgzf): raise IOException("Gzip compressor is not in BGZF mode")
+
+        block_offsets = self._block_offsets[1:]
+        _return = [ pack("<Q", len(block_offsets)) ]
+
+        for compressed_offset, uncompressed_offset in block_offsets: _return.append(pack("<2Q", compressed_offset, uncompressed_offset))
+
+        return Binary.BYTES_TYPE().join(_return)
+    #
+
+    def _get_compressed_blocks(self, pending_limit):
+        """
+Returns the compressed data of all finished blocks in stream order. Waits
+for the oldest blocks while more than "pending_limit" ones are pending.
+
+:param pending_limit: Number of blocks allowed to remain pending
+
+:return: (bytes) Compressed data
+:since:  v1.0.0
+        """
+
+        compressed_blocks = [ ]
+
+        if (self.header is not None):
+            compressed_blocks.append(self.header)
+            self.header = None
+        #
+
+        while (len(self._futures) > 0 and (len(self._futures) > pending_limit or self._futures[0][0].done())):
+            future, size = self._futures.popleft()
+            compressed_block = future.result()
+
+            if (self._is_bgzf): self._block_offsets.append(( self._compressed_position, self._uncompressed_position ))
+            compressed_blocks.append(compressed_block)
+
+            self._compressed_position += len(compressed_block)
+            self._uncompressed_position += size
+        #
+
+        return Binary.BYTES_TYPE().join(compressed_blocks)
+    #
+
+    def _submit_block(self, data, is_final = False):
+        """
+Submits the given block of data to be compressed in parallel.
+
+:param data: Uncompressed data block
+:param is_final: True for the last block of the stream
+
+:since: v1.0.0
+        """
+
+        data = bytes(data)
+
+        if (self._is_bgzf): future = self._executor.submit(GzipCompressor._compress_bgzf_block, self._level, data)
+        else:
+            future = self._executor.submit(GzipCompressor._compress_block,
+                                           self._level,
+                                           data,
+                                           self._previous_block_tail,
+                                           is_final
+                                          )
+
+            self._previous_block_tail = data[-GzipCompressor.DICTIONARY_SIZE:]
+        #
+
+        self._futures.append(( future, len(data) ))
+    #
+
+    @staticmethod
+    def _compress_block(level, data, dictionary, is_final):
+        """
+Compresses the given block as raw deflate data primed with the given
+dictionary. Blocks not being the final one are terminated with
+"Z_SYNC_FLUSH" to end byte-aligned.
+
+:param level: Compression level
+:param data: Uncompressed data block
+:param dictionary: Tail of the previous block; None for the first one
+:param is_final: True for the last block of the stream
+
+:return: (bytes) Compressed data
+:since:  v1.0.0
+        """
+
+        compressor = (compressobj(level, DEFLATED, -MAX_WBITS)
+                      if (dictionary is None or len(dictionary) < 1) else
+                      compressobj(level, DEFLATED, -MAX_WBITS, DEF_MEM_LEVEL, Z_DEFAULT_STRATEGY, dictionary)
+                     )
+
+        return compressor.compress(data) + compressor.flush(Z_FINISH if (is_final) else Z_SYNC_FLUSH)
+    #
+
+    @staticmethod
+    def _compress_bgzf_block(level, data):
+        """
+Compresses the given block as an independent BGZF Gzip member.
+
+:param level: Compression level
+:param data: Uncompressed data block
+
+:return: (bytes) BGZF block
+:since:  v1.0.0
+        """
+
+        compressor = compressobj(level, DEFLATED, -MAX_WBITS)
+        compressed_data = compressor.compress(data) + compressor.flush(Z_FINISH)
+
+        # BSIZE is the total block size minus 1 (18 bytes header and 8 bytes trailer)
+        return (pack("<4BI2BH2BHH", 0x1f, 0x8b, 8, 4, 0, 0, 255, 6, 66, 67, 2, 25 + len(compressed_data))
+                + compressed_data
+                + pack("<2I", (crc32(data) & 0xffffffff), len(data))
+               )
+    #
+
+    @staticmethod
+    def _get_header(level):
+        """
+Returns the Gzip header for the given compression level.
+
+:param level: Compression level
+
+:return: (bytes) Gzip header
+:since:  v1.0.0
+        """
+
+        if (level == 9): deflate_flag = 2
+        elif (level == 1): deflate_flag = 4
+        else: deflate_flag = 0
+
+        return pack("<8s2B", Binary.bytes("\x1f\x8b\x08\x00\x00\x00\x00\x00"), deflate_flag, 255)
+    #
 #
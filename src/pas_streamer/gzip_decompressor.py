@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from zlib import decompressobj, MAX_WBITS
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+class GzipDecompressor(object):
+    """
+"GzipDecompressor" decompresses a Gzip, zlib or raw deflate stream similar
+to the "zlib.decompressobj" object. Gzip streams consisting of multiple
+members are decompressed as one.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    BINARY_GZIP_MAGIC = Binary.bytes("\x1f\x8b")
+    """
+Binary magic bytes starting a Gzip member.
+    """
+    WBITS_DEFLATE = -MAX_WBITS
+    """
+zlib "wbits" value for raw deflate streams
+    """
+    WBITS_GZIP = 16 + MAX_WBITS
+    """
+zlib "wbits" value for Gzip streams
+    """
+    WBITS_ZLIB = MAX_WBITS
+    """
+zlib "wbits" value for zlib streams
+    """
+
+    __slots__ = [ "decompressor", "_wbits" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, wbits = WBITS_GZIP):
+        """
+Constructor __init__(GzipDecompressor)
+
+:param wbits: zlib "wbits" value of the stream format
+
+:since: v1.0.0
+        """
+
+        self.decompressor = decompressobj(wbits)
+        """
+zlib decompressor instance of the current member
+        """
+        self._wbits = wbits
+        """
+zlib "wbits" value of the stream format
+        """
+    #
+
+    @property
+    def eof(self):
+        """
+python.org: A boolean indicating whether the end of the compressed data
+stream has been reached.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self.decompressor is None
+                or (self.decompressor.eof and (not self._is_next_member_pending))
+               )
+    #
+
+    @property
+    def _is_next_member_pending(self):
+        """
+Returns true if data of another Gzip member follows the finished one.
+
+:return: (bool) True if another member follows
+:since:  v1.0.0
+        """
+
+        return (self._wbits == GzipDecompressor.WBITS_GZIP
+                and self.decompressor.eof
+                and self.decompressor.unused_data[:2] == GzipDecompressor.BINARY_GZIP_MAGIC
+               )
+    #
+
+    @property
+    def _is_next_member_possible(self):
+        """
+Returns true if the data following the finished Gzip member is too short to
+decide if another member follows.
+
+:return: (bool) True if another member may follow
+:since:  v1.0.0
+        """
+
+        unused_data = self.decompressor.unused_data
+
+        return (self._wbits == GzipDecompressor.WBITS_GZIP
+                and self.decompressor.eof
+                and len(unused_data) < 2
+                and unused_data == GzipDecompressor.BINARY_GZIP_MAGIC[:len(unused_data)]
+               )
+    #
+
+    @property
+    def unconsumed_tail(self):
+        """
+python.org: A bytes object that contains any data that was not consumed by
+the last decompress() call because it exceeded the limit for the
+uncompressed data buffer.
+
+:return: (bytes) Data to be given to the next decompress() call
+:since:  v1.0.0
+        """
+
+        if (self.decompressor is None): _return = Binary.BYTES_TYPE()
+        elif (self._is_next_member_pending or self._is_next_member_possible): _return = self.decompressor.unused_data
+        else: _return = self.decompressor.unconsumed_tail
+
+        return _return
+    #
+
+    @property
+    def wbits(self):
+        """
+Returns the zlib "wbits" value of the stream format.
+
+:return: (int) zlib "wbits" value
+:since:  v1.0.0
+        """
+
+        return self._wbits
+    #
+
+    def copy(self):
+        """
+python.org: Returns a copy of the decompression object.
+
+:return: (object) Decompressor copy
+:since:  v1.0.0
+        """
+
+        if (self.decompressor is None): raise IOException("Gzip decompressor already flushed and closed")
+
+        _return = GzipDecompressor.__new__(GzipDecompressor)
+        _return.decompressor = self.decompressor.copy()
+        _return._wbits = self._wbits
+
+        return _return
+    #
+
+    def decompress(self, data, max_length = 0):
+        """
+python.org: Decompress data, returning a bytes object containing the
+uncompressed data corresponding to at least part of the data in string.
+
+:param data: Compressed data
+:param max_length: Maximum size of the data returned (0 means unlimited)
+
+:return: (bytes) Decompressed data
+:since:  v1.0.0
+        """
+
+        if (self.decompressor is None): raise IOException("Gzip decompressor already flushed and closed")
+
+        # The unused data of the previous member is given again as unconsumed tail
+        if (self._wbits == GzipDecompressor.WBITS_GZIP
+            and self.decompressor.eof
+            and data[:2] == GzipDecompressor.BINARY_GZIP_MAGIC
+           ): self.decompressor = decompressobj(self._wbits)
+        _return = self.decompressor.decompress(data, max_length)
+
+        while (self._is_next_member_pending and (max_length < 1 or len(_return) < max_length)):
+            data = self.decompressor.unused_data
+            self.decompressor = decompressobj(self._wbits)
+
+            _return += self.decompressor.decompress(data, (max_length - len(_return) if (max_length > 0) else 0))
+        #
+
+        return _return
+    #
+
+    def flush(self, length = None):
+        """
+python.org: All pending input is processed, and a bytes object containing
+the remaining uncompressed output is returned.
+
+:param length: Initial size of the output buffer
+
+:return: (bytes) Decompressed data
+:since:  v1.0.0
+        """
+
+        if (self.decompressor is None): raise IOException("Gzip decompressor already flushed and closed")
+
+        _return = (self.decompressor.flush() if (length is None) else self.decompressor.flush(length))
+        self.decompressor = None
+
+        return _return
+    #
+#
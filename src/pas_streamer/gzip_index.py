@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from struct import unpack_from
+
+from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+
+from .gzip_decompressor import GzipDecompressor
+
+class GzipIndex(object):
+    """
+"GzipIndex" holds checkpoints of a Gzip, zlib or raw deflate stream similar
+to "zran". Each checkpoint contains a snapshot of the decompressor state
+(including the deflate window) at an uncompressed offset to resume
+decompression at without starting from byte 0.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _cache = OrderedDict()
+    """
+Indexes cached by key in least recently used order
+    """
+    _cache_lock = ThreadLock()
+    """
+Thread safety lock for the index cache
+    """
+
+    __slots__ = [ "_checkpoints", "_checkpoints_max", "compressed_size", "_lock", "_offsets", "_size", "span" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, compressed_size = None, span = None):
+        """
+Constructor __init__(GzipIndex)
+
+:param compressed_size: Size of the compressed stream if known
+:param span: Uncompressed distance between checkpoints
+
+:since: v1.0.0
+        """
+
+        self._checkpoints = [ ]
+        """
+List of checkpoint tuples "(uncompressed_offset, compressed_offset,
+decompressor)"
+        """
+        self._checkpoints_max = int(Settings.get("pas_streamer_gzip_index_checkpoints_max", 1024))
+        """
+Maximum number of checkpoints to limit the memory used
+        """
+        self.compressed_size = compressed_size
+        """
+Size of the compressed stream if known
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._offsets = [ ]
+        """
+Sorted list of uncompressed checkpoint offsets
+        """
+        self._size = -1
+        """
+Uncompressed size; -1 until the index is complete
+        """
+        self.span = (int(Settings.get("pas_streamer_gzip_index_span", 1048576)) if (span is None) else span)
+        """
+Uncompressed distance between checkpoints
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of checkpoints
+:since:  v1.0.0
+        """
+
+        return len(self._checkpoints)
+    #
+
+    @property
+    def is_complete(self):
+        """
+Returns true if the index covers the whole stream.
+
+:return: (bool) True if complete
+:since:  v1.0.0
+        """
+
+        return (self._size > -1)
+    #
+
+    @property
+    def next_offset(self):
+        """
+Returns the uncompressed offset the next checkpoint is expected at.
+
+:return: (int) Uncompressed offset
+:since:  v1.0.0
+        """
+
+        return ((self._offsets[-1] if (len(self._offsets) > 0) else 0) + self.span)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the uncompressed size.
+
+:return: (int) Uncompressed size; -1 until the index is complete
+:since:  v1.0.0
+        """
+
+        return self._size
+    #
+
+    def add_checkpoint(self, uncompressed_offset, compressed_offset, decompressor):
+        """
+Adds a checkpoint if it follows the last one and the maximum number of
+checkpoints has not been reached. The decompressor state is copied.
+
+:param uncompressed_offset: Uncompressed offset of the checkpoint
+:param compressed_offset: Offset of the compressed data to be given to the
+                          decompressor next
+:param decompressor: Decompressor instance providing "copy()"
+
+:return: (bool) True if added
+:since:  v1.0.0
+        """
+
+        _return = False
+
+        with self._lock:
+            if (len(self._offsets) < self._checkpoints_max
+                and (len(self._offsets) < 1 or uncompressed_offset > self._offsets[-1])
+               ):
+                self._checkpoints.append(( uncompressed_offset, compressed_offset, decompressor.copy() ))
+                self._offsets.append(uncompressed_offset)
+
+                _return = True
+            #
+        #
+
+        return _return
+    #
+
+    def get_checkpoint(self, offset):
+        """
+Returns the nearest checkpoint at or before the given uncompressed offset.
+
+:param offset: Uncompressed offset
+
+:return: (tuple) Checkpoint tuple "(uncompressed_offset, compressed_offset,
+         decompressor)" with a decompressor copy; None if not available
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        with self._lock:
+            position = bisect_right(self._offsets, offset)
+
+            if (position > 0):
+                uncompressed_offset, compressed_offset, decompressor = self._checkpoints[position - 1]
+                _return = ( uncompressed_offset, compressed_offset, decompressor.copy() )
+            #
+        #
+
+        return _return
+    #
+
+    def set_complete(self, size):
+        """
+Marks the index as complete for a stream of the given uncompressed size.
+
+:param size: Uncompressed size
+
+:since: v1.0.0
+        """
+
+        self._size = size
+    #
+
+    @staticmethod
+    def get_cached(key, compressed_size = None):
+        """
+Returns the cached index for the given key. Cached indexes for a different
+compressed size are discarded.
+
+:param key: Cache key, e.g. the URL of the compressed stream
+:param compressed_size: Size of the compressed stream if known
+
+:return: (object) Index instance; None if not cached
+:since:  v1.0.0
+        """
+
+        with GzipIndex._cache_lock:
+            _return = GzipIndex._cache.get(key)
+
+            if (_return is not None):
+                if (compressed_size is not None
+                    and _return.compressed_size is not None
+                    and compressed_size != _return.compressed_size
+                   ):
+                    del GzipIndex._cache[key]
+                    _return = None
+                else: GzipIndex._cache.move_to_end(key)
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def load_bgzf_index(data, compressed_size = None):
+        """
+Returns an index for a BGZF stream based on the given block offset table
+in the ".gzi" format of "bgzip". Each BGZF block is an independent Gzip
+member and is used as a checkpoint.
+
+:param data: BGZF block offset table
+:param compressed_size: Size of the compressed stream if known
+
+:return: (object) Index instance
+:since:  v1.0.0
+        """
+
+        if (len(data) < 8): raise IOException("BGZF block offset table is invalid")
+        blocks = unpack_from("<Q", data)[0]
+        if (len(data) != 8 + 16 * blocks): raise IOException("BGZF block offset table is invalid")
+
+        _return = GzipIndex(compressed_size)
+
+        for position in range(8, len(data), 16):
+            compressed_offset, uncompressed_offset = unpack_from("<2Q", data, position)
+
+            # Checkpoints at block boundaries only need a new decompressor and are not limited
+            _return._checkpoints.append(( uncompressed_offset, compressed_offset, GzipDecompressor() ))
+            _return._offsets.append(uncompressed_offset)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def set_cached(key, index):
+        """
+Caches the given index for the given key.
+
+:param key: Cache key, e.g. the URL of the compressed stream
+:param index: Index instance
+
+:since: v1.0.0
+        """
+
+        cache_size = int(Settings.get("pas_streamer_gzip_index_cache_size", 32))
+
+        with GzipIndex._cache_lock:
+            GzipIndex._cache[key] = index
+            GzipIndex._cache.move_to_end(key)
+
+            while (len(GzipIndex._cache) > cache_size): GzipIndex._cache.popitem(False)
+        #
+    #
+#
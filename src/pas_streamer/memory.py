@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import perf_counter
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+from .abstract import Abstract
+
+class Memory(Abstract):
+    """
+"Memory" streams data held in memory. Data is returned as "memoryview"
+slices without copying it.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_position", "_view" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, timeout_retries = 5, single_owner = False):
+        """
+Constructor __init__(Memory)
+
+:param timeout_retries: Retries before timing out (not used)
+:param single_owner: True if the streamer is only ever used by a single
+                     thread and thread safety locking should be skipped
+
+:since: v1.0.0
+        """
+
+        Abstract.__init__(self, timeout_retries, single_owner)
+
+        self._position = 0
+        """
+Current position in the data
+        """
+        self._view = None
+        """
+View of the data used for slicing
+        """
+
+        self.supported_features['external_size'] = True
+        self.supported_features['seeking'] = True
+    #
+
+    @property
+    def data(self):
+        """
+Returns the data streamed.
+
+:return: (object) Data
+:since:  v1.0.0
+        """
+
+        return (None if (self._view is None) else self._view.obj)
+    #
+
+    @data.setter
+    def data(self, data):
+        """
+Sets the data to be streamed.
+
+:param data: Bytes-like object
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._position = 0
+            self._view = (None if (data is None) else memoryview(Binary.bytes(data)).cast("B"))
+        #
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF or the data of the range set has
+been read completely.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self._view is None or self.stream_size == 0 or self._position >= len(self._view))
+    #
+
+    @property
+    def is_resource_valid(self):
+        """
+Returns true if the streamer resource is available.
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        return (self._view is not None)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        if (self._view is None): raise IOException("Streamer resource is invalid")
+        return len(self._view)
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            self._position = 0
+            self._view = None
+        #
+    #
+
+    def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (memoryview) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        if (n is None): n = self.io_chunk_size
+
+        if (self._is_single_owner): _return = self._read(n)
+        else:
+            with self._lock: _return = self._read(n)
+        #
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def _read(self, n):
+        """
+Reads up to n bytes while respecting the requested stream size. The lock
+must be held while calling this method.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (memoryview) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._view is None): raise IOException("Streamer resource is invalid")
+
+        _return = None
+        n = self._get_size_to_read(n)
+
+        if (n > -1):
+            size = len(self._view) - self._position
+            if (n > 0 and n < size): size = n
+
+            # Give back bytes of a short read to the requested stream size
+            if (n > size and self.stream_size > -1): self.stream_size += n - size
+
+            if (size > 0):
+                _return = self._view[self._position:self._position + size]
+                self._position += size
+            #
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        _return = 0
+        view = memoryview(b).cast("B")
+
+        with self._lock:
+            data = self._read(len(view))
+
+            if (data is not None):
+                _return = len(data)
+                view[:_return] = data
+            #
+        #
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            if (self._view is None): raise IOException("Streamer resource is invalid")
+            self._position = max(0, min(offset, len(self._view)))
+
+            return self._position
+        #
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._position
+    #
+
+    def transfer_to(self, target):
+        """
+Transfers the remaining data of the stream to the given target without
+copying it.
+
+:param target: Socket, file-like object or file descriptor
+
+:return: (int) Bytes transferred
+:since:  v1.0.0
+        """
+
+        with self._lock: data = self._read(0)
+
+        _return = (0 if (data is None) else len(data))
+        if (_return > 0): self._write_to_target(target, data)
+
+        return _return
+    #
+#
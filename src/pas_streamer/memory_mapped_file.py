@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import mmap
+
+from dpt_runtime.io_exception import IOException
+
+class MemoryMappedFile(object):
+    """
+"MemoryMappedFile" provides the VFS object API used by streamers for a
+read-only memory map of an opened VFS object. Data is returned as
+"memoryview" slices of the map and pages are shared with all other readers
+of the file through the page cache.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_fileno", "_mmap", "_position", "_size", "_view", "_vfs_object" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, vfs_object, file_object):
+        """
+Constructor __init__(MemoryMappedFile)
+
+:param vfs_object: Opened VFS object
+:param file_object: File object implementing the VFS object
+
+:since: v1.0.0
+        """
+
+        self._fileno = file_object.fileno()
+        """
+File descriptor of the mapped file
+        """
+        self._mmap = mmap.mmap(self._fileno, 0, access = mmap.ACCESS_READ)
+        """
+Memory map instance
+        """
+        self._position = file_object.tell()
+        """
+Current position in the memory map
+        """
+        self._size = len(self._mmap)
+        """
+Size of the memory map
+        """
+        self._view = memoryview(self._mmap)
+        """
+View of the memory map used for slicing
+        """
+        self._vfs_object = vfs_object
+        """
+Memory mapped VFS object
+        """
+
+        if (hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL")): self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the memory mapped VFS object
+:since:  v1.0.0
+        """
+
+        if (name.startswith("_")): raise AttributeError(name)
+        return getattr(self._vfs_object, name)
+    #
+
+    @property
+    def implementing_instance(self):
+        """
+Returns the implementing instance.
+
+:return: (object) Implementing instance
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self._position >= self._size)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        return self._size
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        if (self._mmap is not None):
+            self._view.release()
+
+            # Views returned by read() may still be in use and keep the map alive
+            try: self._mmap.close()
+            except BufferError: pass
+            finally:
+                self._mmap = None
+                self._view = None
+                self._vfs_object.close()
+            #
+        #
+    #
+
+    def fileno(self):
+        """
+python.org: Return the underlying file descriptor (an integer).
+
+:return: (int) File descriptor
+:since:  v1.0.0
+        """
+
+        return self._fileno
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (True if (feature == "seek") else self._vfs_object.is_supported(feature))
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (memoryview) Data
+:since:  v1.0.0
+        """
+
+        if (self._view is None): raise IOException("Memory map is closed")
+
+        position = self._position
+        self._position = (self._size if (n is None or n < 1) else min(position + n, self._size))
+
+        return self._view[position:self._position]
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.0
+        """
+
+        view = memoryview(b)
+        data = self.read(len(view))
+
+        _return = len(data)
+        view[:_return] = data
+
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        if (offset < 0): raise IOException("Invalid offset given")
+
+        self._position = offset
+        return offset
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._position
+    #
+#
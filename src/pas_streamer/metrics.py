@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_threading.thread_lock import ThreadLock
+
+class Metrics(object):
+    """
+"Metrics" aggregates streamer instrumentation data in memory per layer
+(streamer class name). The data can be dumped in the Prometheus text
+exposition format.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    READ_DURATION_BUCKETS = ( 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0 )
+    """
+Upper bounds in seconds of the read latency histogram buckets
+    """
+
+    __slots__ = [ "_layers", "_lock" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(Metrics)
+
+:since: v1.0.0
+        """
+
+        self._layers = { }
+        """
+Aggregated data per layer
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+    #
+
+    @property
+    def layers(self):
+        """
+Returns the names of all layers data has been recorded for.
+
+:return: (list) Layer names
+:since:  v1.0.0
+        """
+
+        with self._lock: return sorted(self._layers.keys())
+    #
+
+    def add_first_byte(self, layer, duration):
+        """
+Records the time until the first byte has been returned by a layer.
+
+:param layer: Layer name
+:param duration: Duration in seconds
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            data = self._get_layer_data(layer)
+
+            data['first_byte_count'] += 1
+            data['first_byte_sum'] += duration
+        #
+    #
+
+    def add_lock_wait(self, layer, duration):
+        """
+Records the time spent waiting for the thread safety lock of a layer.
+
+:param layer: Layer name
+:param duration: Duration in seconds
+
+:since: v1.0.0
+        """
+
+        with self._lock:
+            data = self._get_layer_data(layer)
+
+            data['lock_wait_count'] += 1
+            data['lock_wait_sum'] += duration
+        #
+    #
+
+    def add_read(self, layer, bytes_in, bytes_out, duration, layer_duration):
+        """
+Records a read call of a layer.
+
+:param layer: Layer name
+:param bytes_in: Number of bytes consumed from the encapsulated layer (or
+                 the resource)
+:param bytes_out: Number of bytes returned
+:param duration: Duration of the read call in seconds
+:param layer_duration: Duration spent in the layer itself excluding reads
+                       of the encapsulated layer
+
+:since: v1.0.0
+        """
+
+        bucket = 0
+
+        for bucket_limit in Metrics.READ_DURATION_BUCKETS:
+            if (duration <= bucket_limit): break
+            bucket += 1
+        #
+
+        with self._lock:
+            data = self._get_layer_data(layer)
+
+            data['bytes_in'] += bytes_in
+            data['bytes_out'] += bytes_out
+            data['layer_duration_sum'] += layer_duration
+            data['read_count'] += 1
+            data['read_duration_buckets'][bucket] += 1
+            data['read_duration_sum'] += duration
+        #
+    #
+
+    def clear(self):
+        """
+Removes all data recorded.
+
+:since: v1.0.0
+        """
+
+        with self._lock: self._layers.clear()
+    #
+
+    def get(self, layer):
+        """
+Returns a copy of the data recorded for the given layer.
+
+:param layer: Layer name
+
+:return: (dict) Layer data; None if not recorded
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            data = self._layers.get(layer)
+
+            if (data is None): _return = None
+            else:
+                _return = data.copy()
+                _return['read_duration_buckets'] = list(data['read_duration_buckets'])
+            #
+        #
+
+        return _return
+    #
+
+    def _get_layer_data(self, layer):
+        """
+Returns the data dictionary of the given layer. The lock must be held
+while calling this method.
+
+:param layer: Layer name
+
+:return: (dict) Layer data
+:since:  v1.0.0
+        """
+
+        _return = self._layers.get(layer)
+
+        if (_return is None):
+            _return = { "bytes_in": 0,
+                        "bytes_out": 0,
+                        "first_byte_count": 0,
+                        "first_byte_sum": 0.0,
+                        "layer_duration_sum": 0.0,
+                        "lock_wait_count": 0,
+                        "lock_wait_sum": 0.0,
+                        "read_count": 0,
+                        "read_duration_buckets": [ 0 ] * (1 + len(Metrics.READ_DURATION_BUCKETS)),
+                        "read_duration_sum": 0.0
+                      }
+
+            self._layers[layer] = _return
+        #
+
+        return _return
+    #
+
+    def get_prometheus_text(self, prefix = "pas_streamer"):
+        """
+Returns all data recorded in the Prometheus text exposition format.
+
+:param prefix: Metric name prefix
+
+:return: (str) Prometheus text
+:since:  v1.0.0
+        """
+
+        layers = [ ( layer, self.get(layer) ) for layer in self.layers ]
+
+        lines = [ ]
+
+        for ( name, metric_type, key, help_text ) in ( ( "bytes_in_total", "counter", "bytes_in", "Bytes consumed from the encapsulated layer" ),
+                                                       ( "bytes_out_total", "counter", "bytes_out", "Bytes returned" ),
+                                                       ( "reads_total", "counter", "read_count", "Read calls" ),
+                                                       ( "layer_seconds_total", "counter", "layer_duration_sum", "Time spent in the layer itself" ),
+                                                       ( "lock_wait_seconds_total", "counter", "lock_wait_sum", "Time spent waiting for the thread safety lock" ),
+                                                       ( "first_byte_seconds_total", "counter", "first_byte_sum", "Accumulated time until the first byte has been returned" ),
+                                                       ( "first_bytes_total", "counter", "first_byte_count", "Streams returning a first byte" )
+                                                     ):
+            lines.append("# HELP {0}_{1} {2}".format(prefix, name, help_text))
+            lines.append("# TYPE {0}_{1} {2}".format(prefix, name, metric_type))
+
+            for ( layer, data ) in layers:
+                lines.append("{0}_{1}{{layer=\"{2}\"}} {3!r}".format(prefix, name, layer, data[key]))
+            #
+        #
+
+        lines.append("# HELP {0}_read_duration_seconds Read call latency".format(prefix))
+        lines.append("# TYPE {0}_read_duration_seconds histogram".format(prefix))
+
+        for ( layer, data ) in layers:
+            count = 0
+
+            for ( bucket, bucket_limit ) in enumerate(Metrics.READ_DURATION_BUCKETS + ( "+Inf", )):
+                count += data['read_duration_buckets'][bucket]
+                lines.append("{0}_read_duration_seconds_bucket{{layer=\"{1}\",le=\"{2}\"}} {3:d}".format(prefix, layer, bucket_limit, count))
+            #
+
+            lines.append("{0}_read_duration_seconds_sum{{layer=\"{1}\"}} {2!r}".format(prefix, layer, data['read_duration_sum']))
+            lines.append("{0}_read_duration_seconds_count{{layer=\"{1}\"}} {2:d}".format(prefix, layer, count))
+        #
+
+        return "\n".join(lines) + "\n"
+    #
+#
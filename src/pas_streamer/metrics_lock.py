@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import perf_counter
+
+class MetricsLock(object):
+    """
+"MetricsLock" wraps the thread safety lock of an instrumented streamer and
+records the time spent waiting to acquire it.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_layer", "lock", "_metrics" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, lock, metrics, layer):
+        """
+Constructor __init__(MetricsLock)
+
+:param lock: Wrapped lock
+:param metrics: Metrics sink
+:param layer: Layer name
+
+:since: v1.0.0
+        """
+
+        self._layer = layer
+        """
+Layer name
+        """
+        self.lock = lock
+        """
+Wrapped lock
+        """
+        self._metrics = metrics
+        """
+Metrics sink
+        """
+    #
+
+    def __enter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:since: v1.0.0
+        """
+
+        self.acquire()
+    #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+:since:  v1.0.0
+        """
+
+        self.release()
+        return False
+    #
+
+    def acquire(self):
+        """
+Acquire a lock.
+
+:since: v1.0.0
+        """
+
+        started = perf_counter()
+        self.lock.acquire()
+        self._metrics.add_lock_wait(self._layer, perf_counter() - started)
+    #
+
+    def release(self):
+        """
+Release a lock.
+
+:since: v1.0.0
+        """
+
+        self.lock.release()
+    #
+#
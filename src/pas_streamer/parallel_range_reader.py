@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+import os
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
+
+from .file_descriptor_cache import FileDescriptorCache
+from .streamer_registry import StreamerRegistry
+
+class ParallelRangeReader(object):
+    """
+"ParallelRangeReader" provides the VFS object API used by streamers for an
+opened VFS object while worker threads read consecutive segments of the
+active range concurrently. Segments are returned in order from a bounded
+reorder window so that "read()" stays sequential.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_data",
+                  "_data_position",
+                  "_executor",
+                  "_fileno",
+                  "_is_eof",
+                  "_limit",
+                  "_local",
+                  "_pending",
+                  "_position",
+                  "_segment_position",
+                  "_segment_size",
+                  "_size",
+                  "_vfs_object",
+                  "_window",
+                  "_worker_vfs_objects"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, vfs_object, workers, segment_size = None, window = None):
+        """
+Constructor __init__(ParallelRangeReader)
+
+:param vfs_object: Opened VFS object
+:param workers: Number of worker threads
+:param segment_size: Size of a segment read by a worker thread
+:param window: Maximum number of segments read ahead of the consumer
+
+:since: v1.0.0
+        """
+
+        workers = max(1, workers)
+
+        if (segment_size is None): segment_size = int(Settings.get("pas_streamer_parallel_read_segment_size", 4194304))
+        if (window is None): window = 2 * workers
+
+        self._data = None
+        """
+Data of the segment read last
+        """
+        self._data_position = 0
+        """
+Position of the remaining data in the segment read last
+        """
+        self._executor = ThreadPoolExecutor(max_workers = workers)
+        """
+Executor running the worker threads
+        """
+        self._fileno = None
+        """
+Shared file descriptor read positionally; None if worker threads use VFS
+objects of their own
+        """
+        self._is_eof = False
+        """
+True if a segment returned less data than expected
+        """
+        self._limit = None
+        """
+Position to stop reading segments at; None for EOF
+        """
+        self._local = local()
+        """
+Thread-local storage of the worker VFS object
+        """
+        self._pending = deque()
+        """
+Reorder window of segments requested in order
+        """
+        self._position = vfs_object.tell()
+        """
+Position of the data returned
+        """
+        self._segment_position = self._position
+        """
+Position of the next segment requested
+        """
+        self._segment_size = max(1, segment_size)
+        """
+Size of a segment read by a worker thread
+        """
+        self._size = vfs_object.size
+        """
+Size of the VFS object read
+        """
+        self._vfs_object = vfs_object
+        """
+VFS object read in parallel
+        """
+        self._window = max(workers, window)
+        """
+Maximum number of segments requested ahead of the consumer
+        """
+        self._worker_vfs_objects = [ ]
+        """
+VFS objects opened by worker threads
+        """
+
+        if (vfs_object.is_supported("filesystem_path_name")):
+            ( self._fileno, self._size ) = FileDescriptorCache.acquire(vfs_object.filesystem_path_name)
+        #
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the VFS object read in parallel
+:since:  v1.0.0
+        """
+
+        if (name.startswith("_")): raise AttributeError(name)
+        return getattr(self._vfs_object, name)
+    #
+
+    @property
+    def implementing_instance(self):
+        """
+Returns the implementing instance.
+
+:return: (object) Implementing instance
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return ((self._is_eof and self._data is None) or self._position >= self._size)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        return self._size
+    #
+
+    def _cancel(self):
+        """
+Cancels all segments requested and discards the data read.
+
+:since: v1.0.0
+        """
+
+        while (len(self._pending) > 0): self._pending.popleft()[1].cancel()
+        self._data = None
+        self._data_position = 0
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        if (self._executor is not None):
+            try:
+                self._cancel()
+                self._executor.shutdown()
+            finally:
+                self._executor = None
+
+                try:
+                    for vfs_object in self._worker_vfs_objects: vfs_object.close()
+                    if (self._fileno is not None): FileDescriptorCache.release(self._fileno)
+                finally:
+                    self._fileno = None
+                    self._worker_vfs_objects = [ ]
+
+                    self._vfs_object.close()
+                #
+            #
+        #
+    #
+
+    def fileno(self):
+        """
+python.org: Return the underlying file descriptor (an integer).
+
+:since: v1.0.0
+        """
+
+        raise IOException("File descriptor is not available while reading in parallel")
+    #
+
+    def _get_segment(self):
+        """
+Returns the next segment in order and requests further segments to fill
+the reorder window.
+
+:return: (bytes) Data; None if EOF or the limit set is reached
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        self._request_segments()
+
+        if (len(self._pending) > 0):
+            ( length, future ) = self._pending.popleft()
+            data = future.result()
+
+            if (len(data) < length):
+                # The file has been truncated while being read
+                self._cancel()
+                self._is_eof = True
+            else: self._request_segments()
+
+            if (len(data) > 0): _return = data
+        #
+
+        return _return
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (True if (feature == "seek") else self._vfs_object.is_supported(feature))
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._executor is None): raise IOException("File is closed")
+
+        if (n is None or n < 1):
+            data = [ ]
+
+            while (True):
+                chunk = self.read(self._segment_size)
+                if (chunk is None): break
+
+                data.append(chunk)
+            #
+
+            _return = (Binary.BYTES_TYPE().join(data) if (len(data) > 0) else None)
+        else:
+            if (self._data is None and (not self._is_eof)): self._data = self._get_segment()
+
+            if (self._data is None): _return = None
+            elif (self._data_position == 0 and n >= len(self._data)):
+                _return = self._data
+                self._data = None
+            else:
+                data_end = min(self._data_position + n, len(self._data))
+                with memoryview(self._data) as view: _return = view[self._data_position:data_end].tobytes()
+
+                if (data_end < len(self._data)): self._data_position = data_end
+                else:
+                    self._data = None
+                    self._data_position = 0
+                #
+            #
+
+            if (_return is not None): self._position += len(_return)
+        #
+
+        return _return
+    #
+
+    def _read_segment(self, offset, length):
+        """
+Reads the segment at the given offset. Called by worker threads.
+
+:param offset: Segment offset
+:param length: Segment length
+
+:return: (bytes) Data; shorter than the length given at EOF
+:since:  v1.0.0
+        """
+
+        data = [ ]
+        data_length = 0
+        vfs_object = None
+
+        if (self._fileno is None):
+            vfs_object = getattr(self._local, "vfs_object", None)
+
+            if (vfs_object is None):
+                vfs_object = StreamerRegistry.load_vfs_url(self._vfs_object.url)
+                self._local.vfs_object = vfs_object
+                self._worker_vfs_objects.append(vfs_object)
+            #
+
+            vfs_object.seek(offset)
+        #
+
+        while (data_length < length):
+            chunk = (os.pread(self._fileno, length - data_length, offset + data_length)
+                     if (vfs_object is None) else
+                     vfs_object.read(length - data_length)
+                    )
+
+            if (chunk is None or len(chunk) < 1): break
+
+            data.append(chunk)
+            data_length += len(chunk)
+        #
+
+        return (data[0] if (len(data) == 1) else Binary.BYTES_TYPE().join(data))
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.0
+        """
+
+        _return = 0
+
+        view = memoryview(b)
+        data = self.read(len(view))
+
+        if (data is not None):
+            _return = len(data)
+            view[:_return] = data
+        #
+
+        return _return
+    #
+
+    def _request_segments(self):
+        """
+Requests segments until the reorder window is full or the limit set is
+reached.
+
+:since: v1.0.0
+        """
+
+        end_position = (self._size if (self._limit is None) else min(self._limit, self._size))
+
+        while ((not self._is_eof)
+               and len(self._pending) < self._window
+               and self._segment_position < end_position
+              ):
+            length = min(self._segment_size, end_position - self._segment_position)
+
+            self._pending.append(( length, self._executor.submit(self._read_segment, self._segment_position, length) ))
+            self._segment_position += length
+        #
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        if (offset < 0): raise IOException("Invalid offset given")
+
+        self._cancel()
+
+        self._is_eof = False
+        self._limit = None
+
+        self._position = offset
+        self._segment_position = offset
+
+        return offset
+    #
+
+    def set_limit(self, position):
+        """
+Sets the position to stop reading segments at.
+
+:param position: Position to stop reading segments at; None for EOF
+
+:since: v1.0.0
+        """
+
+        self._limit = position
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._position
+    #
+#
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+import os
+
+from dpt_runtime.io_exception import IOException
+
+from .file_descriptor_cache import FileDescriptorCache
+
+class PositionalFile(object):
+    """
+"PositionalFile" provides the VFS object API used by streamers for a file
+read with "os.pread()" from a descriptor shared by the
+"FileDescriptorCache". The position is kept in this instance so that many
+streamers may read the same file concurrently without seeking.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_fileno", "_position", "_size", "_vfs_object" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, vfs_object, file_path_name):
+        """
+Constructor __init__(PositionalFile)
+
+:param vfs_object: Opened VFS object
+:param file_path_name: File path and name of the VFS object
+
+:since: v1.0.0
+        """
+
+        ( fileno, size ) = FileDescriptorCache.acquire(file_path_name)
+
+        self._fileno = fileno
+        """
+Shared file descriptor
+        """
+        self._position = 0
+        """
+Current position in the file
+        """
+        self._size = size
+        """
+File size validated by the descriptor cache
+        """
+        self._vfs_object = vfs_object
+        """
+VFS object read positionally
+        """
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the VFS object
+:since:  v1.0.0
+        """
+
+        if (name.startswith("_")): raise AttributeError(name)
+        return getattr(self._vfs_object, name)
+    #
+
+    @property
+    def implementing_instance(self):
+        """
+Returns the implementing instance.
+
+:return: (object) Implementing instance
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (self._position >= self._size)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        return self._size
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        if (self._fileno is not None):
+            try: FileDescriptorCache.release(self._fileno)
+            finally:
+                self._fileno = None
+                self._vfs_object.close()
+            #
+        #
+    #
+
+    def fileno(self):
+        """
+python.org: Return the underlying file descriptor (an integer).
+
+:return: (int) File descriptor
+:since:  v1.0.0
+        """
+
+        if (self._fileno is None): raise IOException("File is closed")
+        return self._fileno
+    #
+
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (True if (feature == "seek") else self._vfs_object.is_supported(feature))
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data
+:since:  v1.0.0
+        """
+
+        if (self._fileno is None): raise IOException("File is closed")
+        if (n is None or n < 1): n = max(0, self._size - self._position)
+
+        _return = os.pread(self._fileno, n, self._position)
+        self._position += len(_return)
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.0
+        """
+
+        if (self._fileno is None): raise IOException("File is closed")
+
+        if (hasattr(os, "preadv")): _return = os.preadv(self._fileno, [ b ], self._position)
+        else:
+            data = os.pread(self._fileno, len(b), self._position)
+
+            _return = len(data)
+            memoryview(b)[:_return] = data
+        #
+
+        self._position += _return
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        if (offset < 0): raise IOException("Invalid offset given")
+
+        self._position = offset
+        return offset
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._position
+    #
+#
@@ -17,7 +17,8 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from quopri import decodestring
+from binascii import a2b_qp
+from time import perf_counter
 
 from dpt_runtime.binary import Binary
 
@@ -43,15 +44,13 @@ Binary equal sign representation used to identify encoded bytes.
     _FILE_WRAPPED_METHODS = ( "close",
                               "is_url_supported",
                               "open_url",
-                              "seek",
-                              "set_range",
                               "tell"
                             )
     """
 File IO methods implemented by an wrapped resource.
     """
 
-    __slots__ = [ "_decoded_data" ]
+    __slots__ = [ "_decoded_data", "_encoded_data", "_is_raw_eof" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -68,14 +67,67 @@ Constructor __init__(QuotedPrintableDecoder)
 
         AbstractEncapsulated.__init__(self, streamer)
 
-        self._decoded_data = None
+        self._decoded_data = bytearray()
         """
-Already decoded data buffer
+Already decoded data buffer consumed from the front
+        """
+        self._encoded_data = bytearray()
+        """
+Encoded data of an incomplete escape sequence or soft line break carried
+over to the next read
+        """
+        self._is_raw_eof = False
+        """
+True if the encapsulated streamer reached EOF
         """
 
         self.supported_features['raw_reader'] = True
     #
 
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return (len(self._decoded_data) < 1
+                and len(self._encoded_data) < 1
+                and (self._is_raw_eof or self._wrapped_resource.is_eof)
+               )
+    #
+
+    def _decode(self, raw_data):
+        """
+Decodes the given raw data. An escape sequence or soft line break that may
+be incomplete at the end is carried over to the next read and decoded at
+EOF.
+
+:param raw_data: Quoted-printable encoded data; None if EOF
+
+:since: v1.0.0
+        """
+
+        if (raw_data is None):
+            self._is_raw_eof = True
+            encoded_size = len(self._encoded_data)
+        else:
+            self._encoded_data += raw_data
+
+            encoded_size = len(self._encoded_data)
+            escape_position = self._encoded_data.rfind(QuotedPrintableDecoder.BINARY_EQUAL_SIGN, max(0, encoded_size - 2))
+
+            if (escape_position > -1): encoded_size = escape_position
+        #
+
+        if (encoded_size > 0):
+            with memoryview(self._encoded_data) as view: self._decoded_data += a2b_qp(view[:encoded_size])
+            del self._encoded_data[:encoded_size]
+        #
+    #
+
     def raw_read(self, _bytes = None):
         """
 Reads from the current streamer session without decoding it transparently.
@@ -87,12 +139,13 @@ Reads from the current streamer session without decoding it transparently.
 :since:  v1.0.0
         """
 
-        return self._wrapped_resource.read(self, _bytes)
+        return self._wrapped_resource.read(_bytes)
     #
 
     def read(self, n = None):
         """
-python.org: Read up to n bytes from the object and return them.
+python.org: Read up to n bytes from the object and return them. At most
+the IO chunk size is decoded and returned per call if n is larger.
 
 :param n: How many bytes to read from the current position (0 means until
           EOF)
@@ -101,20 +154,63 @@ python.org: Read up to n bytes from the object and return them.
 :since:  v1.0.0
         """
 
-        raw_data = self.raw_read(n)
+        if (self._metrics is not None): read_started = perf_counter()
 
-        decoded_data = (Binary.BYTES_TYPE() if (self._decoded_data is None) else self._decoded_data)
+        io_chunk_size = self.io_chunk_size
+        if (n is None or n > io_chunk_size): n = io_chunk_size
 
-        if (raw_data is not None):
-            if (raw_data[-1:] == QuotedPrintableDecoder.BINARY_EQUAL_SIGN):
-                additional_raw_data = self.raw_read(3)
-                if (additional_raw_data is not None): raw_data += additional_raw_data
-            #
+        while ((n < 1 or len(self._decoded_data) < n) and (not self._is_raw_eof)):
+            # Decoded data is never larger than the encoded one
+            raw_data = self.raw_read(io_chunk_size if (n < 1) else min(io_chunk_size, 3 + n - len(self._decoded_data)))
+            if (raw_data is not None and len(raw_data) < 1): raw_data = None
 
-            decoded_data += decodestring(raw_data)
+            self._decode(raw_data)
         #
 
-        if (len(decoded_data) > n): self._decoded_data = decoded_data[n:]
-        return decoded_data[:n]
+        _return = self._get_buffered_data(self._decoded_data, n)
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def _reset(self):
+        """
+Resets the decoder buffers after the encapsulated position changed.
+
+:since: v1.0.0
+        """
+
+        del self._decoded_data[:]
+        del self._encoded_data[:]
+        self._is_raw_eof = False
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        self._reset()
+        return self._wrapped_resource.seek(offset)
+    #
+
+    def set_range(self, range_start, range_end):
+        """
+Define a range to be streamed.
+
+:param range_start: First byte of range
+:param range_end: Last byte of range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        self._reset()
+        return self._wrapped_resource.set_range(range_start, range_end)
     #
 #
@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from threading import Event, Thread
+
+try: from queue import Empty, Queue
+except ImportError: from Queue import Empty, Queue
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+
+class ReadAheadBuffer(object):
+    """
+"ReadAheadBuffer" provides the VFS object API used by streamers for an
+opened VFS object while a background thread keeps up to a given number of
+chunks prefetched. Prefetching is cancelled on "seek()" and "close()".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    LIMIT_REACHED = object()
+    """
+Marker queued if prefetching stopped at the limit set
+    """
+
+    __slots__ = [ "_chunk_size",
+                  "_chunks",
+                  "_data",
+                  "_data_position",
+                  "_is_eof",
+                  "_limit",
+                  "_position",
+                  "_prefetch_position",
+                  "_stop_event",
+                  "_thread",
+                  "_vfs_object"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, vfs_object, chunks, chunk_size = 65536):
+        """
+Constructor __init__(ReadAheadBuffer)
+
+:param vfs_object: Opened VFS object
+:param chunks: Maximum number of chunks prefetched
+:param chunk_size: Initial size of a chunk prefetched
+
+:since: v1.0.0
+        """
+
+        self._chunk_size = chunk_size
+        """
+Size of a chunk prefetched; updated with the size requested by "read()"
+        """
+        self._chunks = Queue(max(1, chunks))
+        """
+Bounded queue of chunks prefetched
+        """
+        self._data = None
+        """
+Data of the chunk read last
+        """
+        self._data_position = 0
+        """
+Position of the remaining data in the chunk read last
+        """
+        self._is_eof = False
+        """
+True if EOF has been reached by the prefetching thread and returned
+        """
+        self._limit = None
+        """
+Position to stop prefetching at; None for EOF
+        """
+        self._position = vfs_object.tell()
+        """
+Position of the data returned
+        """
+        self._prefetch_position = self._position
+        """
+Position of the data prefetched
+        """
+        self._stop_event = Event()
+        """
+Event set to stop the prefetching thread
+        """
+        self._thread = None
+        """
+Prefetching thread
+        """
+        self._vfs_object = vfs_object
+        """
+VFS object read ahead
+        """
+    #
+
+    def __getattr__(self, name):
+        """
+python.org: Called when an attribute lookup has not found the attribute in
+the usual places.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the VFS object read ahead
+:since:  v1.0.0
+        """
+
+        if (name.startswith("_")): raise AttributeError(name)
+        return getattr(self._vfs_object, name)
+    #
+
+    @property
+    def implementing_instance(self):
+        """
+Returns the implementing instance.
+
+:return: (object) Implementing instance
+:since:  v1.0.0
+        """
+
+        return self
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = (self._is_eof and self._data is None)
+
+        if (not _return):
+            try: _return = (self._position >= self._vfs_object.size)
+            except Exception: pass
+        #
+
+        return _return
+    #
+
+    def _cancel(self):
+        """
+Stops the prefetching thread and discards all data prefetched.
+
+:since: v1.0.0
+        """
+
+        if (self._thread is not None):
+            self._stop_event.set()
+
+            while (self._thread.is_alive()):
+                self._discard_chunks()
+                self._thread.join(0.01)
+            #
+
+            self._stop_event.clear()
+            self._thread = None
+        #
+
+        self._discard_chunks()
+        self._data = None
+        self._data_position = 0
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        try: self._cancel()
+        finally: self._vfs_object.close()
+    #
+
+    def _discard_chunks(self):
+        """
+Discards all chunks queued.
+
+:since: v1.0.0
+        """
+
+        try:
+            while (True): self._chunks.get_nowait()
+        except Empty: pass
+    #
+
+    def fileno(self):
+        """
+python.org: Return the underlying file descriptor (an integer).
+
+:since: v1.0.0
+        """
+
+        raise IOException("File descriptor is not available while reading ahead")
+    #
+
+    def _get_chunk(self):
+        """
+Returns the next chunk prefetched and starts the prefetching thread if
+required.
+
+:return: (bytes) Data; None if EOF or the limit set is reached
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        while (self._thread is not None or self._start_thread()):
+            chunk = self._chunks.get()
+
+            if (chunk is ReadAheadBuffer.LIMIT_REACHED or chunk is None or isinstance(chunk, Exception)):
+                self._thread.join()
+                self._thread = None
+
+                if (isinstance(chunk, Exception)): raise chunk
+
+                if (chunk is None):
+                    self._is_eof = True
+                    break
+                #
+            else:
+                _return = chunk
+                break
+            #
+        #
+
+        return _return
+    #
+
+    def _prefetch(self):
+        """
+Reads chunks ahead until EOF, the limit set or until stopped.
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        chunk = True
+
+        while (chunk is not None
+               and (not isinstance(chunk, Exception))
+               and chunk is not ReadAheadBuffer.LIMIT_REACHED
+               and (not self._stop_event.is_set())
+              ):
+            n = self._chunk_size
+            if (self._limit is not None): n = min(n, self._limit - self._prefetch_position)
+
+            if (n < 1): chunk = ReadAheadBuffer.LIMIT_REACHED
+            else:
+                try:
+                    chunk = self._vfs_object.read(n)
+
+                    if (chunk is not None and len(chunk) < 1): chunk = None
+                    if (chunk is not None): self._prefetch_position += len(chunk)
+                except Exception as handled_exception: chunk = handled_exception
+            #
+
+            # The queue is drained if stopped while waiting for space
+            if (not self._stop_event.is_set()): self._chunks.put(chunk)
+        #
+    #
+
+    def read(self, n = 0):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (n is None or n < 1):
+            data = [ ]
+
+            while (True):
+                chunk = self.read(self._chunk_size)
+                if (chunk is None): break
+
+                data.append(chunk)
+            #
+
+            _return = (Binary.BYTES_TYPE().join(data) if (len(data) > 0) else None)
+        else:
+            self._chunk_size = n
+
+            if (self._data is None): self._data = self._get_chunk()
+
+            if (self._data is None): _return = None
+            elif (self._data_position == 0 and n >= len(self._data)):
+                _return = self._data
+                self._data = None
+            else:
+                data_end = min(self._data_position + n, len(self._data))
+                with memoryview(self._data) as view: _return = view[self._data_position:data_end].tobytes()
+
+                if (data_end < len(self._data)): self._data_position = data_end
+                else:
+                    self._data = None
+                    self._data_position = 0
+                #
+            #
+
+            if (_return is not None): self._position += len(_return)
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read
+:since:  v1.0.0
+        """
+
+        _return = 0
+
+        view = memoryview(b)
+        data = self.read(len(view))
+
+        if (data is not None):
+            _return = len(data)
+            view[:_return] = data
+        #
+
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        self._cancel()
+
+        self._is_eof = False
+        self._limit = None
+
+        self._position = self._vfs_object.seek(offset)
+        self._prefetch_position = self._position
+
+        return self._position
+    #
+
+    def set_limit(self, position):
+        """
+Sets the position to stop prefetching at.
+
+:param position: Position to stop prefetching at; None for EOF
+
+:since: v1.0.0
+        """
+
+        self._limit = position
+    #
+
+    def _start_thread(self):
+        """
+Starts the prefetching thread if EOF or the limit set has not been
+reached.
+
+:return: (bool) True if started
+:since:  v1.0.0
+        """
+
+        _return = False
+
+        if ((not self._is_eof) and (self._limit is None or self._prefetch_position < self._limit)):
+            self._thread = Thread(target = self._prefetch, name = "pas_streamer read-ahead")
+            self._thread.daemon = True
+            self._thread.start()
+
+            _return = True
+        #
+
+        return _return
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._position
+    #
+#
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+from copy import copy
+from threading import local
+
+from dpt_runtime.value_exception import ValueException
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+
+from .abstract import Abstract
+
+class StreamerPool(object):
+    """
+"StreamerPool" hands out reset streamer instances of one class to avoid
+the construction cost for each request. Streamers are only returned to the
+pool with "put()" as they are closed implicitly at EOF while iterating.
+Reusable per-thread read buffers are provided to be filled by the pooled
+streamers.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_buffers", "created", "discarded", "_lock", "reused", "size_max", "_streamer_class", "_streamer_kwargs", "_streamers" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, streamer_class, size_max = None, **kwargs):
+        """
+Constructor __init__(StreamerPool)
+
+:param streamer_class: Streamer class instantiated
+:param size_max: Maximum number of idle streamers kept
+:param kwargs: Keyword arguments given to the streamer constructor
+
+:since: v1.0.0
+        """
+
+        if (not issubclass(streamer_class, Abstract)): raise ValueException("Given streamer class is not supported")
+
+        self._buffers = local()
+        """
+Thread-local read buffers
+        """
+        self.created = 0
+        """
+Number of streamers created
+        """
+        self.discarded = 0
+        """
+Number of streamers discarded because the pool was full
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock keeping the number of idle streamers within the maximum
+        """
+        self.reused = 0
+        """
+Number of streamers handed out again
+        """
+        self.size_max = (int(Settings.get("pas_streamer_pool_size", 64)) if (size_max is None) else size_max)
+        """
+Maximum number of idle streamers kept
+        """
+        self._streamer_class = streamer_class
+        """
+Streamer class instantiated
+        """
+        self._streamer_kwargs = kwargs
+        """
+Keyword arguments given to the streamer constructor
+        """
+        self._streamers = deque()
+        """
+Idle streamers
+        """
+    #
+
+    @property
+    def size(self):
+        """
+Returns the number of idle streamers in the pool.
+
+:return: (int) Number of idle streamers
+:since:  v1.0.0
+        """
+
+        return len(self._streamers)
+    #
+
+    def get(self):
+        """
+Returns a reset streamer. It is returned to the pool with "put()" and must
+not be used afterwards.
+
+:return: (object) Streamer instance
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        # "deque.pop()" is atomic and used without an additional lock
+        try:
+            _return = self._streamers.pop()
+            self.reused += 1
+        except IndexError:
+            _return = self._streamer_class(**self._streamer_kwargs)
+
+            _return._pool_defaults = StreamerPool._get_state(_return)
+
+            self.created += 1
+        #
+
+        _return._pool = self
+        return _return
+    #
+
+    def get_buffer(self, size):
+        """
+Returns the read buffer of the current thread with at least the given
+size. Its content is only valid until the buffer is requested again by
+the same thread.
+
+:param size: Buffer size in bytes
+
+:return: (bytearray) Read buffer
+:since:  v1.0.0
+        """
+
+        _return = getattr(self._buffers, "buffer", None)
+
+        if (_return is None or len(_return) < size):
+            _return = bytearray(size)
+            self._buffers.buffer = _return
+        #
+
+        return _return
+    #
+
+    def put(self, streamer):
+        """
+Closes and resets the given streamer and keeps it for reuse if the pool
+is not full.
+
+:param streamer: Streamer instance taken from this pool
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (streamer._pool is not self): raise ValueException("Given streamer is not in use from this pool")
+
+        streamer._pool = None
+        streamer.close()
+
+        StreamerPool._reset(streamer)
+
+        with self._lock:
+            if (len(self._streamers) < self.size_max): self._streamers.append(streamer)
+            else: self.discarded += 1
+        #
+    #
+
+    def read(self, streamer, n = None):
+        """
+Reads up to n bytes from the given streamer into the read buffer of the
+current thread.
+
+:param streamer: Streamer instance
+:param n: How many bytes to read from the current position
+
+:return: (memoryview) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (n is None): n = streamer.io_chunk_size
+
+        with memoryview(self.get_buffer(n)) as view: _return = streamer.read_into_view(view[:n])
+        return _return
+    #
+
+    @staticmethod
+    def _get_state(streamer):
+        """
+Returns the values of all attributes of the given streamer. Mutable
+containers are copied.
+
+:param streamer: Streamer instance
+
+:return: (dict) Attribute values
+:since:  v1.0.0
+        """
+
+        _return = { }
+
+        for _class in type(streamer).__mro__:
+            slots = _class.__dict__.get("__slots__", ( ))
+            if (isinstance(slots, str)): slots = ( slots, )
+
+            for name in slots:
+                if (name not in ( "__dict__", "__weakref__", "_pool", "_pool_defaults" )):
+                    try: _return[name] = StreamerPool._get_value_copy(object.__getattribute__(streamer, name))
+                    except AttributeError: pass
+                #
+            #
+        #
+
+        if (hasattr(streamer, "__dict__")):
+            for name, value in streamer.__dict__.items(): _return[name] = StreamerPool._get_value_copy(value)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_value_copy(value):
+        """
+Returns a copy of the given value if it is a mutable container.
+
+:param value: Attribute value
+
+:return: (mixed) Value or its copy
+:since:  v1.0.0
+        """
+
+        return (copy(value) if (isinstance(value, ( bytearray, dict, list, set ))) else value)
+    #
+
+    @staticmethod
+    def _reset(streamer):
+        """
+Resets the given closed streamer to the state after its construction by
+restoring every attribute set by the constructor.
+
+:param streamer: Streamer instance
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        for name, value in streamer._pool_defaults.items():
+            object.__setattr__(streamer, name, StreamerPool._get_value_copy(value))
+        #
+    #
+#
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from time import monotonic
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_runtime.value_exception import ValueException
+from dpt_settings import Settings
+from dpt_threading.thread_lock import ThreadLock
+from dpt_vfs import Implementation
+
+class StreamerRegistry(object):
+    """
+"StreamerRegistry" maps URL schemes to streamer classes. It caches the VFS
+implementation resolved for a scheme and the validity of recently checked
+URLs. "open_any()" returns an opened streamer for an URL in one pass.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _streamer_classes = None
+    """
+Streamer classes registered by URL scheme
+    """
+    _url_validity = OrderedDict()
+    """
+LRU cache of "(is_valid, monotonic_time)" tuples by URL
+    """
+    _vfs_classes = OrderedDict()
+    """
+LRU cache of VFS object classes by URL scheme; None if not defined
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @staticmethod
+    def clear():
+        """
+Removes all cached VFS implementations and validity results.
+
+:since: v1.0.0
+        """
+
+        with StreamerRegistry._lock:
+            StreamerRegistry._url_validity.clear()
+            StreamerRegistry._vfs_classes.clear()
+        #
+    #
+
+    @staticmethod
+    def get_scheme(url):
+        """
+Returns the lower-case scheme of the given URL.
+
+:param url: URL
+
+:return: (str) URL scheme; None if the URL is invalid
+:since:  v1.0.0
+        """
+
+        url_data = Binary.str(url).split("://", 1)
+        return (None if (len(url_data) < 2) else url_data[0].lower())
+    #
+
+    @staticmethod
+    def get_streamer_class(scheme):
+        """
+Returns the streamer class for the given URL scheme. Schemes not
+registered are streamed with "VfsBased" if a VFS implementation exists.
+
+:param scheme: URL scheme
+
+:return: (object) Streamer class; None if not supported
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        if (scheme is not None):
+            StreamerRegistry._init_streamer_classes()
+            _return = StreamerRegistry._streamer_classes.get(scheme.lower())
+        #
+
+        if (_return is None and scheme is not None and StreamerRegistry.get_vfs_class(scheme.lower()) is not None):
+            from .vfs_based import VfsBased
+            _return = VfsBased
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def get_url_validity(url):
+        """
+Returns the cached validity of the given URL if it has been checked
+within the last "pas_streamer_registry_validity_ttl" seconds.
+
+:param url: URL
+
+:return: (bool) True if valid; None if unknown
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        with StreamerRegistry._lock:
+            validity = StreamerRegistry._url_validity.get(url)
+
+            if (validity is not None):
+                if (monotonic() - validity[1] > float(Settings.get("pas_streamer_registry_validity_ttl", 1.0))):
+                    del StreamerRegistry._url_validity[url]
+                else: _return = validity[0]
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def get_vfs_class(scheme):
+        """
+Returns the VFS object class implementing the given URL scheme.
+
+:param scheme: URL scheme
+
+:return: (object) VFS object class; None if not defined
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        with StreamerRegistry._lock:
+            is_cached = (scheme in StreamerRegistry._vfs_classes)
+
+            if (is_cached):
+                StreamerRegistry._vfs_classes.move_to_end(scheme)
+                _return = StreamerRegistry._vfs_classes[scheme]
+            #
+        #
+
+        if (not is_cached):
+            # Concurrent first lookups are serialized as they are not thread-safe
+            with StreamerRegistry._lock:
+                if (scheme in StreamerRegistry._vfs_classes): _return = StreamerRegistry._vfs_classes[scheme]
+                else:
+                    try:
+                        _return = Implementation.get_class(scheme)
+
+                        StreamerRegistry._vfs_classes[scheme] = _return
+                        StreamerRegistry._trim(StreamerRegistry._vfs_classes)
+                    except IOException: pass
+                #
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _init_streamer_classes():
+        """
+Registers the default streamer classes if not done already.
+
+:since: v1.0.0
+        """
+
+        if (StreamerRegistry._streamer_classes is None):
+            from .file import File
+
+            with StreamerRegistry._lock:
+                if (StreamerRegistry._streamer_classes is None): StreamerRegistry._streamer_classes = { "file": File }
+            #
+        #
+    #
+
+    @staticmethod
+    def load_vfs_url(url, readonly = True):
+        """
+Returns the opened VFS object for the given URL using the cached VFS
+implementation.
+
+:param url: URL
+:param readonly: Open object in readonly mode
+
+:return: (object) VFS object
+:since:  v1.0.0
+        """
+
+        url = Binary.str(url)
+        scheme = StreamerRegistry.get_scheme(url)
+
+        vfs_class = (None if (scheme is None) else StreamerRegistry.get_vfs_class(scheme))
+
+        if (vfs_class is None): raise IOException("VFS object not defined for URL '{0}'".format(url))
+
+        _return = vfs_class()
+        _return.open(url, readonly)
+
+        return _return
+    #
+
+    @staticmethod
+    def open_any(url, **kwargs):
+        """
+Returns an opened streamer of the class registered for the scheme of the
+given URL.
+
+:param url: URL to be streamed
+:param kwargs: Keyword arguments given to the streamer constructor
+
+:return: (object) Streamer instance; None if not supported or invalid
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        streamer_class = StreamerRegistry.get_streamer_class(StreamerRegistry.get_scheme(url))
+
+        if (streamer_class is not None and StreamerRegistry.get_url_validity(url) is not False):
+            streamer = streamer_class(**kwargs)
+
+            if (streamer.open_url(url)): _return = streamer
+            else: StreamerRegistry.set_url_validity(url, False)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def register(scheme, streamer_class):
+        """
+Registers the streamer class for the given URL scheme.
+
+:param scheme: URL scheme
+:param streamer_class: Streamer class
+
+:since: v1.0.0
+        """
+
+        from .abstract import Abstract
+
+        if (not issubclass(streamer_class, Abstract)): raise ValueException("Given streamer class is not supported")
+
+        StreamerRegistry._init_streamer_classes()
+        with StreamerRegistry._lock: StreamerRegistry._streamer_classes[scheme.lower()] = streamer_class
+    #
+
+    @staticmethod
+    def set_url_validity(url, is_valid):
+        """
+Caches the validity of the given URL.
+
+:param url: URL
+:param is_valid: True if valid
+
+:since: v1.0.0
+        """
+
+        with StreamerRegistry._lock:
+            StreamerRegistry._url_validity[url] = ( is_valid, monotonic() )
+            StreamerRegistry._url_validity.move_to_end(url)
+
+            StreamerRegistry._trim(StreamerRegistry._url_validity)
+        #
+    #
+
+    @staticmethod
+    def _trim(cache):
+        """
+Removes the least recently used entries exceeding the
+"pas_streamer_registry_cache_size" setting. The lock must be held while
+calling this method.
+
+:param cache: LRU cache (OrderedDict)
+
+:since: v1.0.0
+        """
+
+        size_max = int(Settings.get("pas_streamer_registry_cache_size", 1024))
+        while (len(cache) > size_max): cache.popitem(last = False)
+    #
+
+    @staticmethod
+    def unregister(scheme):
+        """
+Removes the streamer class registered for the given URL scheme.
+
+:param scheme: URL scheme
+
+:since: v1.0.0
+        """
+
+        StreamerRegistry._init_streamer_classes()
+        with StreamerRegistry._lock: StreamerRegistry._streamer_classes.pop(scheme.lower(), None)
+    #
+#
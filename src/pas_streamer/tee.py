@@ -0,0 +1,510 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+from threading import Condition
+from time import monotonic, perf_counter
+
+from dpt_runtime.binary import Binary
+from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
+
+from .abstract_encapsulated import AbstractEncapsulated
+from .tee_branch import TeeBranch
+
+class Tee(AbstractEncapsulated):
+    """
+"Tee" reads the encapsulated streamer once and delivers each chunk to the
+tee itself, to all branches created with "create_branch()" and to all
+callbacks added. Chunks are shared without copying them. Consumers ahead of
+others wait as soon as the chunks buffered for slower ones reach the
+buffer size.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _FILE_WRAPPED_METHODS = ( "is_url_supported", )
+    """
+File IO methods implemented by an wrapped resource.
+    """
+
+    TEE_CURSOR_ID = 0
+    """
+Cursor ID of the tee itself
+    """
+
+    __slots__ = [ "_buffer_size",
+                  "_buffered_size",
+                  "_callbacks",
+                  "_chunks",
+                  "_chunks_index",
+                  "_condition",
+                  "_cursor_id_next",
+                  "_cursors",
+                  "_is_source_eof",
+                  "_is_source_reading",
+                  "_position_start",
+                  "_timeout"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, streamer, buffer_size = None):
+        """
+Constructor __init__(Tee)
+
+:param streamer: Encapsulated streamer instance
+:param buffer_size: Maximum number of bytes buffered for slower consumers
+
+:since: v1.0.0
+        """
+
+        AbstractEncapsulated.__init__(self, streamer)
+
+        if (buffer_size is None): buffer_size = int(Settings.get("pas_streamer_tee_buffer_size", 4194304))
+
+        self._buffer_size = max(1, buffer_size)
+        """
+Maximum number of bytes buffered for slower consumers
+        """
+        self._buffered_size = 0
+        """
+Number of bytes buffered
+        """
+        self._callbacks = [ ]
+        """
+Callbacks called with each chunk read
+        """
+        self._chunks = deque()
+        """
+Chunks buffered until read by all consumers
+        """
+        self._chunks_index = 0
+        """
+Index of the first chunk buffered
+        """
+        self._condition = Condition()
+        """
+Condition notified if chunks have been read or released
+        """
+        self._cursor_id_next = 1 + Tee.TEE_CURSOR_ID
+        """
+Cursor ID of the next branch created
+        """
+        self._cursors = { Tee.TEE_CURSOR_ID: [ 0, None, 0 ] }
+        """
+Dictionary of consumer cursors as lists of the index of the next chunk,
+remaining data of the chunk read last and the number of bytes returned
+        """
+        self._is_source_eof = False
+        """
+True if the encapsulated streamer reached EOF
+        """
+        self._is_source_reading = False
+        """
+True while a consumer reads from the encapsulated streamer
+        """
+        self._position_start = None
+        """
+Position of the encapsulated streamer before the first chunk has been read
+        """
+        self._timeout = float(Settings.get("pas_streamer_tee_timeout", 30))
+        """
+Seconds to wait for slower consumers before timing out
+        """
+
+        self.supported_features['seeking'] = False
+    #
+
+    @property
+    def buffer_size(self):
+        """
+Returns the maximum number of bytes buffered for slower consumers.
+
+:return: (int) Buffer size in bytes
+:since:  v1.0.0
+        """
+
+        return self._buffer_size
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        return self._is_cursor_eof(Tee.TEE_CURSOR_ID)
+    #
+
+    def add_callback(self, callback):
+        """
+Adds a callback called with each chunk read from the encapsulated streamer
+and with None at EOF. Callbacks are called in the thread reading the chunk
+and are expected to return quickly.
+
+:param callback: Python callback
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            if (self._is_source_started()): raise IOException("Callbacks can not be added after reading started")
+            self._callbacks.append(callback)
+        #
+    #
+
+    def _add_cursor(self):
+        """
+Adds a cursor for a new branch.
+
+:return: (int) Cursor ID
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            if (self._is_source_started()): raise IOException("Branches can not be created after reading started")
+
+            _return = self._cursor_id_next
+            self._cursor_id_next += 1
+
+            self._cursors[_return] = [ 0, None, 0 ]
+        #
+
+        return _return
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        self._remove_cursor(Tee.TEE_CURSOR_ID)
+    #
+
+    def create_branch(self):
+        """
+Creates a branch streamer receiving all chunks read from the encapsulated
+streamer. Branches must be created before reading starts.
+
+:return: (object) Branch streamer
+:since:  v1.0.0
+        """
+
+        return TeeBranch(self)
+    #
+
+    def _get_chunk(self, cursor):
+        """
+Returns the next chunk for the given cursor. Chunks are read from the
+encapsulated streamer if all buffered ones have been returned. The
+condition must be held while calling this method.
+
+:param cursor: Consumer cursor
+
+:return: (object) Chunk; None if EOF
+:since:  v1.0.0
+        """
+
+        _return = cursor[1]
+        timeout_at = None
+
+        if (_return is not None): cursor[1] = None
+        else:
+            while (True):
+                index = cursor[0] - self._chunks_index
+
+                if (index < len(self._chunks)):
+                    _return = self._chunks[index]
+                    cursor[0] += 1
+
+                    self._trim()
+                    break
+                elif (self._is_source_eof): break
+                elif (self._is_source_reading): self._condition.wait()
+                elif (self._buffered_size >= self._buffer_size):
+                    # Backpressure: wait for slower consumers releasing buffered chunks
+                    if (timeout_at is None): timeout_at = monotonic() + self._timeout
+                    timeout = timeout_at - monotonic()
+
+                    if (timeout <= 0 or (not self._condition.wait(timeout))):
+                        raise IOException("Timeout while waiting for slower tee consumers")
+                    #
+                else: self._read_source()
+            #
+        #
+
+        return _return
+    #
+
+    def _is_cursor_eof(self, cursor_id):
+        """
+Checks if the consumer of the given cursor has reached EOF.
+
+:param cursor_id: Cursor ID
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            cursor = self._cursors.get(cursor_id)
+
+            return (cursor is None
+                    or (cursor[1] is None
+                        and self._is_source_eof
+                        and cursor[0] >= self._chunks_index + len(self._chunks)
+                       )
+                   )
+        #
+    #
+
+    def _is_source_started(self):
+        """
+Returns true if reading from the encapsulated streamer started. The
+condition must be held while calling this method.
+
+:return: (bool) True if started
+:since:  v1.0.0
+        """
+
+        return (self._position_start is not None)
+    #
+
+    def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them. Chunks are
+shared with all consumers and returned as "memoryview" slices if only
+partially read.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (object) Data as bytes-like object; None if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        _return = self._read(Tee.TEE_CURSOR_ID, n)
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def _read(self, cursor_id, n = None):
+        """
+Reads up to n bytes for the consumer of the given cursor. Partial chunks
+are returned as "memoryview" slices.
+
+:param cursor_id: Cursor ID
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (object) Data; None if EOF
+:since:  v1.0.0
+        """
+
+        if (n is None): n = self.io_chunk_size
+
+        with self._condition:
+            cursor = self._cursors.get(cursor_id)
+            if (cursor is None): raise IOException("Streamer resource is invalid")
+
+            if (n < 1):
+                data = [ ]
+
+                while (True):
+                    chunk = self._get_chunk(cursor)
+                    if (chunk is None): break
+
+                    data.append(chunk)
+                #
+
+                _return = (Binary.BYTES_TYPE().join(data) if (len(data) > 0) else None)
+            else:
+                _return = self._get_chunk(cursor)
+
+                if (_return is not None and n < len(_return)):
+                    view = memoryview(_return)
+
+                    _return = view[:n]
+                    cursor[1] = view[n:]
+                #
+            #
+
+            if (_return is not None): cursor[2] += len(_return)
+        #
+
+        return _return
+    #
+
+    def _read_source(self):
+        """
+Reads the next chunk from the encapsulated streamer and calls all
+callbacks with it. The condition must be held while calling this method
+and is released while reading.
+
+:since: v1.0.0
+        """
+
+        if (self._position_start is None): self._position_start = self._wrapped_resource.tell()
+
+        self._is_source_reading = True
+        self._condition.release()
+
+        try:
+            chunk = self._wrapped_resource.read()
+            if (chunk is not None and len(chunk) < 1): chunk = None
+
+            for callback in self._callbacks: callback(chunk)
+        finally:
+            self._condition.acquire()
+
+            self._is_source_reading = False
+            self._condition.notify_all()
+        #
+
+        if (chunk is None): self._is_source_eof = True
+        else:
+            self._chunks.append(chunk)
+            self._buffered_size += len(chunk)
+        #
+    #
+
+    def _remove_cursor(self, cursor_id):
+        """
+Removes the cursor of a consumer closed. The encapsulated streamer is
+closed after the last consumer has been closed.
+
+:param cursor_id: Cursor ID
+
+:since: v1.0.0
+        """
+
+        with self._condition:
+            is_removed = (self._cursors.pop(cursor_id, None) is not None)
+
+            if (is_removed):
+                self._trim()
+                is_last_cursor = (len(self._cursors) < 1)
+            #
+        #
+
+        if (is_removed and is_last_cursor): self._wrapped_resource.close()
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset. Only
+supported before reading started.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            if (self._is_source_started()): raise IOException("Tee consumers can not be seeked after reading started")
+            return self._wrapped_resource.seek(offset)
+        #
+    #
+
+    def set_range(self, range_start, range_end):
+        """
+Define a range to be streamed. Only supported before reading started.
+
+:param range_start: First byte of range
+:param range_end: Last byte of range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            if (self._is_source_started()): raise IOException("Tee consumers can not be seeked after reading started")
+            return self._wrapped_resource.set_range(range_start, range_end)
+        #
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        return self._tell(Tee.TEE_CURSOR_ID)
+    #
+
+    def _tell(self, cursor_id):
+        """
+Returns the stream position of the consumer of the given cursor.
+
+:param cursor_id: Cursor ID
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        with self._condition:
+            cursor = self._cursors.get(cursor_id)
+            if (cursor is None): raise IOException("Streamer resource is invalid")
+
+            return (self._wrapped_resource.tell() if (self._position_start is None) else self._position_start + cursor[2])
+        #
+    #
+
+    def _trim(self):
+        """
+Releases all chunks returned to every consumer and notifies consumers
+waiting for buffer space. The condition must be held while calling this
+method.
+
+:since: v1.0.0
+        """
+
+        cursor_index = min((cursor[0] for cursor in self._cursors.values()), default = None)
+        is_released = False
+
+        while (len(self._chunks) > 0 and (cursor_index is None or cursor_index > self._chunks_index)):
+            self._buffered_size -= len(self._chunks.popleft())
+            self._chunks_index += 1
+
+            is_released = True
+        #
+
+        if (is_released): self._condition.notify_all()
+    #
+#
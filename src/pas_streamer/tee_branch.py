@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(pasStreamerVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from time import perf_counter
+
+from dpt_runtime.io_exception import IOException
+
+from .abstract import Abstract
+
+class TeeBranch(Abstract):
+    """
+"TeeBranch" streams all chunks read by a "Tee" from its encapsulated
+streamer as an additional consumer.
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_cursor_id", "_tee" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, tee):
+        """
+Constructor __init__(TeeBranch)
+
+:param tee: Tee instance
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        Abstract.__init__(self)
+
+        self._tee = None
+        """
+Tee instance; None if closed
+        """
+
+        self._cursor_id = tee._add_cursor()
+        """
+Cursor ID of this branch
+        """
+
+        self._tee = tee
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the resource has reached EOF.
+
+:return: (bool) True if EOF
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        return (True if (self._tee is None) else self._tee._is_cursor_eof(self._cursor_id))
+    #
+
+    @property
+    def is_resource_valid(self):
+        """
+Returns true if the streamer resource is available.
+
+:return: (bool) True on success
+:since:  v1.0.0
+        """
+
+        return (self._tee is not None)
+    #
+
+    @property
+    def size(self):
+        """
+Returns the size in bytes.
+
+:return: (int) Size in bytes
+:since:  v1.0.0
+        """
+
+        if (self._tee is None): raise IOException("Streamer resource is invalid")
+        return self._tee.size
+    #
+
+    def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        tee = self._tee
+
+        if (tee is not None):
+            self._tee = None
+            tee._remove_cursor(self._cursor_id)
+        #
+    #
+
+    def read(self, n = None):
+        """
+python.org: Read up to n bytes from the object and return them. Chunks are
+shared with all consumers and returned as "memoryview" slices if only
+partially read.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (object) Data as bytes-like object; None if EOF
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (self._metrics is not None): read_started = perf_counter()
+
+        if (self._tee is None): raise IOException("Streamer resource is invalid")
+        _return = self._tee._read(self._cursor_id, (self.io_chunk_size if (n is None) else n))
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.0.0
+        """
+
+        raise IOException("Tee branches can not be seeked")
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.0.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (self._tee is None): raise IOException("Streamer resource is invalid")
+        return self._tee._tell(self._cursor_id)
+    #
+#
@@ -17,15 +17,25 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-from dpt_runtime.io_exception import IOException
-from dpt_vfs import Implementation
+from stat import S_ISREG
+from time import perf_counter
+import os
 
+from dpt_runtime.io_exception import IOException
+from dpt_settings import Settings
 from .abstract import Abstract
+from .memory_mapped_file import MemoryMappedFile
+from .parallel_range_reader import ParallelRangeReader
+from .positional_file import PositionalFile
+from .read_ahead_buffer import ReadAheadBuffer
+from .streamer_registry import StreamerRegistry
 
 class VfsBased(Abstract):
     """
 The "VfsBased" streamer integrates VFS implementations with data streaming
-capabilities.
+capabilities. Fresh pre-compressed siblings (e.g. "foo.js.br" for
+"foo.js") are opened instead if their content coding is accepted. Data
+may be read ahead by a background thread.
 
 :author:     direct Netware Group et al.
 :copyright:  (C) direct Netware Group - All rights reserved
@@ -36,40 +46,116 @@ capabilities.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "_wrapped_resource" ]
+    CONTENT_CODING_EXTENSIONS = ( ( "br", ".br" ), ( "gzip", ".gz" ) )
+    """
+Content codings and file extensions of pre-compressed siblings in order of
+preference
+    """
+
+    __slots__ = [ "_accepted_content_codings", "_content_coding", "_parallel_read_workers", "_read_ahead_chunks", "_supported_vfs_object", "_wrapped_resource" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, timeout_retries = 5):
+    def __init__(self, timeout_retries = 5, single_owner = False, accepted_content_codings = None):
         """
-Constructor __init__(File)
+Constructor __init__(VfsBased)
 
 :param timeout_retries: Retries before timing out
+:param single_owner: True if the streamer is only ever used by a single
+                     thread and thread safety locking should be skipped
+:param accepted_content_codings: Content codings (e.g. "br" and "gzip")
+                                 of pre-compressed siblings accepted
 
 :since: v1.0.0
         """
 
-        Abstract.__init__(self, timeout_retries)
+        Abstract.__init__(self, timeout_retries, single_owner)
+
+        self._accepted_content_codings = None
+        """
+Content codings of pre-compressed siblings accepted
+        """
+        self._content_coding = None
+        """
+Content coding of the file opened; None if not pre-compressed
+        """
+        self._parallel_read_workers = int(Settings.get("pas_streamer_parallel_read_workers", 0))
+        """
+Number of worker threads reading segments of the active range in parallel
+        """
+        self._read_ahead_chunks = int(Settings.get("pas_streamer_read_ahead_chunks", 0))
+        """
+Number of chunks read ahead by a background thread
+        """
+        self._supported_vfs_object = None
+        """
+Tuple of the URL and VFS object opened by "is_url_supported()"
+        """
 
         self._wrapped_resource = None
         """
 Active file resource
         """
+
+        self.supported_features['zero_copy_transfer'] = self._supports_zero_copy_transfer
+
+        if (accepted_content_codings is not None): self.accepted_content_codings = accepted_content_codings
+    #
+
+    @property
+    def accepted_content_codings(self):
+        """
+Returns the content codings of pre-compressed siblings accepted.
+
+:return: (set) Content codings accepted
+:since:  v1.0.0
+        """
+
+        return (set() if (self._accepted_content_codings is None) else set(self._accepted_content_codings))
+    #
+
+    @accepted_content_codings.setter
+    def accepted_content_codings(self, content_codings):
+        """
+Sets the content codings of pre-compressed siblings accepted.
+
+:param content_codings: Content codings accepted (e.g. "br" and "gzip")
+
+:since: v1.0.0
+        """
+
+        content_codings = set(content_coding.strip().lower() for content_coding in content_codings)
+        if ("x-gzip" in content_codings): content_codings.add("gzip")
+
+        self._accepted_content_codings = (frozenset(content_codings) if (len(content_codings) > 0) else None)
+    #
+
+    @property
+    def content_coding(self):
+        """
+Returns the content coding of the file opened.
+
+:return: (str) Content coding; None if not pre-compressed
+:since:  v1.0.0
+        """
+
+        return self._content_coding
     #
 
     @property
     def is_eof(self):
         """
-Checks if the resource has reached EOF.
+Checks if the resource has reached EOF or the data of the range set has
+been read completely.
 
 :return: (bool) True if EOF
 :since:  v1.0.0
         """
 
         with self._lock:
-            return (True if (self._wrapped_resource is None) else self._wrapped_resource.is_eof)
+            return (True if (self._wrapped_resource is None or self.stream_size == 0) else self._wrapped_resource.is_eof)
         #
     #
 
@@ -85,6 +171,60 @@ Returns true if the streamer resource is available.
         with self._lock: return (self._wrapped_resource is not None)
     #
 
+    @property
+    def parallel_read_workers(self):
+        """
+Returns the number of worker threads reading segments of the active range
+in parallel.
+
+:return: (int) Number of worker threads; 0 if disabled
+:since:  v1.0.0
+        """
+
+        return self._parallel_read_workers
+    #
+
+    @parallel_read_workers.setter
+    def parallel_read_workers(self, workers):
+        """
+Sets the number of worker threads reading segments of the active range in
+parallel for URLs opened afterwards. Memory mapped files are not read in
+parallel and a single worker disables it.
+
+:param workers: Number of worker threads; 0 to disable
+
+:since: v1.0.0
+        """
+
+        self._parallel_read_workers = max(0, workers)
+    #
+
+    @property
+    def read_ahead_chunks(self):
+        """
+Returns the number of chunks read ahead by a background thread.
+
+:return: (int) Number of chunks; 0 if disabled
+:since:  v1.0.0
+        """
+
+        return self._read_ahead_chunks
+    #
+
+    @read_ahead_chunks.setter
+    def read_ahead_chunks(self, chunks):
+        """
+Sets the number of chunks read ahead by a background thread for URLs
+opened afterwards. Memory mapped files are not read ahead.
+
+:param chunks: Number of chunks; 0 to disable
+
+:since: v1.0.0
+        """
+
+        self._read_ahead_chunks = max(0, chunks)
+    #
+
     @property
     def size(self):
         """
@@ -107,6 +247,8 @@ python.org: Flush and close this stream.
         """
 
         with self._lock:
+            if (self._supported_vfs_object is not None): self._get_supported_vfs_object(None)
+
             if (self._wrapped_resource is not None):
                 if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.close()- (#echo(__LINE__)#)", self, context = "pas_streamer")
 
@@ -119,6 +261,206 @@ python.org: Flush and close this stream.
         #
     #
 
+    def _get_implementing_file(self, vfs_object = None):
+        """
+Returns the file object implementing the VFS object if exposed.
+
+:param vfs_object: VFS object to be used instead of the active one
+
+:return: (object) File object; None if not available
+:since:  v1.0.0
+        """
+
+        if (vfs_object is None): vfs_object = self._wrapped_resource
+
+        _return = getattr(vfs_object, "implementing_instance", None)
+        if (_return is not None): _return = getattr(_return, "handle", _return)
+
+        return _return
+    #
+
+    def _get_memory_mapped_file(self, vfs_object):
+        """
+Returns a memory map for the given VFS object if its size reaches the
+"pas_streamer_mmap_threshold" setting and it exposes a real file
+descriptor. Smaller files are read by the VFS object directly.
+
+:param vfs_object: Opened VFS object
+
+:return: (object) Memory mapped file or the given VFS object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = vfs_object
+        mmap_threshold = int(Settings.get("pas_streamer_mmap_threshold", 0))
+
+        if (mmap_threshold > 0 and vfs_object.size >= mmap_threshold):
+            try:
+                implementing_file = self._get_implementing_file(vfs_object)
+                if (implementing_file is not None): _return = MemoryMappedFile(vfs_object, implementing_file)
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.debug(handled_exception, context = "pas_streamer")
+            #
+        #
+
+        return _return
+    #
+
+    def _get_parallel_range_reader(self, vfs_object):
+        """
+Returns a reader with worker threads reading segments of the given VFS
+object in parallel if more than one worker is configured.
+
+:param vfs_object: Opened VFS object
+
+:return: (object) Parallel range reader or the given VFS object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = vfs_object
+
+        if (self._parallel_read_workers > 1
+            and (vfs_object.is_supported("filesystem_path_name") or vfs_object.is_supported("seek"))
+           ):
+            try: _return = ParallelRangeReader(vfs_object, self._parallel_read_workers)
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.debug(handled_exception, context = "pas_streamer")
+            #
+        #
+
+        return _return
+    #
+
+    def _get_positional_file(self, vfs_object):
+        """
+Returns a positionally read file sharing a cached descriptor for the given
+VFS object if the "pas_streamer_fd_cache_size" setting is larger than 0
+and the VFS object is located in the file system.
+
+:param vfs_object: Opened VFS object
+
+:return: (object) Positionally read file or the given VFS object
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = vfs_object
+
+        if (int(Settings.get("pas_streamer_fd_cache_size", 0)) > 0 and vfs_object.is_supported("filesystem_path_name")):
+            try: _return = PositionalFile(vfs_object, vfs_object.filesystem_path_name)
+            except Exception as handled_exception:
+                if (self._log_handler is not None): self._log_handler.debug(handled_exception, context = "pas_streamer")
+            #
+        #
+
+        return _return
+    #
+
+    def _get_precompressed_vfs_object(self, url, vfs_object):
+        """
+Returns the preferred pre-compressed sibling of the given VFS object with
+an accepted content coding. Siblings are only used if they are not older
+and smaller than the given file.
+
+:param url: URL of the given VFS object
+:param vfs_object: Opened VFS object
+
+:return: (tuple) Content coding and opened VFS object; None if not
+         available
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = None
+
+        if (self._accepted_content_codings is not None and vfs_object.is_file):
+            url_path_end = len(url)
+
+            for separator in ( "?", "#" ):
+                position = url.find(separator)
+                if (-1 < position < url_path_end): url_path_end = position
+            #
+
+            for content_coding, extension in VfsBased.CONTENT_CODING_EXTENSIONS:
+                if (content_coding not in self._accepted_content_codings): continue
+
+                sibling_url = url[:url_path_end] + extension + url[url_path_end:]
+
+                try:
+                    sibling_vfs_object = StreamerRegistry.load_vfs_url(sibling_url)
+
+                    if (sibling_vfs_object.is_valid):
+                        if (sibling_vfs_object.is_file
+                            and sibling_vfs_object.time_updated >= vfs_object.time_updated
+                            and 0 < sibling_vfs_object.size < vfs_object.size
+                           ):
+                            _return = ( content_coding, sibling_vfs_object )
+                            break
+                        #
+
+                        sibling_vfs_object.close()
+                    #
+                except Exception as handled_exception:
+                    if (self._log_handler is not None): self._log_handler.debug(handled_exception, context = "pas_streamer")
+                #
+            #
+        #
+
+        return _return
+    #
+
+    def _get_supported_vfs_object(self, url):
+        """
+Returns the VFS object opened by a preceding "is_url_supported()" call for
+the given URL. VFS objects opened for other URLs are closed.
+
+:param url: URL to be streamed
+
+:return: (object) VFS object; None if not available
+:since:  v1.0.0
+        """
+
+        _return = None
+
+        supported_vfs_object = self._supported_vfs_object
+        self._supported_vfs_object = None
+
+        if (supported_vfs_object is not None):
+            if (supported_vfs_object[0] == url): _return = supported_vfs_object[1]
+            else: supported_vfs_object[1].close()
+        #
+
+        return _return
+    #
+
+    def _get_zero_copy_file(self):
+        """
+Returns the implementing file object if it can be used with "sendfile()".
+
+:return: (object) File object; None if not supported
+:since:  v1.0.0
+        """
+
+        # pylint: disable=broad-except
+
+        _return = None
+
+        if (hasattr(os, "sendfile") and self._wrapped_resource is not None):
+            try:
+                implementing_file = self._get_implementing_file()
+                if (S_ISREG(os.fstat(implementing_file.fileno()).st_mode)): _return = implementing_file
+            except Exception: pass
+        #
+
+        return _return
+    #
+
     def is_url_supported(self, url):
         """
 Returns true if the streamer is able to return data for the given URL.
@@ -129,7 +471,17 @@ Returns true if the streamer is able to return data for the given URL.
 :since:  v1.0.0
         """
 
-        return Implementation.load_vfs_url(url).is_valid
+        vfs_object = StreamerRegistry.load_vfs_url(url)
+        _return = vfs_object.is_valid
+
+        StreamerRegistry.set_url_validity(url, _return)
+
+        if (_return):
+            if (self._supported_vfs_object is not None): self._get_supported_vfs_object(None)
+            self._supported_vfs_object = ( url, vfs_object )
+        else: vfs_object.close()
+
+        return _return
     #
 
     def open_url(self, url):
@@ -144,11 +496,32 @@ Opens a streamer session for the given URL.
 
         _return = False
 
-        vfs_object = Implementation.load_vfs_url(url, True)
+        vfs_object = (None if (self._supported_vfs_object is None) else self._get_supported_vfs_object(url))
+        if (vfs_object is None): vfs_object = StreamerRegistry.load_vfs_url(url)
+
+        self._content_coding = None
 
         if (vfs_object.is_valid):
-            self._wrapped_resource = vfs_object
-            self.supported_features['seeking'] = vfs_object.is_supported("seek")
+            precompressed_vfs_object = self._get_precompressed_vfs_object(url, vfs_object)
+
+            if (precompressed_vfs_object is not None):
+                vfs_object.close()
+                self._content_coding, vfs_object = precompressed_vfs_object
+            #
+
+            self._wrapped_resource = self._get_memory_mapped_file(vfs_object)
+            if (self._wrapped_resource is vfs_object): self._wrapped_resource = self._get_parallel_range_reader(vfs_object)
+            if (self._wrapped_resource is vfs_object): self._wrapped_resource = self._get_positional_file(vfs_object)
+
+            if (self._io_chunk_size_policy is not None):
+                self._io_chunk_size = self._io_chunk_size_policy.init(vfs_object.size, url.split(":", 1)[0])
+            #
+
+            if (self._read_ahead_chunks > 0 and self._wrapped_resource is vfs_object):
+                self._wrapped_resource = ReadAheadBuffer(vfs_object, self._read_ahead_chunks, self.io_chunk_size)
+            #
+
+            self.supported_features['seeking'] = self._wrapped_resource.is_supported("seek")
 
             _return = True
         #
@@ -167,29 +540,113 @@ python.org: Read up to n bytes from the object and return them.
 :since:  v1.0.0
         """
 
+        if (self._metrics is not None): read_started = perf_counter()
+
         _return = None
 
         if (n is None): n = self.io_chunk_size
 
         if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
+        elif (self._is_single_owner): _return = self._read(n)
         elif (self.stream_size != 0 and (not self._wrapped_resource.is_eof)):
             with self._lock:
                 # Thread safety
-                is_size_limited = (self.stream_size > 0)
+                if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
+                elif (not self._wrapped_resource.is_eof): _return = self._read(n)
+            #
+        #
+
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
+        return _return
+    #
+
+    def _read(self, n):
+        """
+Reads up to n bytes while respecting the requested stream size. An empty
+read is handled as EOF. The lock must be held while calling this method.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+
+:return: (bytes) Data; None if EOF
+:since:  v1.0.0
+        """
 
+        _return = None
+        n = (n if (self.stream_size < 0) else self._get_size_to_read(n))
+
+        if (n > 0):
+            if (self._io_chunk_size_policy is not None): read_started = perf_counter()
+
+            _return = self._wrapped_resource.read(n)
+            size = (0 if (_return is None) else len(_return))
+
+            if (self._io_chunk_size_policy is not None):
+                self._io_chunk_size = self._io_chunk_size_policy.record_read(n, size, perf_counter() - read_started)
+            #
+
+            # Give back bytes of a short read to the requested stream size
+            if (size < n and self.stream_size > -1): self.stream_size += n - size
+            if (size < 1): _return = None
+        elif (n == 0):
+            _return = self._wrapped_resource.read()
+            if (_return is not None and len(_return) < 1): _return = None
+        #
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.0.0
+        """
+
+        if (self._metrics is not None or self._io_chunk_size_policy is not None): read_started = perf_counter()
+
+        _return = 0
+
+        if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
+        elif (self.stream_size != 0 and (not self._wrapped_resource.is_eof)):
+            with self._lock:
+                # Thread safety
                 if (self._wrapped_resource is None): raise IOException("Streamer resource is invalid")
-                elif ((self.stream_size < 0 or is_size_limited) and (not self._wrapped_resource.is_eof)):
-                    if (is_size_limited):
-                        if (n < 1): self.stream_size = 0
-                        elif (n > self.stream_size): n = self.stream_size
-                        else: self.stream_size -= n
-                    #
+                elif (not self._wrapped_resource.is_eof):
+                    view = memoryview(b)
+                    n = self._get_size_to_read(len(view))
+
+                    if (n > 0):
+                        implementing_file = self._get_implementing_file()
+
+                        if (hasattr(implementing_file, "readinto")): _return = implementing_file.readinto(view[:n])
+                        else:
+                            data = self._wrapped_resource.read(n)
+
+                            if (data is not None):
+                                _return = len(data)
+                                view[:_return] = data
+                            #
+                        #
 
-                    _return = (self._wrapped_resource.read(n) if (n > 0) else self._wrapped_resource.read())
+                        if (_return is None): _return = 0
+
+                        if (self._io_chunk_size_policy is not None):
+                            self._io_chunk_size = self._io_chunk_size_policy.record_read(n, _return, perf_counter() - read_started)
+                        #
+
+                        # Give back bytes of a short read to the requested stream size
+                        if (self.stream_size > -1): self.stream_size += n - _return
+                    #
                 #
             #
         #
 
+        if (self._metrics is not None): self._record_metrics_read(_return, read_started)
         return _return
     #
 
@@ -210,6 +667,39 @@ python.org: Change the stream position to the given byte offset.
         #
     #
 
+    def set_range(self, range_start, range_end):
+        """
+Define a range to be streamed.
+
+:param range_start: First byte of range
+:param range_end: Last byte of range
+
+:return: (bool) True if valid
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            _return = Abstract.set_range(self, range_start, range_end)
+
+            if (_return and isinstance(self._wrapped_resource, ( ParallelRangeReader, ReadAheadBuffer ))):
+                self._wrapped_resource.set_limit(1 + range_end)
+            #
+        #
+
+        return _return
+    #
+
+    def _supports_zero_copy_transfer(self):
+        """
+Returns true if data can be transferred without copying it to userspace.
+
+:return: (bool) True if supported
+:since:  v1.0.0
+        """
+
+        return (self._get_zero_copy_file() is not None)
+    #
+
     def tell(self):
         """
 python.org: Return the current stream position as an opaque number.
@@ -223,4 +713,38 @@ python.org: Return the current stream position as an opaque number.
             return self._wrapped_resource.tell()
         #
     #
+
+    def transfer_to(self, target):
+        """
+Transfers the remaining data of the stream to the given target. Zero-copy
+implementations are used if "zero_copy_transfer" is supported.
+
+:param target: Socket, file-like object or file descriptor
+
+:return: (int) Bytes transferred
+:since:  v1.0.0
+        """
+
+        with self._lock:
+            zero_copy_file = (None if (self._get_fileno(target) is None) else self._get_zero_copy_file())
+
+            if (zero_copy_file is None): _return = Abstract.transfer_to(self, target)
+            else:
+                _return = 0
+                offset = zero_copy_file.tell()
+
+                count = (self.stream_size
+                         if (self.stream_size > -1) else
+                         self._wrapped_resource.size - offset
+                        )
+
+                if (count > 0):
+                    _return = self._send_file(zero_copy_file, target, offset, count)
+                    if (self.stream_size > -1): self.stream_size -= _return
+                #
+            #
+        #
+
+        return _return
+    #
 #
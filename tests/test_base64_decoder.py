@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_base64_decoder.py
+"""
+
+from base64 import encodebytes
+import os
+import unittest
+
+from pas_streamer import Base64Decoder, Memory
+
+class TestBase64Decoder(unittest.TestCase):
+    """
+Tests for "Base64Decoder".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_read_bounded(self):
+        """
+Tests that a huge read size does not decode more than the IO chunk size
+per call.
+
+:since: v1.0.0
+        """
+
+        data = os.urandom(1048576)
+
+        streamer = Memory()
+        streamer.data = encodebytes(data)
+        streamer.io_chunk_size = 4096
+
+        decoder = Base64Decoder(streamer)
+        decoded_data = bytearray()
+
+        while (True):
+            chunk = decoder.read(1 << 30)
+            if (chunk is None): break
+
+            self.assertLessEqual(len(chunk), 4096)
+            self.assertLessEqual(len(decoder._decoded_data), 4096)
+
+            decoded_data += chunk
+        #
+
+        self.assertEqual(bytes(decoded_data), data)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
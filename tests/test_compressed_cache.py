@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_compressed_cache.py
+"""
+
+from gzip import decompress
+from tempfile import mkdtemp
+from threading import Barrier, Thread
+from time import sleep
+from unittest import mock
+import os
+import shutil
+import unittest
+
+from pas_streamer import CompressedCache, StreamerRegistry
+
+class TestCompressedCache(unittest.TestCase):
+    """
+Tests for "CompressedCache".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the files cached.
+
+:since: v1.0.0
+        """
+
+        StreamerRegistry.clear()
+
+        self.directory_path = mkdtemp()
+        self.urls = { }
+
+        for name in ( "a", "b", "c" ):
+            file_path_name = os.path.join(self.directory_path, name)
+            with open(file_path_name, "wb") as file_object: file_object.write(os.urandom(100))
+
+            self.urls[name] = "file:///{0}".format(file_path_name)
+        #
+    #
+
+    def tearDown(self):
+        """
+Removes the files cached.
+
+:since: v1.0.0
+        """
+
+        shutil.rmtree(self.directory_path)
+    #
+
+    def test_eviction_order(self):
+        """
+Tests that the least recently used bodies are evicted and that the byte
+budget is accounted for.
+
+:since: v1.0.0
+        """
+
+        cache = CompressedCache(250)
+
+        with mock.patch.object(CompressedCache, "_compress", side_effect = lambda url, content_coding, level: url[-1].encode() * 100):
+            cache.get_body(self.urls['a'], "gzip")
+            cache.get_body(self.urls['b'], "gzip")
+            cache.get_body(self.urls['a'], "gzip")
+            cache.get_body(self.urls['c'], "gzip")
+
+            self.assertEqual(( cache.hits, cache.misses, cache.evictions ), ( 1, 3, 1 ))
+            self.assertEqual(( len(cache), cache.size ), ( 2, 200 ))
+            self.assertEqual([ key[0] for key in cache._entries ], [ self.urls['a'], self.urls['c'] ])
+
+            cache.get_body(self.urls['b'], "gzip")
+
+            self.assertEqual(( cache.misses, cache.evictions ), ( 4, 2 ))
+            self.assertEqual([ key[0] for key in cache._entries ], [ self.urls['c'], self.urls['b'] ])
+            self.assertEqual(cache.size, 200)
+
+            cache.clear()
+            self.assertEqual(( len(cache), cache.size ), ( 0, 0 ))
+        #
+    #
+
+    def test_invalid_url(self):
+        """
+Tests that invalid URLs and unknown schemes return None.
+
+:since: v1.0.0
+        """
+
+        cache = CompressedCache()
+
+        for url in ( "unknown:///file", "file:///{0}".format(os.path.join(self.directory_path, "missing")) ):
+            self.assertIsNone(cache.get_body(url, "gzip"))
+            self.assertIsNone(cache.get_streamer(url, "gzip"))
+        #
+    #
+
+    def test_oversized_file(self):
+        """
+Tests that files larger than the byte budget are compressed while being
+read instead of being cached.
+
+:since: v1.0.0
+        """
+
+        cache = CompressedCache(50)
+
+        with open(self.urls['a'][8:], "rb") as file_object: data = file_object.read()
+
+        self.assertIsNone(cache.get_body(self.urls['a'], "gzip"))
+
+        streamer = cache.get_streamer(self.urls['a'], "gzip")
+
+        try: self.assertEqual(decompress(streamer.read(0)), data)
+        finally: streamer.close()
+
+        self.assertEqual(( len(cache), cache.size ), ( 0, 0 ))
+    #
+
+    def test_single_flight(self):
+        """
+Tests that concurrent misses for the same entry compress it only once.
+
+:since: v1.0.0
+        """
+
+        threads_count = 50
+
+        barrier = Barrier(threads_count)
+        bodies = [ ]
+        cache = CompressedCache()
+
+        def _compress(url, content_coding, level):
+            sleep(0.2)
+            return b"compressed"
+        #
+
+        def _get_body():
+            barrier.wait()
+            bodies.append(cache.get_body(self.urls['a'], "gzip"))
+        #
+
+        with mock.patch.object(CompressedCache, "_compress", side_effect = _compress) as compress_mock:
+            threads = [ Thread(target = _get_body) for _ in range(threads_count) ]
+
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+
+            self.assertEqual(compress_mock.call_count, 1)
+        #
+
+        self.assertEqual(bodies, [ b"compressed" ] * threads_count)
+        self.assertEqual(( cache.hits, cache.misses ), ( threads_count - 1, 1 ))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
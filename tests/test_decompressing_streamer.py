@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_decompressing_streamer.py
+"""
+
+from gzip import compress
+from unittest import mock
+import os
+import unittest
+
+from pas_streamer import DecompressingStreamer, Memory
+
+class TestDecompressingStreamer(unittest.TestCase):
+    """
+Tests for "DecompressingStreamer".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def _read_all(self, compressed_data, io_chunk_size, n = None):
+        """
+Decompresses the given data read in chunks of the given size.
+
+:param compressed_data: Compressed data
+:param io_chunk_size: IO chunk size of the encapsulated streamer
+:param n: How many bytes to read per call
+
+:return: (bytes) Decompressed data
+:since:  v1.0.0
+        """
+
+        streamer = Memory()
+        streamer.data = compressed_data
+        streamer.io_chunk_size = io_chunk_size
+
+        decompressing_streamer = DecompressingStreamer(streamer)
+        _return = bytearray()
+
+        while (True):
+            data = decompressing_streamer.read(n)
+            if (data is None): break
+
+            _return += data
+        #
+
+        return bytes(_return)
+    #
+
+    def test_gzip_members_with_small_chunks(self):
+        """
+Tests that all members of a multi-member Gzip stream are decompressed if
+a member boundary splits the Gzip magic bytes.
+
+:since: v1.0.0
+        """
+
+        data = ((b"first member " * 462) + b"12345", (b"second member " * 428) + b"1234")
+        compressed_data = compress(data[0]) + compress(data[1])
+
+        for io_chunk_size in ( 1, 3, 7 ):
+            for n in ( None, 1, 4096 ):
+                self.assertEqual(self._read_all(compressed_data, io_chunk_size, n), data[0] + data[1])
+            #
+        #
+    #
+
+    def test_gzip_trailing_data_with_small_chunks(self):
+        """
+Tests that data following the last Gzip member is ignored.
+
+:since: v1.0.0
+        """
+
+        data = b"single member " * 428
+        compressed_data = compress(data)
+
+        for trailing_data in ( b"\x1f", b"\x00\x01trailing" ):
+            for io_chunk_size in ( 1, 3, 7 ):
+                self.assertEqual(self._read_all(compressed_data + trailing_data, io_chunk_size), data)
+            #
+        #
+    #
+
+    def test_gzip_seek_empty_input(self):
+        """
+Tests seeking in an empty Gzip stream.
+
+:since: v1.0.0
+        """
+
+        streamer = Memory()
+        streamer.data = compress(b"")
+
+        decompressing_streamer = DecompressingStreamer(streamer)
+
+        self.assertEqual(decompressing_streamer.seek(0), 0)
+        self.assertIsNone(decompressing_streamer.read())
+        self.assertEqual(decompressing_streamer.seek(10), 0)
+        self.assertIsNone(decompressing_streamer.read())
+    #
+
+    def test_gzip_seek_with_index(self):
+        """
+Tests seeking into the last checkpoint span, backwards to a checkpoint and
+across a checkpoint boundary of the index built while reading.
+
+:since: v1.0.0
+        """
+
+        data = os.urandom(2048) * 150
+        span = 65536
+
+        streamer = Memory()
+        streamer.data = compress(data)
+        streamer.io_chunk_size = 4096
+
+        with mock.patch("pas_streamer.gzip_index.Settings.get", side_effect = lambda key, default = None: (span if (key == "pas_streamer_gzip_index_span") else default)):
+            decompressing_streamer = DecompressingStreamer(streamer)
+
+            offset = len(data) - 100
+            self.assertEqual(decompressing_streamer.seek(offset), offset)
+            self.assertEqual(decompressing_streamer.read(4096), data[offset:])
+            self.assertIsNone(decompressing_streamer.read())
+        #
+
+        index = decompressing_streamer._index
+        self.assertEqual(len(index), len(data) // span)
+
+        offset = 2 * span + 10
+        checkpoint = index.get_checkpoint(offset)
+
+        self.assertEqual(checkpoint[0], 2 * span)
+        self.assertGreater(checkpoint[1], 0)
+
+        self.assertEqual(decompressing_streamer.seek(offset), offset)
+        self.assertEqual(decompressing_streamer.read(1000), data[offset:offset + 1000])
+
+        self.assertTrue(decompressing_streamer.set_range(span - 10, span + 9))
+        self.assertEqual(decompressing_streamer.read(), data[span - 10:span + 10])
+        self.assertIsNone(decompressing_streamer.read())
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
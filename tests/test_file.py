@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_file.py
+"""
+
+from tempfile import NamedTemporaryFile
+from threading import Thread
+import os
+import socket
+import unittest
+
+from pas_streamer import File
+
+class TestFile(unittest.TestCase):
+    """
+Tests for "File".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the file streamed.
+
+:since: v1.0.0
+        """
+
+        self.data = os.urandom(1048576 + 123)
+
+        with NamedTemporaryFile(delete = False) as file_object:
+            file_object.write(self.data)
+            self.file_path_name = file_object.name
+        #
+    #
+
+    def tearDown(self):
+        """
+Removes the file streamed.
+
+:since: v1.0.0
+        """
+
+        os.unlink(self.file_path_name)
+    #
+
+    def _transfer_to_non_blocking_socket(self, socket_class):
+        """
+Transfers the file to a non-blocking socket of the given class.
+
+:param socket_class: Socket class of the sending side
+
+:return: (tuple) Bytes transferred and data received
+:since:  v1.0.0
+        """
+
+        ( sender, receiver ) = socket.socketpair()
+        sender = socket_class(sender.family, sender.type, sender.proto, sender.detach())
+        sender.setblocking(False)
+
+        received = bytearray()
+
+        def _receive():
+            while (True):
+                data = receiver.recv(65536)
+                if (len(data) < 1): break
+
+                received.extend(data)
+            #
+        #
+
+        thread = Thread(target = _receive)
+        thread.start()
+
+        streamer = File()
+
+        try:
+            self.assertTrue(streamer.open_url("file:///{0}".format(self.file_path_name)))
+            _return = streamer.transfer_to(sender)
+        finally:
+            streamer.close()
+            sender.close()
+
+            thread.join()
+            receiver.close()
+        #
+
+        return ( _return, bytes(received) )
+    #
+
+    def test_transfer_to_non_blocking_socket(self):
+        """
+Tests zero-copy transfers to a non-blocking socket.
+
+:since: v1.0.0
+        """
+
+        self.assertEqual(self._transfer_to_non_blocking_socket(socket.socket), ( len(self.data), self.data ))
+    #
+
+    def test_transfer_to_non_blocking_socket_subclass(self):
+        """
+Tests the copying fallback for non-blocking sockets not supported by the
+zero-copy implementation.
+
+:since: v1.0.0
+        """
+
+        class _Socket(socket.socket): pass
+        self.assertEqual(self._transfer_to_non_blocking_socket(_Socket), ( len(self.data), self.data ))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
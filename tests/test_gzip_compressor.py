@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_gzip_compressor.py
+"""
+
+from gzip import decompress
+from struct import unpack_from
+import os
+import unittest
+
+from pas_streamer import DecompressingStreamer, GzipCompressor, GzipIndex, Memory
+
+class TestGzipCompressor(unittest.TestCase):
+    """
+Tests for "GzipCompressor".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    BLOCK_SIZE = 65536
+    """
+Size of an uncompressed block compressed in parallel
+    """
+
+    def setUp(self):
+        """
+Creates the data compressed.
+
+:since: v1.0.0
+        """
+
+        self.data = os.urandom(4096) * 100
+    #
+
+    def _compress(self, data, workers, chunk_size = None):
+        """
+Compresses the given data.
+
+:param data: Uncompressed data
+:param workers: Number of threads compressing blocks in parallel
+:param chunk_size: Size of the chunks given to "compress()"; None for all
+                   data at once
+
+:return: (bytes) Compressed data
+:since:  v1.0.0
+        """
+
+        compressor = GzipCompressor(workers = workers, block_size = TestGzipCompressor.BLOCK_SIZE)
+        if (chunk_size is None): chunk_size = max(1, len(data))
+
+        _return = bytearray()
+
+        for position in range(0, len(data), chunk_size): _return += compressor.compress(data[position:position + chunk_size])
+        _return += compressor.flush()
+
+        self.assertTrue(compressor.is_closed)
+
+        return bytes(_return)
+    #
+
+    def test_bgzf_blocks(self):
+        """
+Tests that BGZF output is valid multi-member Gzip data and that the block
+offset table lists the start of each block after the first one.
+
+:since: v1.0.0
+        """
+
+        block_size = GzipCompressor.BGZF_BLOCK_SIZE
+
+        for size in ( 0, 1, block_size, 2 * block_size, 2 * block_size + 1 ):
+            data = self.data[:size]
+
+            compressor = GzipCompressor(workers = 2, bgzf = True)
+            compressed_data = compressor.compress(data) + compressor.flush()
+
+            self.assertEqual(decompress(compressed_data), data)
+            self.assertTrue(compressed_data.endswith(GzipCompressor.BINARY_BGZF_EOF))
+
+            block_offsets = [ ]
+            compressed_offset = 0
+            uncompressed_offset = 0
+
+            while (compressed_offset < len(compressed_data) - len(GzipCompressor.BINARY_BGZF_EOF)):
+                block_offsets.append(( compressed_offset, uncompressed_offset ))
+
+                compressed_offset += 1 + unpack_from("<H", compressed_data, compressed_offset + 16)[0]
+                uncompressed_offset += unpack_from("<I", compressed_data, compressed_offset - 4)[0]
+            #
+
+            self.assertEqual(len(block_offsets), (size + block_size - 1) // block_size)
+
+            index_data = compressor.get_bgzf_index()
+            self.assertEqual(unpack_from("<Q", index_data)[0], max(0, len(block_offsets) - 1))
+
+            self.assertEqual([ unpack_from("<2Q", index_data, position) for position in range(8, len(index_data), 16) ],
+                             block_offsets[1:]
+                            )
+        #
+    #
+
+    def test_bgzf_index_seek(self):
+        """
+Tests seeking into the last BGZF block with an index loaded from the block
+offset table.
+
+:since: v1.0.0
+        """
+
+        compressor = GzipCompressor(workers = 2, bgzf = True)
+        compressed_data = bytearray()
+
+        for position in range(0, len(self.data), 50000): compressed_data += compressor.compress(self.data[position:position + 50000])
+        compressed_data += compressor.flush()
+
+        index = GzipIndex.load_bgzf_index(compressor.get_bgzf_index(), len(compressed_data))
+        GzipIndex.set_cached("test_bgzf_index_seek", index)
+
+        streamer = Memory()
+        streamer.data = bytes(compressed_data)
+
+        decompressing_streamer = DecompressingStreamer(streamer, "gzip", "test_bgzf_index_seek")
+
+        offset = len(self.data) - 100
+        checkpoint = index.get_checkpoint(offset)
+
+        self.assertEqual(checkpoint[0], (len(self.data) // GzipCompressor.BGZF_BLOCK_SIZE) * GzipCompressor.BGZF_BLOCK_SIZE)
+
+        self.assertEqual(decompressing_streamer.seek(offset), offset)
+        self.assertEqual(decompressing_streamer.read(4096), self.data[offset:])
+        self.assertIsNone(decompressing_streamer.read())
+
+        self.assertEqual(decompressing_streamer.seek(10), 10)
+        self.assertEqual(decompressing_streamer.read(100), self.data[10:110])
+    #
+
+    def test_parallel_block_boundaries(self):
+        """
+Tests that data ending at, before and after a block boundary is compressed
+in parallel to a valid Gzip stream.
+
+:since: v1.0.0
+        """
+
+        block_size = TestGzipCompressor.BLOCK_SIZE
+
+        for size in ( 1, block_size - 1, block_size, block_size + 1, 2 * block_size, len(self.data) ):
+            self.assertEqual(decompress(self._compress(self.data[:size], 3)), self.data[:size])
+        #
+    #
+
+    def test_parallel_chunked_input(self):
+        """
+Tests that data given in chunks not aligned to blocks is compressed in
+parallel to a valid Gzip stream.
+
+:since: v1.0.0
+        """
+
+        for chunk_size in ( 1000, 65537, 150000 ):
+            self.assertEqual(decompress(self._compress(self.data, 4, chunk_size)), self.data)
+        #
+    #
+
+    def test_parallel_empty_input(self):
+        """
+Tests that empty input compressed in parallel results in a valid Gzip
+stream.
+
+:since: v1.0.0
+        """
+
+        for workers in ( 1, 3 ):
+            self.assertEqual(decompress(self._compress(b"", workers)), b"")
+        #
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_ranges.py
+"""
+
+from tempfile import NamedTemporaryFile
+from unittest import mock
+import os
+import unittest
+
+from dpt_runtime.io_exception import IOException
+
+from pas_streamer import Memory, VfsBased
+
+class TestRanges(unittest.TestCase):
+    """
+Tests for "set_ranges()" and "iter_ranges()".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the data streamed.
+
+:since: v1.0.0
+        """
+
+        self.data = os.urandom(10000)
+    #
+
+    def _get_memory_streamer(self):
+        """
+Returns a memory streamer for the data streamed.
+
+:return: (object) Memory streamer
+:since:  v1.0.0
+        """
+
+        _return = Memory()
+        _return.data = self.data
+
+        return _return
+    #
+
+    def test_coalescing_gap(self):
+        """
+Tests that ranges separated by less than the coalescing gap are read
+together and others are not.
+
+:since: v1.0.0
+        """
+
+        streamer = self._get_memory_streamer()
+
+        with mock.patch("pas_streamer.abstract.Settings.get", side_effect = lambda key, default = None: (10 if (key == "pas_streamer_range_coalescing_gap") else default)):
+            self.assertTrue(streamer.set_ranges([ ( 0, 99 ), ( 110, 199 ), ( 211, 299 ), ( 250, 260 ) ]))
+        #
+
+        self.assertEqual(self._read_ranges(streamer),
+                         [ ( 0, 199, self.data[:200] ), ( 211, 299, self.data[211:300] ) ]
+                        )
+    #
+
+    def test_eof_after_last_range(self):
+        """
+Tests that EOF is reported after the data of the last range has been
+read.
+
+:since: v1.0.0
+        """
+
+        with NamedTemporaryFile(delete = False) as file_object:
+            file_object.write(self.data)
+            file_path_name = file_object.name
+        #
+
+        try:
+            for streamer in ( self._get_memory_streamer(), VfsBased() ):
+                try:
+                    if (isinstance(streamer, VfsBased)): self.assertTrue(streamer.open_url("file:///{0}".format(file_path_name)))
+
+                    self.assertTrue(streamer.set_ranges([ ( 100, 199 ), ( 5000, 5099 ) ]))
+
+                    for _, _, data in streamer.iter_ranges():
+                        self.assertFalse(streamer.is_eof)
+                        for _ in data: pass
+                    #
+
+                    self.assertIsNone(streamer.read())
+                    self.assertTrue(streamer.is_eof)
+                finally: streamer.close()
+            #
+        finally: os.unlink(file_path_name)
+    #
+
+    def test_invalid_ranges(self):
+        """
+Tests that invalid ranges are rejected.
+
+:since: v1.0.0
+        """
+
+        streamer = self._get_memory_streamer()
+
+        self.assertFalse(streamer.set_ranges([ ]))
+        self.assertFalse(streamer.set_ranges([ ( -1, 10 ) ]))
+        self.assertFalse(streamer.set_ranges([ ( 0, 10 ), ( 20, 19 ) ]))
+        self.assertFalse(streamer.set_ranges([ ( len(self.data), len(self.data) + 10 ) ]))
+
+        self.assertRaises(IOException, lambda: list(streamer.iter_ranges()))
+    #
+
+    def test_sorting(self):
+        """
+Tests that ranges are sorted and overlapping ones are coalesced.
+
+:since: v1.0.0
+        """
+
+        streamer = self._get_memory_streamer()
+
+        self.assertTrue(streamer.set_ranges([ ( 8000, 8999 ), ( 1000, 1999 ), ( 1500, 2500 ), ( 4000, 4099 ) ]))
+
+        self.assertEqual(self._read_ranges(streamer),
+                         [ ( 1000, 2500, self.data[1000:2501] ),
+                           ( 4000, 4099, self.data[4000:4100] ),
+                           ( 8000, 8999, self.data[8000:9000] )
+                         ]
+                        )
+    #
+
+    def test_truncation(self):
+        """
+Tests that ranges exceeding the size are truncated.
+
+:since: v1.0.0
+        """
+
+        size = len(self.data)
+        streamer = self._get_memory_streamer()
+
+        self.assertTrue(streamer.set_ranges([ ( size - 100, size + 1000 ), ( size + 10, size + 20 ) ]))
+        self.assertEqual(self._read_ranges(streamer), [ ( size - 100, size - 1, self.data[-100:] ) ])
+    #
+
+    @staticmethod
+    def _read_ranges(streamer):
+        """
+Reads all ranges defined.
+
+:param streamer: Streamer instance
+
+:return: (list) List of "(range_start, range_end, data)" tuples
+:since:  v1.0.0
+        """
+
+        return [ ( range_start, range_end, b"".join(data) ) for range_start, range_end, data in streamer.iter_ranges() ]
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_streamer_pool.py
+"""
+
+from io import BytesIO
+from threading import Barrier, Thread
+import unittest
+
+from pas_streamer import FileLike, Memory, Metrics, MetricsLock, StreamerPool, VfsBased
+
+class TestStreamerPool(unittest.TestCase):
+    """
+Tests for "StreamerPool".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_close_at_eof_keeps_streamer(self):
+        """
+Tests that streamers closed implicitly at EOF are not handed out again.
+
+:since: v1.0.0
+        """
+
+        pool = StreamerPool(Memory)
+
+        streamer = pool.get()
+        streamer.data = b"data"
+
+        self.assertEqual(b"".join(bytes(data) for data in streamer), b"data")
+        self.assertIsNot(pool.get(), streamer)
+
+        pool.put(streamer)
+        self.assertRaises(Exception, pool.put, streamer)
+
+        self.assertIs(pool.get(), streamer)
+    #
+
+    def test_concurrent_put(self):
+        """
+Tests that concurrent returns do not exceed the maximum number of idle
+streamers.
+
+:since: v1.0.0
+        """
+
+        threads_count = 20
+        pool = StreamerPool(Memory, 5)
+
+        barrier = Barrier(threads_count)
+        streamers = [ pool.get() for _ in range(threads_count) ]
+
+        def _put(streamer):
+            barrier.wait()
+            pool.put(streamer)
+        #
+
+        threads = [ Thread(target = _put, args = ( streamer, )) for streamer in streamers ]
+
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+
+        self.assertEqual(( pool.size, pool.discarded ), ( 5, threads_count - 5 ))
+    #
+
+    def test_reset_file_like(self):
+        """
+Tests that a reused "FileLike" streamer has no size and seeking support
+left.
+
+:since: v1.0.0
+        """
+
+        pool = StreamerPool(FileLike)
+
+        streamer = pool.get()
+        streamer.file = BytesIO(b"abc")
+        streamer.size = 3
+
+        self.assertTrue(streamer.is_supported("seeking"))
+        pool.put(streamer)
+
+        streamer = pool.get()
+
+        self.assertIsNone(streamer._size)
+        self.assertFalse(streamer.is_supported("seeking"))
+    #
+
+    def test_reset_metrics_lock(self):
+        """
+Tests that the thread safety lock replaced while metrics were enabled is
+restored.
+
+:since: v1.0.0
+        """
+
+        pool = StreamerPool(Memory)
+
+        streamer = pool.get()
+        lock = streamer._lock
+
+        streamer.metrics = Metrics()
+        self.assertIsInstance(streamer._lock, MetricsLock)
+
+        pool.put(streamer)
+        streamer = pool.get()
+
+        self.assertIsNone(streamer.metrics)
+        self.assertIs(streamer._lock, lock)
+    #
+
+    def test_reset_vfs_based(self):
+        """
+Tests that a reused "VfsBased" streamer has the settings of a new one.
+
+:since: v1.0.0
+        """
+
+        pool = StreamerPool(VfsBased)
+
+        streamer = pool.get()
+        defaults = ( streamer.read_ahead_chunks, streamer.parallel_read_workers, streamer.io_chunk_size )
+
+        streamer.accepted_content_codings = [ "gzip" ]
+        streamer.io_chunk_size = 1024
+        streamer.parallel_read_workers = 4
+        streamer.read_ahead_chunks = 3
+        streamer.stream_size = 5
+
+        pool.put(streamer)
+        streamer = pool.get()
+
+        self.assertEqual(streamer.accepted_content_codings, set())
+        self.assertIsNone(streamer.content_coding)
+        self.assertEqual(( streamer.read_ahead_chunks, streamer.parallel_read_workers, streamer.io_chunk_size ), defaults)
+        self.assertEqual(streamer.stream_size, -1)
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_streamer_registry.py
+"""
+
+from threading import Barrier, Thread
+from unittest import mock
+import unittest
+
+from dpt_runtime.io_exception import IOException
+from dpt_vfs import Implementation
+
+from pas_streamer import StreamerRegistry
+
+class TestStreamerRegistry(unittest.TestCase):
+    """
+Tests for "StreamerRegistry".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Clears the registry caches.
+
+:since: v1.0.0
+        """
+
+        StreamerRegistry.clear()
+    #
+
+    def tearDown(self):
+        """
+Clears the registry caches.
+
+:since: v1.0.0
+        """
+
+        StreamerRegistry.clear()
+    #
+
+    def test_concurrent_first_lookup(self):
+        """
+Tests that concurrent first lookups of a VFS class all succeed.
+
+:since: v1.0.0
+        """
+
+        threads_count = 50
+
+        barrier = Barrier(threads_count)
+        vfs_classes = [ ]
+
+        def _lookup():
+            barrier.wait()
+            vfs_classes.append(StreamerRegistry.get_vfs_class("file"))
+        #
+
+        threads = [ Thread(target = _lookup) for _ in range(threads_count) ]
+
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+
+        self.assertEqual(len(vfs_classes), threads_count)
+        self.assertNotIn(None, vfs_classes)
+    #
+
+    def test_failed_lookup_not_cached(self):
+        """
+Tests that a failed lookup is retried instead of being cached.
+
+:since: v1.0.0
+        """
+
+        vfs_class = Implementation.get_class("file")
+
+        with mock.patch.object(Implementation, "get_class", side_effect = [ IOException("Transient failure"), vfs_class ]):
+            self.assertIsNone(StreamerRegistry.get_vfs_class("file"))
+            self.assertIs(StreamerRegistry.get_vfs_class("file"), vfs_class)
+            self.assertIs(StreamerRegistry.get_vfs_class("file"), vfs_class)
+        #
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
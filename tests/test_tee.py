@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_tee.py
+"""
+
+from hashlib import sha256
+from threading import Thread
+from time import sleep
+from unittest import mock
+import os
+import unittest
+
+from dpt_runtime.io_exception import IOException
+
+from pas_streamer import Memory, Tee
+
+class TestTee(unittest.TestCase):
+    """
+Tests for "Tee" and "TeeBranch".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the data teed.
+
+:since: v1.0.0
+        """
+
+        self.data = os.urandom(262144 + 123)
+    #
+
+    def _get_tee(self, buffer_size):
+        """
+Returns a tee of an in-memory streamer read in chunks of 4 KiB.
+
+:param buffer_size: Maximum number of bytes buffered
+
+:return: (object) Tee instance
+:since:  v1.0.0
+        """
+
+        streamer = Memory()
+        streamer.data = self.data
+        streamer.io_chunk_size = 4096
+
+        return Tee(streamer, buffer_size)
+    #
+
+    def test_backpressure(self):
+        """
+Tests that all consumers receive all data while a slow branch limits the
+data buffered.
+
+:since: v1.0.0
+        """
+
+        tee = self._get_tee(16384)
+
+        branches = ( tee.create_branch(), tee.create_branch() )
+        callback_hash = sha256()
+        callback_data = [ ]
+        buffered_sizes = [ ]
+        results = { }
+
+        def _callback(data):
+            if (data is None): callback_data.append(None)
+            else: callback_hash.update(data)
+        #
+
+        def _read(index, n, delay):
+            data = bytearray()
+
+            while (True):
+                chunk = branches[index].read(n)
+                if (chunk is None): break
+
+                data += chunk
+                buffered_sizes.append(tee._buffered_size)
+
+                if (delay > 0): sleep(delay)
+            #
+
+            branches[index].close()
+            results[index] = bytes(data)
+        #
+
+        tee.add_callback(_callback)
+
+        threads = [ Thread(target = _read, args = ( 0, 1000, 0.001 )), Thread(target = _read, args = ( 1, None, 0 )) ]
+        for thread in threads: thread.start()
+
+        data = bytearray()
+
+        while (True):
+            chunk = tee.read(3000)
+            if (chunk is None): break
+
+            data += chunk
+        #
+
+        tee.close()
+        for thread in threads: thread.join()
+
+        self.assertEqual(bytes(data), self.data)
+        self.assertEqual(results, { 0: self.data, 1: self.data })
+        self.assertEqual(callback_hash.digest(), sha256(self.data).digest())
+        self.assertEqual(callback_data, [ None ])
+
+        # At most one chunk is read ahead of the buffer size
+        self.assertLessEqual(max(buffered_sizes), 16384 + 4096)
+        self.assertEqual(tee._buffered_size, 0)
+    #
+
+    def test_partial_chunk_tails(self):
+        """
+Tests that consumers reading partial chunks in an alternating order
+receive all data while released chunks are trimmed.
+
+:since: v1.0.0
+        """
+
+        tee = self._get_tee(len(self.data))
+        branch = tee.create_branch()
+
+        data = ( bytearray(), bytearray() )
+
+        while (True):
+            chunks = ( tee.read(1500), branch.read(2500) )
+            if (chunks[0] is None and chunks[1] is None): break
+
+            for index, chunk in enumerate(chunks):
+                if (chunk is not None): data[index].extend(chunk)
+            #
+
+            # Only chunks not yet read completely by the slower consumer are buffered
+            self.assertLessEqual(tee._buffered_size, len(data[1]) - len(data[0]) + 2 * 4096)
+        #
+
+        self.assertEqual(( bytes(data[0]), bytes(data[1]) ), ( self.data, self.data ))
+        self.assertEqual(tee._buffered_size, 0)
+
+        branch.close()
+        tee.close()
+    #
+
+    def test_timeout(self):
+        """
+Tests that a consumer waiting for a consumer never read times out.
+
+:since: v1.0.0
+        """
+
+        with mock.patch("pas_streamer.tee.Settings.get", side_effect = lambda key, default = None: (0.1 if (key == "pas_streamer_tee_timeout") else default)):
+            tee = self._get_tee(8192)
+        #
+
+        branch = tee.create_branch()
+
+        with self.assertRaises(IOException):
+            while (tee.read(4096) is not None): pass
+        #
+
+        self.assertLessEqual(tee._buffered_size, 8192 + 4096)
+        self.assertEqual(bytes(branch.read(4096)), self.data[:4096])
+
+        branch.close()
+        tee.close()
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()
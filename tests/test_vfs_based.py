@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct PAS
+Python Application Services
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?pas;streamer
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+tests/test_vfs_based.py
+"""
+
+from tempfile import NamedTemporaryFile
+import os
+import unittest
+
+from pas_streamer import Metrics, ParallelRangeReader, ReadAheadBuffer, VfsBased
+
+class TestVfsBased(unittest.TestCase):
+    """
+Tests for "VfsBased".
+
+:author:     direct Netware Group et al.
+:copyright:  (C) direct Netware Group - All rights reserved
+:package:    pas
+:subpackage: streamer
+:since:      v1.0.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the file streamed.
+
+:since: v1.0.0
+        """
+
+        self.data = os.urandom(1048576 + 123)
+
+        with NamedTemporaryFile(delete = False) as file_object:
+            file_object.write(self.data)
+            self.file_path_name = file_object.name
+        #
+
+        self.url = "file:///{0}".format(self.file_path_name)
+    #
+
+    def tearDown(self):
+        """
+Removes the file streamed.
+
+:since: v1.0.0
+        """
+
+        os.unlink(self.file_path_name)
+    #
+
+    def _read_all(self, streamer, n):
+        """
+Reads the given streamer until EOF while checking the type of the data
+returned.
+
+:param streamer: Streamer instance
+:param n: How many bytes to read per call
+
+:return: (bytes) Data read
+:since:  v1.0.0
+        """
+
+        _return = bytearray()
+
+        while (True):
+            data = streamer.read(n)
+            if (data is None): break
+
+            self.assertIs(type(data), bytes)
+            _return += data
+        #
+
+        return bytes(_return)
+    #
+
+    def test_parallel_read(self):
+        """
+Tests that parallel segment reads return the same bytes as direct reads
+for the whole file and for a range.
+
+:since: v1.0.0
+        """
+
+        for n in ( 1000, 65536, 262144 ):
+            streamer = VfsBased()
+            streamer.parallel_read_workers = 3
+
+            try:
+                self.assertTrue(streamer.open_url(self.url))
+                self.assertIsInstance(streamer._wrapped_resource, ParallelRangeReader)
+
+                streamer._wrapped_resource._segment_size = 100000
+                self.assertEqual(self._read_all(streamer, n), self.data)
+
+                self.assertTrue(streamer.set_range(12345, 654321))
+                self.assertEqual(self._read_all(streamer, n), self.data[12345:654322])
+            finally: streamer.close()
+        #
+    #
+
+    def test_read_ahead(self):
+        """
+Tests that read-ahead returns the same bytes as direct reads.
+
+:since: v1.0.0
+        """
+
+        for n in ( 1000, 65536, 262144 ):
+            streamer = VfsBased()
+            streamer.read_ahead_chunks = 2
+
+            try:
+                self.assertTrue(streamer.open_url(self.url))
+                self.assertIsInstance(streamer._wrapped_resource, ReadAheadBuffer)
+
+                self.assertEqual(self._read_all(streamer, n), self.data)
+            finally: streamer.close()
+        #
+    #
+
+    def test_readinto_metrics(self):
+        """
+Tests that "readinto()" records reads with the metrics sink as "read()"
+does.
+
+:since: v1.0.0
+        """
+
+        metrics = Metrics()
+
+        streamer = VfsBased()
+        streamer.metrics = metrics
+
+        try:
+            self.assertTrue(streamer.open_url(self.url))
+
+            buffer = bytearray(65536)
+            data = bytearray()
+            read_count = 0
+
+            while (True):
+                size = streamer.readinto(buffer)
+                read_count += 1
+
+                if (size < 1): break
+                data += buffer[:size]
+            #
+
+            self.assertEqual(bytes(data), self.data)
+        finally: streamer.close()
+
+        layer_data = metrics.get("VfsBased")
+
+        self.assertIsNotNone(layer_data)
+        self.assertEqual(layer_data['read_count'], read_count)
+        self.assertEqual(layer_data['bytes_out'], len(self.data))
+    #
+#
+
+if (__name__ == "__main__"): unittest.main()